@@ -0,0 +1,72 @@
+"""
+Compares the nested from_stix mapping lookups with the compiled field index, alone and through the
+unmapped attribute stripper.
+
+Usage (from the repository root):
+    python -m benchmarks.field_mapping [--module qradar] [--dialect events] [--sizes 100 1000 10000] [--repeat 3]
+"""
+import argparse
+import timeit
+from stix_shifter.stix_translation.stix_translation import StixTranslation
+from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import Pattern, ObservationExpression, \
+    ComparisonExpression, ComparisonComparators, ComparisonExpressionOperators
+from stix_shifter_utils.stix_translation.src.patterns.traversal import combine
+from stix_shifter_utils.stix_translation.src.utils.unmapped_attribute_stripper import strip_unmapped_attributes
+
+
+class NestedMapping:
+    """ map_field as it was before the field index: nested lookups in the raw from_stix mapping """
+
+    def __init__(self, map_data):
+        self.map_data = map_data
+
+    def map_field(self, stix_object_name, stix_property_name):
+        if stix_object_name in self.map_data and stix_property_name in self.map_data[stix_object_name]["fields"]:
+            return self.map_data[stix_object_name]["fields"][stix_property_name]
+        else:
+            return []
+
+
+def object_paths(query_translator, size):
+    paths = sorted(query_translator.field_index) + ['unmapped-object:value']
+    return [paths[i % len(paths)] for i in range(size)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default='qradar')
+    parser.add_argument('--dialect', default='events')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    _, entry_point = StixTranslation()._get_entry_point(args.module, 'query', [args.dialect], {})
+    query_translator = entry_point.get_query_translator(args.dialect)
+    nested = NestedMapping(query_translator.map_data)
+
+    print("{:>12} {:>10} {:>14} {:>14} {:>10}".format('comparisons', 'step', 'nested (ms)', 'index (ms)', 'speedup'))
+    for size in args.sizes:
+        paths = object_paths(query_translator, size)
+        split_paths = [path.split(':') for path in paths]
+        lookups = {
+            'nested': lambda: [nested.map_field(*path) for path in split_paths],
+            'index': lambda: [query_translator.map_object_path(path) for path in paths],
+        }
+        # built directly, some mapped object paths would need quoting in a pattern
+        pattern = Pattern(ObservationExpression(combine(
+            [ComparisonExpression(path, 'x', ComparisonComparators.Equal) for path in paths],
+            ComparisonExpressionOperators.Or)))
+        strippers = {
+            'nested': lambda: strip_unmapped_attributes(pattern, nested),
+            'index': lambda: strip_unmapped_attributes(pattern, query_translator),
+        }
+        for step, candidates in (('map_field', lookups), ('strip', strippers)):
+            results = {name: min(timeit.repeat(function, number=1, repeat=args.repeat))
+                       for name, function in candidates.items()}
+            print("{:>12} {:>10} {:>14.2f} {:>14.2f} {:>9.1f}x".format(size, step, results['nested'] * 1000,
+                                                                     results['index'] * 1000,
+                                                                     results['nested'] / results['index']))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Measures fetching pages of results through RestApiClient from a local HTTPS server, with the shared sessions keeping
+their connections alive and with a new connection per call (the shared sessions closed before each call).
+Requires the openssl command to generate the self signed certificate of the server.
+
+Usage (from the repository root):
+    python -m benchmarks.http_sessions [--pages 100] [--page-size 100] [--repeat 3]
+"""
+import argparse
+import http.server
+import json
+import os
+import socketserver
+import ssl
+import subprocess
+import tempfile
+import threading
+import timeit
+from stix_shifter_utils.stix_transmission.utils import RestApiClient
+
+
+class PageServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, page, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page = page
+        self.connections = 0
+
+    def get_request(self):
+        self.connections += 1
+        return super().get_request()
+
+
+class PageHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # the headers and the body are sent separately, without delay
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.server.page)))
+        self.end_headers()
+        self.wfile.write(self.server.page)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def self_signed_certificate(directory):
+    cert_file = os.path.join(directory, 'cert.pem')
+    key_file = os.path.join(directory, 'key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1', '-subj', '/CN=localhost',
+                    '-addext', 'subjectAltName=DNS:localhost', '-keyout', key_file, '-out', cert_file],
+                   check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    return cert_file, key_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=100)
+    parser.add_argument('--page-size', type=int, default=100, help='records per page')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    page = json.dumps({'events': [{'sourceip': '10.0.0.{}'.format(i % 256), 'qid': i}
+                                  for i in range(args.page_size)]}).encode('utf-8')
+    with tempfile.TemporaryDirectory() as directory:
+        cert_file, key_file = self_signed_certificate(directory)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_file, key_file)
+        server = PageServer(page, ('localhost', 0), PageHandler)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        with open(cert_file) as f:
+            client = RestApiClient.RestApiClient('localhost', server.server_address[1], cert_verify=f.read())
+
+        def fetch(reconnect):
+            for _ in range(args.pages):
+                if reconnect:
+                    RestApiClient.close_sessions()
+                client.call_api('api/ariel/searches/1/results', 'GET', timeout=30).read()
+
+        print("{} pages of {} bytes".format(args.pages, len(page)))
+        print("{:>12} {:>12} {:>12} {:>10}".format('connection', 'connections', 'time (ms)', 'speedup'))
+        results = {}
+        for name, reconnect in (('per call', True), ('kept alive', False)):
+            RestApiClient.close_sessions()
+            server.connections = 0
+            results[name] = min(timeit.repeat(lambda: fetch(reconnect), number=1, repeat=args.repeat))
+            print("{:>12} {:>12.1f} {:>12.0f} {:>9.2f}x".format(name, server.connections / args.repeat,
+                                                              results[name] * 1000,
+                                                              results['per call'] / results[name]))
+        server.shutdown()
+        RestApiClient.close_sessions()
+
+
+if __name__ == "__main__":
+    main()
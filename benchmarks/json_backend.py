@@ -0,0 +1,60 @@
+"""
+Compares the JSON backends on a large results payload: decoding the records, translating them to STIX and
+encoding the bundle.
+
+Usage (from the repository root):
+    python -m benchmarks.json_backend [--megabytes 100] [--module mysql] [--repeat 2] [--skip-translation]
+"""
+import argparse
+import json
+import timeit
+from stix_shifter.stix_translation.stix_translation import StixTranslation
+from stix_shifter_utils.utils import json_facade
+
+DATA_SOURCE = {"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "MySQL",
+               "identity_class": "events"}
+
+
+def payload(megabytes):
+    record = {"source_ipaddr": "10.0.0.1", "dest_ipaddr": "10.0.1.1", "source_port": 1024, "dest_port": 443,
+              "protocol": "TCP", "username": "user", "filename": "a.exe", "file_path": "C:\\\\temp"}
+    count = megabytes * 1024 * 1024 // len(json.dumps(record))
+    return json.dumps([dict(record, source_port=1024 + i % 60000, source_ipaddr="10.0.{}.{}".format(i // 256 % 256, i % 256))
+                       for i in range(count)]), count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--megabytes', type=int, default=100)
+    parser.add_argument('--module', default='mysql')
+    parser.add_argument('--repeat', type=int, default=2)
+    parser.add_argument('--skip-translation', action='store_true')
+    args = parser.parse_args()
+
+    text, count = payload(args.megabytes)
+    translation = StixTranslation()
+    # entry point, mapping plan and memory warm up, so the first backend is not penalized
+    translation.translate(args.module, 'results', DATA_SOURCE, json.loads(text)[:1000], {})
+    print("{} MB, {} records".format(len(text) // (1024 * 1024), count))
+    print("{:>8} {:>12} {:>14} {:>12} {:>12}".format('backend', 'decode (ms)', 'translate (ms)', 'encode (ms)',
+                                                     'total (ms)'))
+    for backend in json_facade.BACKENDS:
+        if json_facade.set_backend(backend) != backend:
+            print("{:>8} not installed".format(backend))
+            continue
+        records = json_facade.loads(text)
+        decode = min(timeit.repeat(lambda: json_facade.loads(text), number=1, repeat=args.repeat))
+        translate = 0
+        bundle = records
+        if not args.skip_translation:
+            translate = min(timeit.repeat(lambda: translation.translate(args.module, 'results', DATA_SOURCE, records, {}),
+                                          number=1, repeat=args.repeat))
+            bundle = translation.translate(args.module, 'results', DATA_SOURCE, records, {})
+        encode = min(timeit.repeat(lambda: json_facade.encode(bundle), number=1, repeat=args.repeat))
+        print("{:>8} {:>12.0f} {:>14.0f} {:>12.0f} {:>12.0f}".format(backend, decode * 1000, translate * 1000,
+                                                                     encode * 1000,
+                                                                     (decode + translate + encode) * 1000))
+
+
+if __name__ == "__main__":
+    main()
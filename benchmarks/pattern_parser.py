@@ -0,0 +1,44 @@
+"""
+Compares the ANTLR and the fast STIX pattern parser engines on large IOC patterns.
+
+Usage (from the repository root):
+    python -m benchmarks.pattern_parser [--sizes 10 100 1000 5000] [--repeat 3]
+"""
+import argparse
+import sys
+import timeit
+from stix_shifter_utils.stix_translation.src.patterns.parser import generate_query, PARSER_ANTLR, PARSER_FAST
+
+
+def ioc_pattern(size):
+    comparisons = []
+    for i in range(size):
+        if i % 3 == 0:
+            comparisons.append("ipv4-addr:value = '10.{}.{}.{}'".format(i // 65536, (i // 256) % 256, i % 256))
+        elif i % 3 == 1:
+            comparisons.append("file:hashes.'SHA-256' = '{:064x}'".format(i))
+        else:
+            comparisons.append("domain-name:value = 'host{}.example.com'".format(i))
+    return "[" + " OR ".join(comparisons) + "] START t'2021-01-01T00:00:00.000Z' STOP t'2021-01-02T00:00:00.000Z'"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 5000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    # the ANTLR parse tree walk recurses once per OR'd comparison
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20 * max(args.sizes) + 1000))
+
+    print("{:>12} {:>14} {:>14} {:>10}".format('comparisons', 'antlr (ms)', 'fast (ms)', 'speedup'))
+    for size in args.sizes:
+        pattern = ioc_pattern(size)
+        results = {}
+        for engine in (PARSER_ANTLR, PARSER_FAST):
+            results[engine] = min(timeit.repeat(lambda: generate_query(pattern, engine), number=1, repeat=args.repeat))
+        print("{:>12} {:>14.2f} {:>14.2f} {:>9.1f}x".format(size, results[PARSER_ANTLR] * 1000, results[PARSER_FAST] * 1000,
+                                                           results[PARSER_ANTLR] / results[PARSER_FAST]))
+
+
+if __name__ == "__main__":
+    main()
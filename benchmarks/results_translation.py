@@ -0,0 +1,55 @@
+"""
+Measures how results translation scales with the translate_workers option.
+
+Usage (from the repository root):
+    python -m benchmarks.results_translation [--records 50000] [--workers 1 2 4 8] [--stix-21] [--repeat 3]
+"""
+import argparse
+import os
+import timeit
+from stix_shifter.stix_translation.stix_translation import StixTranslation
+
+DATA_SOURCE = {"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "QRadar",
+               "identity_class": "events"}
+
+
+def qradar_events(count):
+    return [{
+        "sourceip": "10.{}.{}.{}".format(i % 5, (i // 256) % 256, i % 256),
+        "destinationip": "192.168.{}.{}".format((i // 256) % 4, i % 256),
+        "sourceport": 1024 + i % 60000,
+        "destinationport": 443,
+        "protocol": "TCP",
+        "username": "user{}".format(i % 100),
+        "starttime": 1600000000000 + i,
+        "endtime": 1600000001000 + i,
+        "eventcount": 1,
+        "qid": 55500004,
+        "eventpayload": "payload {}".format(i),
+    } for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default='qradar:events')
+    parser.add_argument('--records', type=int, default=50000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--stix-21', action='store_true')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    translation = StixTranslation()
+    records = qradar_events(args.records)
+    print("{} records, {} CPUs".format(args.records, os.cpu_count()))
+    print("{:>8} {:>12} {:>10}".format('workers', 'time (ms)', 'speedup'))
+    serial = None
+    for workers in args.workers:
+        options = {'stix_2.1': args.stix_21, 'translate_workers': workers}
+        elapsed = min(timeit.repeat(lambda: translation.translate(args.module, 'results', DATA_SOURCE, records, options),
+                                    number=1, repeat=args.repeat))
+        serial = serial or elapsed
+        print("{:>8} {:>12.0f} {:>9.1f}x".format(workers, elapsed * 1000, serial / elapsed))
+
+
+if __name__ == "__main__":
+    main()
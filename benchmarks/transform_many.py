@@ -0,0 +1,39 @@
+"""
+Measures the batch transformation of a column of distinct values with transform_many against transforming each
+value, for the timestamp transformers having a vectorized implementation (used when NumPy is installed).
+
+Usage (from the repository root):
+    python -m benchmarks.transform_many [--values 100000] [--repeat 3]
+"""
+import argparse
+import timeit
+from stix_shifter_utils.stix_translation.src.utils import transformers
+
+
+def columns(count):
+    return {
+        'EpochToTimestamp': [1600000000000 + i * 37 for i in range(count)],
+        'EpochSecondsToTimestamp': [1600000000 + i * 37 for i in range(count)],
+        'TimestampToMilliseconds': [transformers.EpochToTimestamp.transform(1600000000000 + i * 37)
+                                    for i in range(count)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--values', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print("NumPy {}".format(transformers.numpy.__version__ if transformers.numpy else 'not installed'))
+    print("{:>24} {:>14} {:>14} {:>10}".format('transformer', 'per value (ms)', 'batch (ms)', 'speedup'))
+    for name, values in columns(args.values).items():
+        transformer = getattr(transformers, name)
+        per_value = min(timeit.repeat(lambda: [transformer.transform(value) for value in values],
+                                      number=1, repeat=args.repeat))
+        batch = min(timeit.repeat(lambda: transformer.transform_many(values), number=1, repeat=args.repeat))
+        print("{:>24} {:>14.0f} {:>14.0f} {:>9.2f}x".format(name, per_value * 1000, batch * 1000, per_value / batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures results translation with and without the memoization of cacheable value transformers, on QRadar and
+Splunk samples where timestamps, ports, categories and hashes repeat like in real result pages.
+
+Usage (from the repository root):
+    python -m benchmarks.transformers [--records 20000] [--distinct 200] [--repeat 3]
+"""
+import argparse
+import timeit
+from stix_shifter.stix_translation.stix_translation import StixTranslation
+from stix_shifter_utils.stix_translation.src.json_to_stix import json_to_stix_translator
+
+DATA_SOURCE = {"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "Sample",
+               "identity_class": "events"}
+
+
+def qradar_events(count, distinct):
+    return [{
+        "sourceip": "10.0.{}.{}".format(i // 256 % 256, i % 256),
+        "destinationip": "192.168.0.{}".format(i % distinct % 256),
+        "sourceport": str(1024 + i % distinct),
+        "destinationport": "443",
+        "starttime": 1600000000000 + (i % distinct) * 1000,
+        "endtime": 1600000001000 + (i % distinct) * 1000,
+        "devicetime": 1600000000000 + (i % distinct) * 1000,
+        "eventcount": "1",
+        "categoryid": str(5000 + i % 20),
+        "qid": str(55500000 + i % 50),
+        "magnitude": "5",
+        "relevance": "6",
+        "credibility": "5",
+        "eventseverity": "3",
+        "logsourceid": str(100 + i % 10),
+        "filepath": "C:\\Windows\\System32\\app{}.exe".format(i % distinct),
+        "domainname": "https://host{}.example.com/path".format(i % distinct),
+    } for i in range(count)]
+
+
+def splunk_events(count, distinct):
+    return [{
+        "src_ip": "10.0.{}.{}".format(i // 256 % 256, i % 256),
+        "dest_ip": "192.168.0.{}".format(i % distinct % 256),
+        "src_port": str(1024 + i % distinct),
+        "dest_port": "443",
+        "_time": "2020-09-13T12:{:02d}:{:02d}.000+00:00".format(i % distinct // 60 % 60, i % 60),
+        "event_count": "1",
+        "file_hash": "{:032x}".format(i % distinct),
+        "url": "https://host{}.example.com/path".format(i % distinct),
+        "user": "user{}".format(i % 20),
+    } for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--distinct', type=int, default=200, help='distinct values of the repeated fields')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    translation = StixTranslation()
+    samples = {'qradar': qradar_events(args.records, args.distinct),
+               'splunk': splunk_events(args.records, args.distinct)}
+    cache_size = json_to_stix_translator.TRANSFORM_CACHE_SIZE
+    print("{:>8} {:>14} {:>14} {:>10}".format('module', 'uncached (ms)', 'cached (ms)', 'speedup'))
+    for module, records in samples.items():
+        # warm up the entry point and the mapping plan
+        translation.translate(module, 'results', DATA_SOURCE, records[:10], {})
+        results = {}
+        for name, size in (('uncached', 0), ('cached', cache_size)):
+            json_to_stix_translator.TRANSFORM_CACHE_SIZE = size
+            results[name] = min(timeit.repeat(lambda: translation.translate(module, 'results', DATA_SOURCE, records, {}),
+                                              number=1, repeat=args.repeat))
+        json_to_stix_translator.TRANSFORM_CACHE_SIZE = cache_size
+        print("{:>8} {:>14.0f} {:>14.0f} {:>9.2f}x".format(module, results['uncached'] * 1000, results['cached'] * 1000,
+                                                          results['uncached'] / results['cached']))
+
+
+if __name__ == "__main__":
+    main()
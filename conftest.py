@@ -1,5 +1,7 @@
 from pathlib import Path,PurePath
 import re
+import pytest
+from stix_shifter_utils.utils.token_cache import set_token_cache
 
 collect_ignore = []
 TEST_BASE_DIR = ''
@@ -15,4 +17,12 @@ def build_ignores(start_path_str, skip=False):
         if skip and TEST_FILE_PATTERN.match(start_path.name):
             collect_ignore.append(start_path_str)
 
-build_ignores(TEST_BASE_DIR)
\ No newline at end of file
+build_ignores(TEST_BASE_DIR)
+
+
+@pytest.fixture(autouse=True)
+def token_cache():
+    # the tokens cached by a test are not used by the next ones
+    set_token_cache(None)
+    yield
+    set_token_cache(None)
@@ -121,6 +121,12 @@ for project_name in projects.keys():
     install_requires = list(install_requires)
     print('install_requires: %s' % install_requires)
 
+    # Prepare optional requires: the asyncio transmission path, the connectors are run in an executor without it
+    extras_require = {}
+    if 'stix_shifter_utils' in src_folders:
+        extras_require['async'] = ['aiohttp>=3.9; python_version >= "3.8"']
+    print('extras_require: %s' % extras_require)
+
     # Prepare entry points
     entry_points = {}
     entry_points_items = []
@@ -158,6 +164,7 @@ for project_name in projects.keys():
         'keywords': 'datasource stix translate transform transmit',  # Optional
         'packages': packages,  # Required
         'install_requires': install_requires,
+        'extras_require': extras_require,
         'include_package_data': True,
         'entry_points': entry_points,  # Optional
         'project_urls': {  # Optional
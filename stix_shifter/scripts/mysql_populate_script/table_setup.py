@@ -1,13 +1,13 @@
 import mysql.connector
 from mysql.connector import errorcode
-import json
+from stix_shifter_utils.utils import json_facade
 import csv
 
 
 class TableSetup():
 
     def __init__(self, connection_params, table, data_file):
-        self.connection_params = json.loads(connection_params)
+        self.connection_params = json_facade.loads(connection_params)
         self.table = table
         self.csv_reader = csv.reader(data_file, delimiter=',')
         self.csv_rows = []
@@ -12,6 +12,8 @@ from stix_shifter_utils.utils.proxy_host import ProxyHost
 from stix_shifter_utils.utils.module_discovery import process_dialects, modules_list
 from stix_shifter_utils.utils import logger as utils_logger
 from stix_shifter_utils.utils.logger import exception_to_string
+from stix_shifter_utils.utils.ndjson import read_ndjson, write_ndjson
+from stix_shifter_utils.utils import json_facade
 
 TRANSLATE = 'translate'
 TRANSMIT = 'transmit'
@@ -73,6 +75,15 @@ def main():
                                   help='Run the STIX 2 validator against the translated results')
     translate_parser.add_argument('-d', '--debug', action='store_true',
                                   help='Print detail logs for debugging')
+    translate_parser.add_argument('-b', '--batch', action='store_true',
+                                  help='Translate the JSON lines read from stdin (pass an empty data argument), '
+                                       'one result is printed as a JSON line for each input line, in input order')
+    translate_parser.add_argument('-w', '--workers', type=int, default=1,
+                                  help='Number of worker processes used in batch mode')
+    translate_parser.add_argument('-n', '--ndjson', action='store_true',
+                                  help='Stream the translated STIX objects of results as JSON lines; with an empty data '
+                                       'argument, the result records are read from stdin as JSON lines. Not '
+                                       'available with -x')
     # modules parser
     parent_subparsers.add_parser(MODULES, help='Get modules list')
 
@@ -189,6 +200,10 @@ def main():
 
     args = parent_parser.parse_args()
 
+    if args.command == TRANSLATE and args.ndjson and args.stix_validator:
+        # the validator prints its reports to stdout, they would be mixed into the JSON lines
+        translate_parser.error('-x/--stix-validator can not be used with -n/--ndjson')
+
     help_and_exit = args.command is None
 
     if 'debug' in args and args.debug:
@@ -203,7 +218,7 @@ def main():
 
         options = {}
         if 'options' in args and args.options:
-            options = json.loads(args.options)
+            options = json_facade.loads(args.options)
 
         module = process_dialects(args_module_dialects, options)[0]
 
@@ -272,8 +287,8 @@ def main():
         # Execute means take the STIX SCO pattern as input, execute query, and return STIX as output
         
         translation = stix_translation.StixTranslation()
-        connection_dict = json.loads(args.connection)
-        configuration_dict = json.loads(args.configuration)
+        connection_dict = json_facade.loads(args.connection)
+        configuration_dict = json_facade.loads(args.configuration)
         translation_options = copy.deepcopy(connection_dict.get('options', {}))
         options['validate_pattern'] = True
         dsl = translation.translate(args.module, 'query', args.data_source, args.query, translation_options)
@@ -312,10 +327,29 @@ def main():
         # Translate results to STIX
         translation_options = copy.deepcopy(connection_dict.get('options', {}))
         options['validate_pattern'] = True
-        result = translation.translate(args.module, 'results', args.data_source, json.dumps(results), translation_options)
+        result = translation.translate(args.module, 'results', args.data_source, results, translation_options)
         log.info('STIX Results: \n' + json.dumps(result, indent=4, sort_keys=False))
         exit(0)
 
+    elif args.command == TRANSLATE and args.batch:
+        if args.stix_validator:
+            options['stix_validator'] = args.stix_validator
+        recursion_limit = args.recursion_limit if args.recursion_limit else 1000
+        items = [batch_item(line) for line in sys.stdin if line.strip()]
+        translation = stix_translation.StixTranslation()
+        results = translation.translate_batch(args.module, args.translate_type, args.data_source, items,
+                                              options=options, recursion_limit=recursion_limit, workers=args.workers)
+        for result in results:
+            print(json_facade.encode(result))
+        exit(0)
+
+    elif args.command == TRANSLATE and args.ndjson and args.translate_type == stix_translation.RESULTS:
+        data = args.data if args.data else read_ndjson(sys.stdin)
+        translation = stix_translation.StixTranslation()
+        write_ndjson(translation.translate_results_stream(args.module, args.data_source, data, options=options),
+                     sys.stdout)
+        exit(0)
+
     elif args.command == TRANSLATE:
         data = args.data
         if not data:
@@ -345,6 +379,19 @@ def main():
     exit(0)
 
 
+def batch_item(line):
+    """
+    Returns the data to translate from a line of batch input: JSON strings (ie. STIX patterns) are decoded,
+    other JSON values (ie. result sets) and lines that are not valid JSON are passed as they are
+    """
+    line = line.strip()
+    try:
+        item = json_facade.loads(line)
+    except ValueError:
+        return line
+    return item if isinstance(item, str) else line
+
+
 def transmit(args):
     """
     Connects to datasource and executes a query, grabs status update or query results
@@ -359,8 +406,8 @@ def transmit(args):
         is_async
     >
     """
-    connection_dict = json.loads(args.connection)
-    configuration_dict = json.loads(args.configuration)
+    connection_dict = json_facade.loads(args.connection)
+    configuration_dict = json_facade.loads(args.configuration)
     transmission = stix_transmission.StixTransmission(args.module, connection_dict, configuration_dict)
 
     operation_command = args.operation_command
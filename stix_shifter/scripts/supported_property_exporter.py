@@ -1,4 +1,5 @@
 import json
+from stix_shifter_utils.utils import json_facade
 from os import path
 import re
 from datetime import datetime
@@ -53,7 +54,7 @@ def __main__():
         try:
             filepath = path.abspath(path.join(TRANSLATION_MODULE_PATH, key, "stix_translation/json", "to_stix_map.json"))    
             json_file = open(filepath)
-            loaded_json = json.loads(json_file.read())
+            loaded_json = json_facade.loads(json_file.read())
         except(Exception):
             print("Error for {} module".format(key))
             continue
@@ -63,7 +64,7 @@ def __main__():
             try:
                 fields_filepath = path.abspath(path.join(TRANSLATION_MODULE_PATH, key, "stix_translation/json", "aql_events_fields.json"))    
                 fields_json_file = open(fields_filepath)
-                loaded_fields_json = json.loads(fields_json_file.read())
+                loaded_fields_json = json_facade.loads(fields_json_file.read())
                 aliased_data_fields = loaded_fields_json.get('default') # array of fields
             except(Exception):
                 print("Error for {} module".format(key))
@@ -79,7 +80,7 @@ def __main__():
         output_string += "## " + module + "\n"
         table_of_contents += "- [{}]({})\n".format(module, "connectors/{}_supported_stix.md".format(key))
         sorted_objects = json.dumps(stix_attribute_collection, sort_keys=True)
-        sorted_objects = json.loads(sorted_objects)
+        sorted_objects = json_facade.loads(sorted_objects)
         output_string += "| STIX Object | STIX Property | Data Source Field |\n"
         output_string += "|--|--|--|\n"
         for stix_object, property_list in sorted_objects.items():
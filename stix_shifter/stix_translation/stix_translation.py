@@ -1,4 +1,8 @@
+from concurrent.futures import ProcessPoolExecutor
 import importlib
+import itertools
+import json
+import os
 import sys
 import traceback
 from stix_shifter_utils.stix_translation.src.utils.exceptions import DataMappingException, \
@@ -8,6 +12,7 @@ from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils.param_validator import param_validator
 from stix_shifter_utils.utils import logger
 from stix_shifter_utils.utils.logger import exception_to_string
+from stix_shifter_utils.utils.lru_cache import LRUCache
 
 RESULTS = 'results'
 QUERY = 'query'
@@ -17,6 +22,38 @@ DIALECTS = 'dialects'
 SUPPORTED_ATTRIBUTES = "supported_attributes"
 MAPPING_ERROR = "Unable to map the following STIX objects and properties to data source fields:"
 DEFAULT_DIALECT = 'default'
+ENTRY_POINT_CACHE_SIZE_DEFAULT = 64
+
+# Constructed entry points are shared process-wide: building one re-reads every dialect's mapping files
+# and re-discovers transformers, which dwarfs the cost of translating a single pattern.
+entry_point_cache = LRUCache(int(os.getenv('STIXSHIFTER_ENTRY_POINT_CACHE_SIZE', ENTRY_POINT_CACHE_SIZE_DEFAULT)))
+
+
+def invalidate_entry_point_cache(module=None):
+    """
+    Drops cached entry points, e.g. after a module's mapping files have been changed on disk
+    :param module: only drop entry points of this module; None drops all of them
+    :type module: str
+    :return: number of dropped entry points
+    :rtype: int
+    """
+    if module is None:
+        return entry_point_cache.invalidate()
+    module = module.split(':')[0]
+    return entry_point_cache.invalidate(lambda key: key[0] == module)
+
+
+# Per process state of the batch translation workers, see StixTranslation.translate_batch
+_batch_translation = None
+
+
+def _translate_batch_item(args, data):
+    # created by the first item of the worker rather than by a pool initializer, not available on Python 3.6
+    global _batch_translation
+    if _batch_translation is None:
+        _batch_translation = StixTranslation()
+    module, translate_type, data_source, options, recursion_limit = args
+    return _batch_translation.translate(module, translate_type, data_source, data, options, recursion_limit)
 
 
 class StixTranslation:
@@ -35,8 +72,8 @@ class StixTranslation:
         :type module: one of connector modules: 'qradar', 'dummy'
         :param translate_type: translation of a query or result set must be one of: 'parse', 'mapping' 'query', 'results'
         :type translate_type: str
-        :param data: the data to translate
-        :type data: str
+        :param data: the data to translate, results may also be given as the already parsed list of records
+        :type data: str or list
         :param options: translation options { stix_validator: bool }
         :type options: dict
         :param recursion_limit: maximum depth of Python interpreter stack
@@ -47,21 +84,7 @@ class StixTranslation:
 
         module, dialects = process_dialects(module, options)
         try:
-            try:
-                connector_module = importlib.import_module("stix_shifter_modules." + module + ".entry_point")
-            except Exception as ex:
-                raise UnsupportedDataSourceException("{} is an unsupported data source.".format(module))
-            try:
-                if not translate_type == DIALECTS:
-                    validated_options = param_validator(module, options, 'connection.options')
-                else:
-                    validated_options = {}
-                entry_point = connector_module.EntryPoint(options=validated_options)
-            except Exception as ex:
-                track = traceback.format_exc()
-                self.logger.error(ex)
-                self.logger.debug(track)
-                raise
+            validated_options, entry_point = self._get_entry_point(module, translate_type, dialects, options)
 
             if translate_type == DIALECTS:
                 dialects = entry_point.get_dialects_full()
@@ -86,11 +109,15 @@ class StixTranslation:
                     queries = []
                     unmapped_stix_collection = []
                     dialects_used = 0
+                    # The pattern is validated and parsed once, all dialects translate the same frozen parsing
+                    antlr_parsing = None
                     for dialect in dialects:
                         query_translator = entry_point.get_query_translator(dialect)
                         if not language or language == query_translator.get_language():
                             dialects_used += 1
-                            transform_result = entry_point.transform_query(dialect, data)
+                            if antlr_parsing is None and query_translator.supports_shared_parsing():
+                                antlr_parsing = query_translator.parse_pattern(data)
+                            transform_result = entry_point.transform_query(dialect, data, antlr_parsing)
                             if 'async_call' in transform_result:
                                 queries.append(transform_result)
                             else:
@@ -126,3 +153,117 @@ class StixTranslation:
             response = dict()
             ErrorResponder.fill_error(response, message_struct={'exception': ex})
             return response
+
+    def translate_results_columns(self, module, data_source, columns, rows, options={}):
+        """
+        Translates tabular data source results (ie. SQL result sets) into STIX, the column names are given once
+        and each row is a tuple of values: no record is built per row
+        :param module: What module to use
+        :type module: one of connector modules: 'qradar', 'dummy'
+        :param data_source: STIX identity object representing a data source
+        :type data_source: str or dict
+        :param columns: the column names
+        :type columns: list
+        :param rows: the rows, tuples or lists of values in the order of columns
+        :type rows: iterable
+        :param options: translation options { stix_validator: bool }
+        :type options: dict
+        :return: translated results, the same as translate returns for the records dict(zip(columns, row))
+        :rtype: dict
+        """
+        module, dialects = process_dialects(module, options)
+        try:
+            _, entry_point = self._get_entry_point(module, RESULTS, dialects, options)
+            return entry_point.translate_results_columns(data_source, columns, rows)
+        except Exception as ex:
+            self.logger.error('Caught exception: ' + str(ex) + " " + str(type(ex)))
+            self.logger.debug(exception_to_string(ex))
+            response = dict()
+            ErrorResponder.fill_error(response, message_struct={'exception': ex})
+            return response
+
+    def translate_results_stream(self, module, data_source, data, options={}):
+        """
+        Translates data source results into STIX objects, yielded one at a time so memory use does not depend on
+        the number of results. On an error, an error response is yielded as the last item.
+        :param module: What module to use
+        :type module: one of connector modules: 'qradar', 'dummy'
+        :param data_source: STIX identity object representing a data source
+        :type data_source: str
+        :param data: the results to translate, JSON text or any iterable of records
+        :type data: str
+        :param options: translation options { stix_validator: bool }
+        :type options: dict
+        :return: the data source identity, the observed-data objects, then the unique STIX 2.1 cybox objects
+        :rtype: generator
+        """
+        module, dialects = process_dialects(module, options)
+        try:
+            _, entry_point = self._get_entry_point(module, RESULTS, dialects, options)
+            yield from entry_point.translate_results_stream(data_source, data)
+        except Exception as ex:
+            self.logger.error('Caught exception: ' + str(ex) + " " + str(type(ex)))
+            self.logger.debug(exception_to_string(ex))
+            response = dict()
+            ErrorResponder.fill_error(response, message_struct={'exception': ex})
+            yield response
+
+    def translate_batch(self, module, translate_type, data_source, items, options={}, recursion_limit=1000, workers=1):
+        """
+        Translates several items (STIX patterns or result sets) with the same module, data source and options
+        :param module: What module to use
+        :type module: one of connector modules: 'qradar', 'dummy'
+        :param translate_type: translation of a query or result set must be one of: 'parse', 'mapping' 'query', 'results'
+        :type translate_type: str
+        :param items: the data to translate, one translate call per item
+        :type items: iterable
+        :param options: translation options { stix_validator: bool }
+        :type options: dict
+        :param recursion_limit: maximum depth of Python interpreter stack
+        :type recursion_limit: int
+        :param workers: number of worker processes, items are translated in the calling process when 1 or less
+        :type workers: int
+        :return: the translate result of each item, in the order of items (errors are returned as error responses)
+        :rtype: list
+        """
+        items = list(items)
+        if workers is None or workers <= 1 or len(items) <= 1:
+            return [self.translate(module, translate_type, data_source, data, options, recursion_limit) for data in items]
+
+        workers = min(workers, len(items))
+        # a few chunks per worker, large enough to amortize the inter-process transfers and small enough to balance
+        # the load between workers; each worker keeps its entry points warm across chunks
+        chunksize = max(1, len(items) // (workers * 4))
+        args = (module, translate_type, data_source, options, recursion_limit)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_translate_batch_item, itertools.repeat(args), items, chunksize=chunksize))
+
+    def _get_entry_point(self, module, translate_type, dialects, options):
+        if translate_type == DIALECTS:
+            options = {}
+        try:
+            options_key = json.dumps(options, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            options_key = None
+        if options_key is None:
+            return self._create_entry_point(module, translate_type, options)
+        key = (module, frozenset(dialects), options_key, translate_type == DIALECTS)
+        return entry_point_cache.get_or_create(key, lambda: self._create_entry_point(module, translate_type, options))
+
+    def _create_entry_point(self, module, translate_type, options):
+        try:
+            connector_module = importlib.import_module("stix_shifter_modules." + module + ".entry_point")
+        except Exception as ex:
+            raise UnsupportedDataSourceException("{} is an unsupported data source.".format(module))
+        try:
+            if not translate_type == DIALECTS:
+                validated_options = param_validator(module, options, 'connection.options')
+            else:
+                validated_options = {}
+            entry_point = connector_module.EntryPoint(options=validated_options)
+        except Exception as ex:
+            track = traceback.format_exc()
+            self.logger.error(ex)
+            self.logger.debug(track)
+            raise
+        return validated_options, entry_point
@@ -91,6 +91,72 @@ class StixTransmission:
             ErrorResponder.fill_error(return_obj, error=ex)
             return return_obj
 
+    async def query_async(self, query):
+        # Coroutine version of query, the connectors of the modules without async ones run in the default executor
+        try:
+            if self.init_error:
+                raise self.init_error
+            return await self.entry_point.create_query_connection_async(query)
+        except Exception as ex:
+            return_obj = dict()
+            ErrorResponder.fill_error(return_obj, error=ex)
+            return return_obj
+
+    async def status_async(self, search_id):
+        # Coroutine version of status
+        try:
+            if self.init_error:
+                raise self.init_error
+            return await self.entry_point.create_status_connection_async(search_id)
+        except Exception as ex:
+            return_obj = dict()
+            ErrorResponder.fill_error(return_obj, error=ex)
+            return return_obj
+
+    async def results_async(self, search_id, offset, length):
+        # Coroutine version of results
+        try:
+            if self.init_error:
+                raise self.init_error
+            return await self.entry_point.create_results_connection_async(search_id, offset, length)
+        except Exception as ex:
+            return_obj = dict()
+            ErrorResponder.fill_error(return_obj, error=ex)
+            return return_obj
+
+    async def results_stix_async(self, search_id, offset, length, data_source):
+        # Coroutine version of results_stix
+        try:
+            if self.init_error:
+                raise self.init_error
+            return await self.entry_point.create_results_stix_connection_async(search_id, offset, length, data_source)
+        except Exception as ex:
+            return_obj = dict()
+            ErrorResponder.fill_error(return_obj, error=ex)
+            return return_obj
+
+    async def delete_async(self, search_id):
+        # Coroutine version of delete
+        try:
+            if self.init_error:
+                raise self.init_error
+            return await self.entry_point.delete_query_connection_async(search_id)
+        except Exception as ex:
+            return_obj = dict()
+            ErrorResponder.fill_error(return_obj, error=ex)
+            return return_obj
+
+    async def ping_async(self):
+        # Coroutine version of ping
+        try:
+            if self.init_error:
+                raise self.init_error
+            return await self.entry_point.ping_connection_async()
+        except Exception as ex:
+            return_obj = dict()
+            ErrorResponder.fill_error(return_obj, error=ex)
+            return return_obj
+
     def is_async(self):
         # Check if the module is async/sync
         try:
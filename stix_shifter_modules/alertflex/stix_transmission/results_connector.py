@@ -1,7 +1,7 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 class ResultsConnector(BaseResultsConnector):
@@ -16,7 +16,7 @@ class ResultsConnector(BaseResultsConnector):
             # Grab the response, extract the response code, and convert it to readable json
             response = self.api_client.get_search_results(search_id, min_range, max_range)
             response_code = response.code
-            response_dict = json.loads(response.read())
+            response_dict = json_facade.loads(response.read())
 
             # # Construct a response object
             return_obj = dict()
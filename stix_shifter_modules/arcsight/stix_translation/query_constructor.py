@@ -216,7 +216,8 @@ class QueryStringPatternTranslator:
             # Resolve STIX Object Path to a field in the target Data Model
             stix_object, stix_field = expression.object_path.split(':')
             # Multiple data source fields may map to the same STIX Object
-            mapped_fields_array = self.dmm.map_field(stix_object, stix_field)
+            # _check_value_type removes fields from the list, the mapped fields are shared so work on a copy
+            mapped_fields_array = list(self.dmm.map_field(stix_object, stix_field))
             # Resolve the comparison symbol to use in the query string (usually just ':')
             comparator = self._lookup_comparison_operator(self, expression.comparator)
 
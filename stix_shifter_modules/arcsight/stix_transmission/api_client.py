@@ -1,8 +1,10 @@
-import time
 from datetime import datetime, timedelta
 import json
+import secrets
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
 from stix_shifter_utils.utils.error_response import ErrorResponder
+from stix_shifter_utils.utils.token_cache import get_token_cache
 
 
 class APIClient:
@@ -11,6 +13,10 @@ class APIClient:
     QUERY_ENDPOINT = 'server/search'
     RESULT_ENDPOINT = 'server/search/events'
     DELETE_ENDPOINT = 'server/search/close'
+    # seconds a user session is reused for, below the default session timeout of the logger
+    USER_SESSION_LIFETIME = 300
+    # logger error code of a user session closed or timed out before USER_SESSION_LIFETIME
+    INVALID_USER_SESSION_CODE = 1002
 
     def __init__(self, connection, configuration):
         self.auth = configuration.get('auth')
@@ -22,9 +28,12 @@ class APIClient:
                                     )
 
     def ping_data_source(self):
+        return self.call_with_user_session(self._ping)
+
+    def _ping(self, user_session_id):
         data, headers = dict(), dict()
-        data['search_session_id'] = int(round(time.time() * 1000))
-        data['user_session_id'] = self.get_user_session_id()
+        data['search_session_id'] = self.new_search_session_id()
+        data['user_session_id'] = user_session_id
         data['start_time'] = self.get_current_time()['start_time']
         data['end_time'] = self.get_current_time()['end_time']
         headers['Content-Type'] = 'application/json'
@@ -34,18 +43,21 @@ class APIClient:
     def create_search(self, query_expression):
         return_obj = dict()
         auth = dict()
-        auth['search_session_id'] = int(round(time.time() * 1000))
-        auth['user_session_id'] = self.get_user_session_id()
+        auth['search_session_id'] = self.new_search_session_id()
         try:
-            query = json.loads(query_expression)
-            query.update(auth)
+            query = json_facade.loads(query_expression)
             headers = {'Content-Type': 'application/json', 'Accept-Charset': 'utf-8'}
-            response = self.client.call_api(self.QUERY_ENDPOINT, 'POST', headers, data=json.dumps(query))
+
+            def search(user_session_id):
+                auth['user_session_id'] = user_session_id
+                query.update(auth)
+                return self.client.call_api(self.QUERY_ENDPOINT, 'POST', headers, data=json.dumps(query))
+            response = self.call_with_user_session(search)
             raw_response = response.read()
             response_code = response.code
 
             if 199 < response_code < 300:
-                response_dict = json.loads(raw_response)
+                response_dict = json_facade.loads(raw_response)
                 if response_dict.get('sessionId'):
                     return_obj['success'] = True
                     return_obj['search_id'] = str(auth['search_session_id']) + ':' + str(auth['user_session_id'])
@@ -53,8 +65,8 @@ class APIClient:
             elif response_code in [500, 503]:
                 response_string = raw_response.decode()
                 ErrorResponder.fill_error(return_obj, response_string, ['message'])
-            elif isinstance(json.loads(raw_response), dict):
-                response_error = json.loads(raw_response)
+            elif isinstance(json_facade.loads(raw_response), dict):
+                response_error = json_facade.loads(raw_response)
                 response_dict = response_error['errors'][0]
                 ErrorResponder.fill_error(return_obj, response_dict, ['message'])
             else:
@@ -70,7 +82,11 @@ class APIClient:
         params['user_session_id'] = user_session_id
         headers['Content-Type'] = 'application/json'
         headers['Accept-Charset'] = 'utf-8'
-        return self.client.call_api(self.STATUS_ENDPOINT, 'POST', headers, data=json.dumps(params))
+        response = self.client.call_api(self.STATUS_ENDPOINT, 'POST', headers, data=json.dumps(params))
+        # the search belongs to its user session, it can not be carried on with a new one
+        if self.rejects_user_session(response):
+            self.invalidate_user_session(user_session_id)
+        return response
 
     def get_search_results(self, search_session_id, user_session_id, range_start=None, range_end=None):
         headers, params = dict(), dict()
@@ -80,7 +96,11 @@ class APIClient:
         params['length'] = int(range_end)
         headers['Content-Type'] = 'application/json'
         headers['Accept-Charset'] = 'utf-8'
-        return self.client.call_api(self.RESULT_ENDPOINT, 'POST', headers, data=json.dumps(params))
+        response = self.client.call_api(self.RESULT_ENDPOINT, 'POST', headers, data=json.dumps(params))
+        # the search belongs to its user session, it can not be carried on with a new one
+        if self.rejects_user_session(response):
+            self.invalidate_user_session(user_session_id)
+        return response
 
     def delete_search(self, search_session_id, user_session_id):
         headers, params = dict(), dict()
@@ -88,13 +108,50 @@ class APIClient:
         params['user_session_id'] = user_session_id
         headers['Content-Type'] = 'application/json'
         headers['Accept-Charset'] = 'utf-8'
-        return self.client.call_api(self.DELETE_ENDPOINT, 'POST', headers, data=json.dumps(params))
+        response = self.client.call_api(self.DELETE_ENDPOINT, 'POST', headers, data=json.dumps(params))
+        # the search belongs to its user session, it can not be carried on with a new one
+        if self.rejects_user_session(response):
+            self.invalidate_user_session(user_session_id)
+        return response
 
     def get_user_session_id(self):
+        # the searches and pings with the same credentials share a login until it is about to expire
+        return get_token_cache().get_token('arcsight', self.client.get_server_ip(), self.auth, self.login)
+
+    def invalidate_user_session(self, user_session_id):
+        get_token_cache().invalidate('arcsight', self.client.get_server_ip(), self.auth, token=user_session_id)
+
+    def rejects_user_session(self, response):
+        if response.code == 401:
+            return True
+        if 199 < response.code < 300 or response.code in [500, 503]:
+            return False
+        try:
+            errors = json_facade.loads(response.read())['errors']
+            return errors[0]['code'] == self.INVALID_USER_SESSION_CODE
+        except Exception:
+            return False
+
+    def call_with_user_session(self, call):
+        """
+        Calls the logger with the shared user session, or with a new one when the logger rejects it: the user session
+        may have been closed before it expires in the token cache
+        :param call: function calling the logger with the user session id
+        :type call: function
+        :return: the response of the logger
+        """
+        user_session_id = self.get_user_session_id()
+        response = call(user_session_id)
+        if self.rejects_user_session(response):
+            self.invalidate_user_session(user_session_id)
+            response = call(self.get_user_session_id())
+        return response
+
+    def login(self):
         try:
             response = self.client.call_api(self.TOKEN_ENDPOINT, 'POST', data=self.auth)
             if response.code == 200:
-                response_text = json.loads(response.read())
+                response_text = json_facade.loads(response.read())
                 token = response_text['log.loginResponse']['log.return']
             elif response.read().decode("utf-8") == '':
                 return_dict = 'Request error or authentication failure.'
@@ -102,10 +159,17 @@ class APIClient:
             else:
                 raise Exception(response)
 
-            return token
+            return token, self.USER_SESSION_LIFETIME
         except Exception as err:
             raise err
 
+    @staticmethod
+    def new_search_session_id():
+        # the user session is shared by the connectors of the credentials: the id of a search is random rather than
+        # the current time, so that searches started in the same millisecond are told apart. Below 2**53 for the
+        # JSON parsers reading numbers as doubles.
+        return secrets.randbits(53)
+
     @staticmethod
     def get_current_time():
         ping_time = dict()
@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.modules.base.stix_transmission.base_delete_connector import BaseDeleteConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
 
@@ -32,8 +32,8 @@ class DeleteConnector(BaseDeleteConnector):
             elif response_code in [500, 503]:
                 response_string = raw_response.decode()
                 ErrorResponder.fill_error(return_obj, response_string, ['message'])
-            elif json.loads(raw_response):
-                raw_response = json.loads(raw_response)
+            elif json_facade.loads(raw_response):
+                raw_response = json_facade.loads(raw_response)
                 response_dict = raw_response['errors'][0]
                 ErrorResponder.fill_error(return_obj, response_dict, ['message'])
             else:
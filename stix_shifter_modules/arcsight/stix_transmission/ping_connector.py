@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.modules.base.stix_transmission.base_ping_connector import BasePingConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
 
@@ -25,8 +25,8 @@ class PingConnector(BasePingConnector):
             elif response_code in [500, 503]:
                 response_string = raw_response.decode()
                 ErrorResponder.fill_error(return_obj, response_string, ['message'])
-            elif isinstance(json.loads(raw_response), dict):
-                response_error_ping = json.loads(raw_response)
+            elif isinstance(json_facade.loads(raw_response), dict):
+                response_error_ping = json_facade.loads(raw_response)
                 response_dict = response_error_ping['errors'][0]
                 ErrorResponder.fill_error(return_obj, response_dict, ['message'])
             else:
@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 import re
 from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
@@ -40,7 +40,7 @@ class ResultsConnector(BaseResultsConnector):
 
             if 199 < response_code < 300:
                 return_obj['success'] = True
-                response_dict = json.loads(raw_response)
+                response_dict = json_facade.loads(raw_response)
                 if response_dict:
                     final_response = list(map(lambda mapping: dict(zip(list(map(lambda schema: schema['name'],
                                                                                 response_dict['fields'])), mapping)),
@@ -55,8 +55,8 @@ class ResultsConnector(BaseResultsConnector):
             elif response_code in [500, 503]:
                 response_string = raw_response.decode()
                 ErrorResponder.fill_error(return_obj, response_string, ['message'])
-            elif isinstance(json.loads(raw_response), dict):
-                response_error = json.loads(raw_response)
+            elif isinstance(json_facade.loads(raw_response), dict):
+                response_error = json_facade.loads(raw_response)
                 response_dict = response_error['errors'][0]
                 ErrorResponder.fill_error(return_obj, response_dict, ['message'])
             else:
@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 import math
 from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector
 from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import Status
@@ -80,7 +80,7 @@ class StatusConnector(BaseStatusConnector):
         :param response_code: int, Api call response code
         :param limit: int, limit for status calculation """
         if 199 < response_code < 300:
-            response_dict = json.loads(raw_response)
+            response_dict = json_facade.loads(raw_response)
             return_obj['success'] = True
             return_obj['status'] = self.__getStatus(response_dict['status'])
             results = int(response_dict['hit'])
@@ -99,8 +99,8 @@ class StatusConnector(BaseStatusConnector):
         elif response_code in [500, 503]:
             response_string = raw_response.decode()
             ErrorResponder.fill_error(return_obj, response_string, ['message'])
-        elif isinstance(json.loads(raw_response), dict):
-            response_error = json.loads(raw_response)
+        elif isinstance(json_facade.loads(raw_response), dict):
+            response_error = json_facade.loads(raw_response)
             response_dict = response_error['errors'][0]
             ErrorResponder.fill_error(return_obj, response_dict, ['message'])
         else:
@@ -461,3 +461,65 @@ class TestArcsightConnection(unittest.TestCase):
         assert results_response['success'] is False
         assert 'error' in results_response
         assert results_response['code'] == 'service_unavailable'
+
+    @staticmethod
+    @patch('stix_shifter_utils.stix_transmission.utils.RestApiClient.RestApiClient.call_api')
+    def test_rejected_user_session_renewed(mock_call_api):
+        """to log in again when the logger rejects the shared user session"""
+        user_sessions = iter(['closed.', 'renewed.'])
+        endpoints = []
+
+        def call_api(endpoint, method, headers=None, data=None):
+            endpoints.append(endpoint)
+            if endpoint == 'core-service/rest/LoginService/login':
+                response = {'log.loginResponse': {'log.return': next(user_sessions)}}
+                return ArcsightMockResponse(200, json.dumps(response))
+            if json.loads(data)['user_session_id'] == 'closed.':
+                error = {"errors": [{"code": 1002, "message": "User session closed. is not valid"}]}
+                return ArcsightMockResponse(400, json.dumps(error))
+            return ArcsightMockResponse(200, '{"sessionId":"2"}')
+        mock_call_api.side_effect = call_api
+        query = "{\"query\": \"destinationPort = 22\", \"start_time\": \"2020-06-01T11:20:20.000-05:00\", " \
+                "\"end_time\": \"2020-07-01T12:00:44.000-05:00\"}"
+
+        query_response = stix_transmission.StixTransmission('arcsight', CONNECTION, CONFIG).query(query)
+        assert query_response['success'] is True
+        assert query_response['search_id'].split(':')[1] == 'renewed.'
+        ping_response = stix_transmission.StixTransmission('arcsight', CONNECTION, CONFIG).ping()
+        assert ping_response['success'] is True
+
+        assert endpoints == ['core-service/rest/LoginService/login', 'server/search',
+                             'core-service/rest/LoginService/login', 'server/search', 'server/search']
+
+    @staticmethod
+    @patch('stix_shifter_utils.stix_transmission.utils.RestApiClient.RestApiClient.call_api')
+    def test_status_rejected_user_session_invalidated(mock_call_api):
+        """to stop sharing a user session the logger rejected for the status of a search"""
+        response = {'log.loginResponse': {'log.return': 'BCP7NIkbiLBkXx2FwdkU7ma9O7bJAWng1k.'}}
+        error = {"errors": [{"code": 1002, "message": "User session BCP7NIkbiLBkXx2FwdkU7ma9O7bJAWng1k. is not valid"}]}
+        mock_call_api.side_effect = [ArcsightMockResponse(200, json.dumps(response)),
+                                     ArcsightMockResponse(200, '{"sessionId":"2"}'),
+                                     ArcsightMockResponse(400, json.dumps(error)),
+                                     ArcsightMockResponse(200, json.dumps(response)),
+                                     ArcsightMockResponse(200, '{"sessionId":"2"}')]
+        transmission = stix_transmission.StixTransmission('arcsight', CONNECTION, CONFIG)
+
+        assert transmission.ping()['success'] is True
+        status_response = transmission.status("1594383044445:BCP7NIkbiLBkXx2FwdkU7ma9O7bJAWng1k.")
+        assert status_response['success'] is False
+        assert transmission.ping()['success'] is True
+        assert mock_call_api.call_args_list[3][0][0] == 'core-service/rest/LoginService/login'
+
+    @staticmethod
+    @patch('stix_shifter_utils.stix_transmission.utils.RestApiClient.RestApiClient.call_api')
+    @patch('stix_shifter_modules.arcsight.stix_transmission.api_client.APIClient.get_user_session_id')
+    def test_search_ids_unique(mock_session_id, mock_query_res):
+        """to tell apart the searches started at once with the shared user session"""
+        mock_session_id.return_value = 'Dhoup23b3wL7tBlWWIeFPg8JHEf29qD1tNRJba4Jsyg.'
+        mock_query_res.return_value = ArcsightMockResponse(200, '{"sessionId":"2"}')
+        query = "{\"query\": \"destinationPort = 22\", \"start_time\": \"2020-06-01T11:20:20.000-05:00\", " \
+                "\"end_time\": \"2020-07-01T12:00:44.000-05:00\"}"
+        transmission = stix_transmission.StixTransmission('arcsight', CONNECTION, CONFIG)
+        search_ids = {transmission.query(query)['search_id'] for _ in range(100)}
+
+        assert len(search_ids) == 100
@@ -2,7 +2,7 @@ from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import Obs
     ComparisonExpression, ComparisonExpressionOperators, ComparisonComparators, Pattern, \
     CombinedComparisonExpression, CombinedObservationExpression, ObservationOperators, StartStopQualifier
 import re
-import json
+from stix_shifter_utils.utils import json_facade
 import os.path as path
 from datetime import datetime, timedelta
 try:
@@ -147,7 +147,7 @@ class QueryStringPatternTranslator:
         _json_path = path.abspath(path.join(path.join(__file__, ".."), rel_path_of_file))
         if path.exists(_json_path):
             with open(_json_path) as f_obj:
-                return json.load(f_obj)
+                return json_facade.load(f_obj)
         else:
             raise FileNotFoundError
 
@@ -1,6 +1,6 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_connector import BaseQueryConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
-import json
+from stix_shifter_utils.utils import json_facade
 import re
 import uuid
 
@@ -33,7 +33,7 @@ class QueryConnector(BaseQueryConnector):
         response_dict = dict()
         try:
             if not isinstance(query, dict):
-                query = json.loads(query)
+                query = json_facade.loads(query)
             query_service_type = list(query.keys())[0]
             config_details = service_types[query_service_type]
             if all([True if config not in self.connection.keys() else False for config in config_details]):
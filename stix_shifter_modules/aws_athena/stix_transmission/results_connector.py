@@ -1,4 +1,5 @@
 import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
@@ -98,7 +99,7 @@ class ResultsConnector(BaseResultsConnector):
         for obj in results:
             for key, value in obj.items():
                 try:
-                    obj[key] = json.loads(value)
+                    obj[key] = json_facade.loads(value)
                 except ValueError:
                     pass
             flatten_obj = flatten(obj, '#')
@@ -150,7 +151,7 @@ class ResultsConnector(BaseResultsConnector):
         translate_basepath = transmit_basepath.split(os.sep)[:-2]
         filepath = os.sep.join([*translate_basepath, "stix_translation", "json", 'to_stix_map.json'])
         map_file = open(filepath).read()
-        map_data = json.loads(map_file)
+        map_data = json_facade.loads(map_file)
         map_data_keys = list(map_data[service_type].keys())
         ds_key_values = self.gen_dict_extract(key_to_search='ds_key', var=map_data)
         map_data_keys.extend(ds_key_values)
@@ -209,7 +210,7 @@ class ResultsConnector(BaseResultsConnector):
 
         if path.exists(_json_path):
             with open(_json_path) as f_obj:
-                protocols = json.load(f_obj)
+                protocols = json_facade.load(f_obj)
                 if str(value).isdigit():
                     for key, val in protocols.items():
                         if val == str(value):
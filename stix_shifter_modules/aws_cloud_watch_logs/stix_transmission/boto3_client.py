@@ -1,7 +1,7 @@
 import boto3
 import string
 import random
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 class BOTO3Client:
@@ -13,7 +13,7 @@ class BOTO3Client:
         log_group_names = connection.get('log_group_names', {})
         if type(log_group_names) == str:
             if len(log_group_names):
-                log_group_names = json.loads(log_group_names)
+                log_group_names = json_facade.loads(log_group_names)
             else:
                 log_group_names = {}
         self.log_group_names = log_group_names
@@ -1,6 +1,6 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_connector import BaseQueryConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
-import json
+from stix_shifter_utils.utils import json_facade
 
 # aws maximum limit for start query loggroups
 LOG_GROUP_NAMES_LIMIT = 20
@@ -25,7 +25,7 @@ class QueryConnector(BaseQueryConnector):
         return_obj = dict()
         response_dict = dict()
         try:
-            query = json.loads(query)
+            query = json_facade.loads(query)
             log_type = query['logType']
             limit = query['limit']
             # add service specific loggroups to query if service logtype present
@@ -1,4 +1,5 @@
 import json
+from stix_shifter_utils.utils import json_facade
 from flatten_json import flatten
 import copy
 from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector
@@ -59,7 +60,7 @@ class ResultsConnector(BaseResultsConnector):
                 record_dict[data['field']] = data['value']
             if 'source' in record_dict.keys() and record_dict['source'] == 'aws.guardduty':
                 json_message = record_dict['@message']
-                data = json.loads(json_message)
+                data = json_facade.loads(json_message)
                 flatten_results = flatten(data)
                 flatten_results = {k: v for k, v in flatten_results.items() if v != "" and v != {}}
                 if flatten_results.get('detail_service_action_actionType') is None:
@@ -78,7 +79,7 @@ class ResultsConnector(BaseResultsConnector):
                 result_list.append(vpc_dict)
             else:
                 json_message = record_dict['@message']
-                data = json.loads(json_message)
+                data = json_facade.loads(json_message)
                 flatten_results = flatten(data)
                 result_list.append(flatten_results)
 
@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 import adal
 import re
 from flatten_json import flatten
@@ -6,6 +6,7 @@ from stix_shifter_utils.modules.base.stix_transmission.base_sync_connector impor
 from .api_client import APIClient
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
+from stix_shifter_utils.utils.token_cache import get_token_cache
 
 
 class Connector(BaseSyncConnector):
@@ -17,6 +18,8 @@ class Connector(BaseSyncConnector):
         :param connection: dict, connection dict
         :param configuration: dict,config dict"""
         self.logger = logger.set_logger(__name__)
+        self.connection = connection
+        self.configuration = configuration
         self.adal_response = Connector.generate_token(connection, configuration)
         if self.adal_response['success']:
             configuration['auth']['access_token'] = self.adal_response['access_token']
@@ -24,6 +27,24 @@ class Connector(BaseSyncConnector):
         else:
             self.init_error = True
 
+    def _call_api(self, call, *args):
+        """Calls the API with the shared token, or with a new one when the data source rejects it: the token
+        may have been revoked before it expires in the token cache
+        :param call: function, method of the API client
+        :param args: arguments of the method
+        :return: response of the API"""
+        response = call(*args)
+        if response.code == 401:
+            resource, credentials = Connector._token_owner(self.connection, self.configuration)
+            get_token_cache().invalidate('azure_sentinel', resource, credentials,
+                                         token=self.adal_response['access_token'])
+            adal_response = Connector.generate_token(self.connection, self.configuration)
+            if adal_response['success']:
+                self.adal_response = adal_response
+                self.api_client.client.headers['Authorization'] = "Bearer " + adal_response['access_token']
+                response = call(*args)
+        return response
+
 
     def ping_connection(self):
         """Ping the endpoint."""
@@ -31,9 +52,9 @@ class Connector(BaseSyncConnector):
         if self.init_error:
             self.logger.error("Token Generation Failed:")
             return self.adal_response
-        response = self.api_client.ping_box()
+        response = self._call_api(self.api_client.ping_box)
         response_code = response.code
-        response_dict = json.loads(response.read())
+        response_dict = json_facade.loads(response.read())
         if 200 <= response_code < 300:
             return_obj['success'] = True
         else:
@@ -66,20 +87,20 @@ class Connector(BaseSyncConnector):
             # check for length value against the max limit(1000) of $top param in data source
             if length <= self.max_limit:
                 # $skip(offset) param not included as data source provides incorrect results for some of the queries
-                response = self.api_client.run_search(query, total_records)
+                response = self._call_api(self.api_client.run_search, query, total_records)
             elif length > self.max_limit:
-                response = self.api_client.run_search(query, self.max_limit)
+                response = self._call_api(self.api_client.run_search, query, self.max_limit)
             response_code = response.code
-            response_dict = json.loads(response.read())
+            response_dict = json_facade.loads(response.read())
             if 199 < response_code < 300:
                 return_obj['success'] = True
                 return_obj['data'] = response_dict['value']
                 while len(return_obj['data']) < total_records:
                     try:
                         next_page_link = response_dict['@odata.nextLink']
-                        response = self.api_client.next_page_run_search(next_page_link)
+                        response = self._call_api(self.api_client.next_page_run_search, next_page_link)
                         response_code = response.code
-                        response_dict = json.loads(response.read())
+                        response_dict = json_facade.loads(response.read())
                         if 199 < response_code < 300:
                             return_obj['data'].extend(response_dict['value'])
                         else:
@@ -122,6 +143,15 @@ class Connector(BaseSyncConnector):
                 raise ex
         return return_obj
 
+    @staticmethod
+    def _token_owner(connection, configuration):
+        """The resource and the credentials the token is cached for
+        :param connection: dict, connection dict
+        :param configuration: dict,config dict"""
+        resource = "https://" + str(connection.get('host'))
+        credentials = {key: configuration['auth'].get(key) for key in ('tenant', 'clientId', 'clientSecret')}
+        return resource, credentials
+
     @staticmethod
     def generate_token(connection, configuration):
         """To generate the Token
@@ -131,9 +161,9 @@ class Connector(BaseSyncConnector):
 
         authority_url = ('https://login.microsoftonline.com/' +
                          configuration['auth']['tenant'])
-        resource = "https://" + str(connection.get('host'))
+        resource, credentials = Connector._token_owner(connection, configuration)
 
-        try:
+        def acquire_token():
             context = adal.AuthenticationContext(
                 authority_url, validate_authority=configuration['auth']['tenant'] != 'adfs',
             )
@@ -141,9 +171,13 @@ class Connector(BaseSyncConnector):
                 resource,
                 configuration['auth']['clientId'],
                 configuration['auth']['clientSecret'])
+            return response_dict['accessToken'], response_dict.get('expiresIn')
 
+        try:
+            # requested once for the connectors of the credentials, until it is about to expire
+            return_obj['access_token'] = get_token_cache().get_token('azure_sentinel', resource, credentials,
+                                                                     acquire_token)
             return_obj['success'] = True
-            return_obj['access_token'] = response_dict['accessToken']
 
         except Exception as ex:
             if ex.__class__.__name__ == 'AdalError':
@@ -313,3 +313,45 @@ class TestAzureSentinalConnection(unittest.TestCase):
         assert status_response is not None
         assert 'success' in status_response
         assert status_response['success'] is True
+
+
+@patch('stix_shifter_utils.stix_transmission.utils.RestApiClient.RestApiClient.call_api', autospec=True)
+@patch('stix_shifter_modules.azure_sentinel.stix_transmission.connector.adal.AuthenticationContext')
+class TestAzureSentinelToken(unittest.TestCase):
+    def config(self):
+        return {
+                "auth": {
+                    "tenant": "abc12345",
+                    "clientId": "abc12345",
+                    "clientSecret": "abc12345",
+                    }
+                }
+
+    def connection(self):
+        return {
+                "host": "abc.amazon.com",
+                "port": 443
+                }
+
+    def test_rejected_token_renewed(self, mock_context, mock_call_api):
+        tokens = iter(['revoked', 'renewed'])
+        mock_context.return_value.acquire_token_with_client_credentials.side_effect = \
+            lambda *args: {'accessToken': next(tokens), 'expiresIn': 3600}
+        authorizations = []
+
+        def call_api(client, endpoint, method, headers=None, **kwargs):
+            authorizations.append(client.headers['Authorization'])
+            if client.headers['Authorization'] == 'Bearer revoked':
+                return AzureSentinelMockResponse(401, '{"error": {"code": "InvalidAuthenticationToken", '
+                                                      '"message": "Access token has expired."}}')
+            return AzureSentinelMockResponse(200, '{"value": [{"id": "1"}]}')
+        mock_call_api.side_effect = call_api
+
+        transmission = stix_transmission.StixTransmission('azure_sentinel', self.connection(), self.config())
+        results_response = transmission.results("$filter=id eq '1'", 0, 1)
+        assert results_response == {'success': True, 'data': [{'id': '1'}]}
+        ping_response = stix_transmission.StixTransmission('azure_sentinel', self.connection(), self.config()).ping()
+        assert ping_response['success']
+
+        assert authorizations == ['Bearer revoked', 'Bearer renewed', 'Bearer renewed']
+        assert mock_context.return_value.acquire_token_with_client_credentials.call_count == 2
@@ -1,6 +1,6 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_query_connector import BaseQueryConnector
 import re
-import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
 
@@ -37,7 +37,7 @@ class QueryConnector(BaseQueryConnector):
             elif ErrorResponder.is_plain_string(response_txt):
                 ErrorResponder.fill_error(return_obj, message=response_txt)
             elif ErrorResponder.is_json_string(response_txt):
-                response_json = json.loads(response_txt)
+                response_json = json_facade.loads(response_txt)
                 ErrorResponder.fill_error(return_obj, response_json, ['arguments'])
             else:
                 raise UnexpectedResponseException
@@ -1,5 +1,6 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector
 import json
+from stix_shifter_utils.utils import json_facade
 import time
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
@@ -30,7 +31,7 @@ class ResultsConnector(BaseResultsConnector):
 
             if 199 < response_code < 300:
                 try:
-                    response_dict = json.loads(response_txt)
+                    response_dict = json_facade.loads(response_txt)
                     return_obj['success'] = self.get_success_status(response_dict)
                     return_obj['data'] = []
                     for computer_obj in response_dict['results']:
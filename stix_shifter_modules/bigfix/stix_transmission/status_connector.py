@@ -1,6 +1,7 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector, Status
 import math
 import json
+from stix_shifter_utils.utils import json_facade
 import re
 import sys
 import time
@@ -80,7 +81,7 @@ class StatusConnector(BaseStatusConnector):
 
             if 199 < response_code < 300:
                 try:
-                    response_dict = json.loads(response_txt)
+                    response_dict = json_facade.loads(response_txt)
                     return_obj['success'] = True
                     return_obj['status'] = Status.RUNNING.value
                     return_obj = self.update_query_status(return_obj, response_dict, client_count)
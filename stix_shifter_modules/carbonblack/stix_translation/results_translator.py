@@ -1,7 +1,6 @@
 from stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix import JSONToStix
 from ..stix_transmission.connector import Connector
 import os
-import json
 
 
 class ResultsTranslator(JSONToStix):
@@ -16,14 +15,14 @@ class ResultsTranslator(JSONToStix):
     def translate_results(self, data_source, data):
         """
         Translates JSON data into STIX results based on a mapping file
-        :param data: JSON formatted data to translate into STIX format
-        :type data: str
+        :param data: JSON formatted data to translate into STIX format, or the already parsed list of records
+        :type data: str or list
         :return: STIX formatted results
         :rtype: str
         """
 
-        results = super().translate_results(data_source, data)
-        json_data = json.loads(data)
+        json_data = self.load_json(data)
+        results = super().translate_results(data_source, json_data)
 
         if len(results['objects']) - 1 == len(json_data):
             for i in range(1, len(results['objects'])):
@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.modules.base.stix_transmission.base_sync_connector import BaseSyncConnector
 from .api_client import APIClient
 from stix_shifter_utils.utils.error_response import ErrorResponder
@@ -40,13 +40,13 @@ class Connector(BaseSyncConnector):
         if 200 <= response_code < 300:
             return_obj['success'] = True
             if response_txt:
-                response_json = json.loads(response_txt)
+                response_json = json_facade.loads(response_txt)
                 if results_key in response_json:
                     return_obj['data'] = response_json[results_key]
         elif ErrorResponder.is_plain_string(response_txt):
             ErrorResponder.fill_error(return_obj, message=response_txt)
         elif ErrorResponder.is_json_string(response_txt):
-            response_json = json.loads(response_txt)
+            response_json = json_facade.loads(response_txt)
             ErrorResponder.fill_error(return_obj, response_json, ['reason'])
         else:
             raise UnexpectedResponseException
@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 
 from stix_shifter_utils.modules.base.stix_transmission.base_delete_connector import BaseDeleteConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
@@ -20,7 +20,7 @@ class DeleteConnector(BaseDeleteConnector):
         try:
             # Successful deletion returns a 204 status code and empty response
             if response_text:
-                response_dict = json.loads(response_text)
+                response_dict = json_facade.loads(response_text)
         except ValueError as ex:
             self.logger.debug(response_text)
             error = Exception(f'Can not parse response: {ex}')
@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 
 from stix_shifter_utils.modules.base.stix_transmission.base_query_connector import BaseQueryConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
@@ -18,7 +18,7 @@ class QueryConnector(BaseQueryConnector):
         response_dict = dict()
 
         try:
-            response_dict = json.loads(response_text)
+            response_dict = json_facade.loads(response_text)
         except ValueError as ex:
             self.logger.debug(response_text)
             error = Exception(f'Can not parse response: {ex}')
@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 
 from enum import Enum
 from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector
@@ -38,7 +38,7 @@ class StatusConnector(BaseStatusConnector):
         response_dict = dict()
 
         try:
-            response_dict = json.loads(response_text)
+            response_dict = json_facade.loads(response_text)
         except ValueError as ex:
             self.logger.debug(response_text)
             error = Exception(f'Can not parse response: {ex}')
@@ -1,5 +1,5 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_delete_connector import BaseDeleteConnector
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 class DeleteConnector(BaseDeleteConnector):
@@ -15,7 +15,7 @@ class DeleteConnector(BaseDeleteConnector):
                 response_json['message'] = "Delete failed"
             else:
                 success = True
-                response_json = json.loads(response.to_json(orient='records'))
+                response_json = json_facade.loads(response.to_json(orient='records'))
         except ValueError as e:
             response_json = {}
             response_json['message'] = repr(e)
@@ -1,5 +1,5 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_connector import BaseQueryConnector
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 class QueryConnector(BaseQueryConnector):
@@ -7,7 +7,7 @@ class QueryConnector(BaseQueryConnector):
         self.api_client = api_client
 
     def create_query_connection(self, query):
-        q = json.loads(query)["query"]
+        q = json_facade.loads(query)["query"]
         # Grab the response, extract the response code,
         # and convert it to readable json
         try:
@@ -1,7 +1,7 @@
 """Apiclient for MSATP"""
 import json
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
-from datetime import datetime, timedelta
+from stix_shifter_utils.utils.token_cache import get_token_cache
 import requests
 
 
@@ -9,6 +9,8 @@ class APIClient:
     INCIDENTS_IDS_ENDPOINT = 'detects/queries/detects/v1'
     INCIDENTS_INFO_ENDPOINT = 'detects/entities/summaries/GET/v1'
     TOKEN_ENDPOINT = 'https://api.crowdstrike.com/oauth2/token'
+    # lifetime of the tokens, when the token response does not give it
+    TOKEN_LIFETIME = 30 * 60
     """API Client to handle all calls."""
 
     def __init__(self, connection, configuration):
@@ -32,7 +34,6 @@ class APIClient:
         self._client_id = auth['client_id']
         self._client_secret = auth['client_secret']
         self._token = None
-        self._token_time = None
 
     def get_detections_IDs(self, filter, limit, sort=None):
         """get the response from MSatp endpoints
@@ -43,20 +44,18 @@ class APIClient:
         data = dict()
         headers['Content-Type'] = 'application/json'
         headers['Accept'] = 'application/json'
-        headers['Authorization'] = f'Bearer {self.get_token()}'
         endpoint = self.INCIDENTS_IDS_ENDPOINT
         data['filter'] = filter
         data['limit'] = limit
         if sort:
             data['sort'] = sort
-        return self.client.call_api(endpoint, 'GET', headers=headers, urldata=data, timeout=self.timeout)
+        return self._call_api(endpoint, 'GET', headers=headers, urldata=data, timeout=self.timeout)
 
     def ping_box(self):
         # Sends a GET request
         headers = dict()
-        headers['Authorization'] = f'Bearer {self.get_token()}'
         endpoint = 'detects/queries/detects/v1'  # Test if system alive
-        return self.client.call_api(endpoint, 'GET', headers=headers, timeout=self.timeout)
+        return self._call_api(endpoint, 'GET', headers=headers, timeout=self.timeout)
 
     def get_detections_info(self, ids):
         """get the response from crowdstrike endpoints
@@ -65,17 +64,31 @@ class APIClient:
         headers = dict()
         headers['Content-Type'] = 'application/json'
         headers['Accept'] = 'application/json'
-        headers['Authorization'] = f'Bearer {self.get_token()}'
         endpoint = self.INCIDENTS_INFO_ENDPOINT
         ids_expression = json.dumps({'ids': ids}).encode("utf-8")
-        return self.client.call_api(endpoint, 'POST', headers=headers, data=ids_expression, timeout=self.timeout)
+        return self._call_api(endpoint, 'POST', headers=headers, data=ids_expression, timeout=self.timeout)
+
+    def _call_api(self, endpoint, method, headers, **kwargs):
+        """Calls the API with the shared token, or with a new one when the data source rejects it: the token
+        may have been revoked before it expires in the token cache
+        :return: response, json object"""
+        headers['Authorization'] = f'Bearer {self.get_token()}'
+        response = self.client.call_api(endpoint, method, headers=headers, **kwargs)
+        if response.code == 401:
+            get_token_cache().invalidate('crowdstrike', self.TOKEN_ENDPOINT, self._credentials(), token=self._token)
+            headers['Authorization'] = f'Bearer {self.get_token()}'
+            response = self.client.call_api(endpoint, method, headers=headers, **kwargs)
+        return response
+
+    def _credentials(self):
+        return {'client_id': self._client_id, 'client_secret': self._client_secret}
 
     def get_token(self) -> str:
-        """Request a new OAuth2 token.
+        """Request a new OAuth2 token, once for the clients of the credentials until it is about to expire.
         :return: [description]
         :rtype: str
         """
-        if self.token_expired():
+        def request_token():
             resp = requests.request(
                 'POST',
                 self.TOKEN_ENDPOINT,
@@ -89,16 +102,9 @@ class APIClient:
                 )
             )
             token = resp.json().get('access_token')
-            self._token = token
-            self._token_time = datetime.now()
-        return self._token
+            # a failed request is not cached
+            return token, resp.json().get('expires_in', self.TOKEN_LIFETIME) if token else None
 
-    def token_expired(self) -> bool:
-        """Check if the OAuth2 token is expired.
-        :return: True if token is expired, False if not expired
-        :rtype: bool
-        """
-        expired = True
-        if self._token:
-            expired = (datetime.now() - self._token_time) >= timedelta(minutes=30)
-        return expired
+        self._token = get_token_cache().get_token('crowdstrike', self.TOKEN_ENDPOINT, self._credentials(),
+                                                  request_token)
+        return self._token
@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.modules.base.stix_transmission.base_sync_connector import BaseSyncConnector
 from .api_client import APIClient
 from stix_shifter_utils.utils.error_response import ErrorResponder
@@ -40,7 +40,7 @@ class Connector(BaseSyncConnector):
             ErrorResponder.fill_error(return_obj, message=response_txt)
             raise Exception(return_obj)
         elif ErrorResponder.is_json_string(response_txt):
-            response_json = json.loads(response_txt)
+            response_json = json_facade.loads(response_txt)
             ErrorResponder.fill_error(return_obj, response_json, ['reason'])
             raise Exception(return_obj)
         else:
@@ -55,8 +55,8 @@ class Connector(BaseSyncConnector):
             response_txt = response.read().decode('utf-8')
             if 199 < response_code < 300:
                 return_obj['success'] = True
-            elif isinstance(json.loads(response_txt), dict):
-                response_error_ping = json.loads(response_txt)
+            elif isinstance(json_facade.loads(response_txt), dict):
+                response_error_ping = json_facade.loads(response_txt)
                 response_dict = response_error_ping['errors'][0]
                 ErrorResponder.fill_error(return_obj, response_dict, ['message'])
             else:
@@ -74,7 +74,7 @@ class Connector(BaseSyncConnector):
         return_obj = dict()
         response = self.api_client.get_detections_info(ids_lst)
         return_obj = self._handle_errors(response, return_obj)
-        response_json = json.loads(return_obj["data"])
+        response_json = json_facade.loads(return_obj["data"])
         return_obj['data'] = response_json['resources']
 
         return return_obj
@@ -153,7 +153,7 @@ class Connector(BaseSyncConnector):
 
             response = self.api_client.get_detections_IDs(query, result_limit)
             self._handle_errors(response, ids_obj)
-            response_json = json.loads(ids_obj["data"])
+            response_json = json_facade.loads(ids_obj["data"])
             ids_obj['ids'] = response_json.get('resources')
 
             if ids_obj['ids']:  # There are not detections that match the filter arg
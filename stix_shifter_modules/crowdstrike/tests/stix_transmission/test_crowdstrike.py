@@ -131,3 +131,41 @@ class TestCrowdStrikeConnection(unittest.TestCase, object):
         assert results_response is not None
         assert 'success' in results_response
         assert results_response['success'] == True
+
+
+class TokenMockResponse:
+    def __init__(self, token):
+        self.token = token
+
+    def json(self):
+        return {'access_token': self.token, 'expires_in': 1799}
+
+
+class PingMockResponse:
+    def __init__(self, code):
+        self.code = code
+
+    def read(self):
+        return b'{}'
+
+
+@patch('stix_shifter_utils.stix_transmission.utils.RestApiClient.RestApiClient.call_api', autospec=True)
+@patch('stix_shifter_modules.crowdstrike.stix_transmission.api_client.requests.request')
+class TestCrowdStrikeToken(unittest.TestCase):
+
+    def test_rejected_token_renewed(self, mock_token_request, mock_call_api):
+        tokens = iter(['revoked', 'renewed'])
+        mock_token_request.side_effect = lambda *args, **kwargs: TokenMockResponse(next(tokens))
+        authorizations = []
+
+        def call_api(client, endpoint, method, headers=None, **kwargs):
+            authorizations.append(headers['Authorization'])
+            return PingMockResponse(401 if headers['Authorization'] == 'Bearer revoked' else 200)
+        mock_call_api.side_effect = call_api
+
+        token_config = {'auth': {'client_id': 'token', 'client_secret': 'test'}}
+        assert EntryPoint(connection, token_config).ping_connection()['success']
+        assert EntryPoint(connection, token_config).ping_connection()['success']
+
+        assert authorizations == ['Bearer revoked', 'Bearer renewed', 'Bearer renewed']
+        assert mock_token_request.call_count == 2
@@ -21,12 +21,6 @@ class QueryTranslator(BaseQueryTranslator):
             raise DataMappingException(
                 "Unable to map object `{}` into SQL".format(stix_object_name))
 
-    def map_field(self, stix_object_name, stix_property_name):
-        if stix_object_name in self.map_data and stix_property_name in self.map_data[stix_object_name]["fields"]:
-            return self.map_data[stix_object_name]["fields"][stix_property_name]
-        else:
-            return []
-
     def map_selections(self):
         # Temporary default selections, this will change based on upcoming config override and the STIX pattern that is getting converted to SQL.
         # ^ is it still relevant?
@@ -10,6 +10,7 @@ class EntryPoint(BaseEntryPoint):
 
         if connection:
             self.setup_transmission_basic(connection, configuration)
+            self.setup_transmission_basic_async(connection, configuration)
 
         dialect = 'default'
         self.setup_translation_simple(dialect_default=dialect, results_translator=ResultTranslator(options, dialect))
\ No newline at end of file
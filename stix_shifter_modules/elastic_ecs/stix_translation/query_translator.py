@@ -8,6 +8,16 @@ logger = logging.getLogger(__name__)
 
 class QueryTranslator(BaseQueryTranslator):
 
+    # Object paths whose IN comparisons are translated like the equivalent ORed equalities
+    SET_COMPARISON_PATHS = frozenset([
+        'ipv4-addr:value', 'ipv6-addr:value', 'mac-addr:value', 'domain-name:value', 'file:name', 'process:name',
+        'file:hashes.MD5', "file:hashes.'SHA-1'", "file:hashes.'SHA-256'", 'user-account:user_id'
+    ])
+
+    def can_merge_set_value(self, value):
+        # values of IN comparisons are not escaped
+        return isinstance(value, str) and query_constructor.QueryStringPatternTranslator._escape_value(value) == value
+
     def transform_antlr(self, data, antlr_parsing_object):
         """
         Transforms STIX query into a different query format. Based on a mapping file
@@ -1,6 +1,5 @@
 from stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix import JSONToStix
 from os import path
-import json
 
 
 class ResultTranslator(JSONToStix):
@@ -11,25 +10,23 @@ class ResultTranslator(JSONToStix):
     def translate_results(self, data_source, data):
         """
         Translates JSON data into STIX results based on a mapping file
-        :param data: JSON formatted data to translate into STIX format
-        :type data: str
+        :param data: JSON formatted data to translate into STIX format, or the already parsed list of records
+        :type data: str or list
         :param mapping: The mapping file path to use as instructions on how to translate the given JSON data to STIX.
             Defaults the path to whatever is passed into the constructor for JSONToSTIX (This should be the to_stix_map.json in the module's json directory)
         :type mapping: str (filepath)
         :return: STIX formatted results
         :rtype: str
         """
-        results = json.loads(data)
-        for result in results:
+        json_data = []
+        for result in self.load_json(data):
             if result.get('event'):
                 event = result['event']
                 if event.get('original'):
-                    result['event']['mime_type_event'] = 'text/plain'
-        
-        data = json.dumps(results, indent=4)
+                    result = dict(result, event=dict(event, mime_type_event='text/plain'))
+            json_data.append(result)
 
-        results = super().translate_results(data_source, data)
-        json_data = json.loads(data)
+        results = super().translate_results(data_source, json_data)
 
         if len(results['objects']) - 1 == len(json_data):
             for i in range(1, len(results['objects'])):
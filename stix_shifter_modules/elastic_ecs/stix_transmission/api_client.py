@@ -1,5 +1,6 @@
 import base64
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
+from stix_shifter_utils.stix_transmission.utils.AsyncRestApiClient import AsyncRestApiClient
 from stix_shifter_utils.utils import logger
 import json
 import re
@@ -9,6 +10,7 @@ DEFAULT_LIMIT = 10000
 
 class APIClient():
     PING_ENDPOINT = '_cluster/health?pretty'
+    rest_client_class = RestApiClient
 
     def __init__(self, connection, configuration):
         self.logger = logger.set_logger(__name__)
@@ -39,13 +41,14 @@ class APIClient():
             elif 'access_token' in auth:
                 headers['Authorization'] = "Bearer " + auth['access_token']
 
-        self.client = RestApiClient(connection.get('host'),
-                                    connection.get('port'),
-                                    headers,
-                                    url_modifier_function=url_modifier_function,
-                                    cert_verify=connection.get('selfSignedCert', True),
-                                    sni=connection.get('sni', None)
-                                    )
+        self.client = self.rest_client_class(connection.get('host'),
+                                             connection.get('port'),
+                                             headers,
+                                             url_modifier_function=url_modifier_function,
+                                             cert_verify=connection.get('selfSignedCert', True),
+                                             sni=connection.get('sni', None),
+                                             pool_size=connection['options'].get('connection_pool_size')
+                                             )
         
         self.timeout = connection['options'].get('timeout')
 
@@ -104,3 +107,8 @@ class APIClient():
             self.logger.debug("URL data: " + json.dumps(data))
 
             return self.client.call_api(endpoint, 'GET', headers, data=json.dumps(data), timeout=self.timeout)
+
+
+class AsyncAPIClient(APIClient):
+    # The methods return coroutines of the responses, to await
+    rest_client_class = AsyncRestApiClient
@@ -1,6 +1,7 @@
-from stix_shifter_utils.modules.base.stix_transmission.base_sync_connector import BaseSyncConnector
-from .api_client import APIClient
-import json
+from stix_shifter_utils.modules.base.stix_transmission.base_sync_connector import BaseSyncConnector, \
+    BaseAsyncSyncConnector
+from .api_client import APIClient, AsyncAPIClient
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
 
@@ -24,12 +25,25 @@ class Connector(BaseSyncConnector):
         elif ErrorResponder.is_plain_string(response_txt):
             ErrorResponder.fill_error(return_obj, message=response_txt)
         elif ErrorResponder.is_json_string(response_txt):
-            response_json = json.loads(response_txt)
+            response_json = json_facade.loads(response_txt)
             ErrorResponder.fill_error(return_obj, response_json, ['reason'])
         else:
             raise UnexpectedResponseException
         return return_obj
 
+    def _handle_results(self, response, return_obj):
+        return_obj = self._handle_errors(response, return_obj)
+
+        if (return_obj['success']):
+            response_json = json_facade.loads(return_obj["data"])
+            if response_json['hits']:
+                # and (response_json['hits']['total']['value'] >= 0 or response_json['hits']['total'] >= 0):
+                self.logger.error("Total # of hits:" + str(response_json['hits']['total']))
+                return_obj['data'] = [record['_source'] for record in response_json["hits"]["hits"]]
+                self.logger.error("Total # of records: " + str(len(return_obj['data'])))
+
+        return return_obj
+
     def ping_connection(self):
         response_txt = None
         return_obj = dict()
@@ -49,20 +63,24 @@ class Connector(BaseSyncConnector):
 
         try:
             response = self.api_client.run_search(query, offset, length)
-            return_obj = self._handle_errors(response, return_obj)
-
-            if (return_obj['success']):
-                response_json = json.loads(return_obj["data"])
-                if response_json['hits']:
-                    # and (response_json['hits']['total']['value'] >= 0 or response_json['hits']['total'] >= 0):
-                    self.logger.error("Total # of hits:" + str(response_json['hits']['total']))
-                    return_obj['data'] = [record['_source'] for record in response_json["hits"]["hits"]]
-                    self.logger.error("Total # of records: " + str(len(return_obj['data'])))
-
-            return return_obj
+            return self._handle_results(response, return_obj)
         except Exception as e:
             if response_txt is not None:
                 ErrorResponder.fill_error(return_obj, message='unexpected exception')
                 self.logger.error('can not parse response: ' + str(response_txt))
             else:
                 raise e
+
+
+class AsyncConnector(BaseAsyncSyncConnector, Connector):
+    def __init__(self, connection, configuration):
+        self.api_client = AsyncAPIClient(connection, configuration)
+        self.logger = logger.set_logger(__name__)
+
+    async def ping_connection(self):
+        response = await self.api_client.ping_box()
+        return self._handle_errors(response, dict())
+
+    async def create_results_connection(self, query, offset, length):
+        response = await self.api_client.run_search(query, offset, length)
+        return self._handle_results(response, dict())
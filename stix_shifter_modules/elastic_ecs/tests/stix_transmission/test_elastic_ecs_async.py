@@ -0,0 +1,67 @@
+from stix_shifter_utils.stix_transmission.utils import AsyncRestApiClient
+from stix_shifter.stix_transmission import stix_transmission
+from unittest.mock import patch
+import json
+import unittest
+import pytest
+import sys
+
+if sys.version_info < (3, 8):
+    # the async connectors require aiohttp, which requires Python 3.8
+    pytest.skip('IsolatedAsyncioTestCase and AsyncMock require Python 3.8', allow_module_level=True)
+
+from unittest.mock import AsyncMock  # noqa: E402
+
+config = {
+    "auth": {
+        "username": "bla",
+        "password": "bla"
+    }
+}
+connection = {
+    "host": "hostbla",
+    "port": 8080,
+    "indices": "index1,index2"
+}
+
+
+class ElasticEcsMockResponse:
+    def __init__(self, response_code, object):
+        self.code = response_code
+        self.object = object
+
+    def read(self):
+        return bytearray(self.object, 'utf-8')
+
+
+@unittest.skipIf(AsyncRestApiClient.aiohttp is None, 'the async connectors require aiohttp')
+@patch('stix_shifter_modules.elastic_ecs.stix_transmission.api_client.APIClient.__init__', autospec=True)
+class TestElasticEcsAsyncConnection(unittest.IsolatedAsyncioTestCase):
+
+    @patch('stix_shifter_modules.elastic_ecs.stix_transmission.api_client.AsyncAPIClient.ping_box',
+           new_callable=AsyncMock)
+    async def test_ping_endpoint(self, mock_ping_response, mock_api_client):
+        mock_api_client.return_value = None
+        mock_ping_response.return_value = ElasticEcsMockResponse(200, '{"status": "green"}')
+
+        transmission = stix_transmission.StixTransmission('elastic_ecs', connection, config)
+        ping_response = await transmission.ping_async()
+
+        assert ping_response['success']
+
+    @patch('stix_shifter_modules.elastic_ecs.stix_transmission.api_client.AsyncAPIClient.run_search',
+           new_callable=AsyncMock)
+    async def test_query_flow(self, mock_results_response, mock_api_client):
+        mock_api_client.return_value = None
+        hits = {"hits": {"total": 1, "hits": [{"_source": {"source": {"ip": "10.0.0.1"}}}]}}
+        mock_results_response.return_value = ElasticEcsMockResponse(200, json.dumps(hits))
+
+        transmission = stix_transmission.StixTransmission('elastic_ecs', connection, config)
+        query_response = await transmission.query_async('source.ip:10.0.0.1')
+        status_response = await transmission.status_async(query_response['search_id'])
+        results_response = await transmission.results_async(query_response['search_id'], 0, 1)
+
+        assert query_response == {'success': True, 'search_id': 'source.ip:10.0.0.1'}
+        assert status_response['status'] == 'COMPLETED'
+        assert results_response == {'success': True, 'data': [{'source': {'ip': '10.0.0.1'}}]}
+        mock_results_response.assert_awaited_once_with('source.ip:10.0.0.1', 0, 1)
@@ -1,6 +1,5 @@
 from stix_shifter_utils.modules.base.stix_translation.base_results_translator import BaseResultTranslator
 from stix_shifter_utils.stix_translation.src.utils.exceptions import TranslationResultException
-import json
 import uuid
 
 ERROR_TYPE_TRANSLATE_EXCEPTION = 'translate_exception'
@@ -22,13 +21,10 @@ class ResultsTranslator(BaseResultTranslator):
             "objects": []
         }
 
-        data_source = json.loads(data_source)
+        data_source = self.load_json(data_source)
         bundle['objects'] += [data_source]
         # Data is already STIX and we don't want to touch it
-        bundle_data = json.loads(data)
-
-        for obs in bundle_data:
-            obs["created_by_ref"] = data_source['id']
+        bundle_data = [dict(obs, created_by_ref=data_source['id']) for obs in self.load_json(data)]
 
         bundle['objects'] += bundle_data
         return bundle
@@ -3,7 +3,7 @@ from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClie
 from stix2matcher.matcher import Pattern
 from stix2matcher.matcher import MatchListener
 from stix2validator import validate_instance
-import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.utils.error_response import ErrorResponder
 import time
 
@@ -80,14 +80,14 @@ class Connector(BaseSyncConnector):
             if ErrorResponder.is_plain_string(response_txt):
                 ErrorResponder.fill_error(return_obj, message=response_txt)
             elif ErrorResponder.is_json_string(response_txt):
-                response_json = json.loads(response_txt)
+                response_json = json_facade.loads(response_txt)
                 ErrorResponder.fill_error(return_obj, response_json, ['reason'])
             else:
                 raise UnexpectedResponseException
         else:
             try:
                 response_txt = response.read().decode('utf-8')
-                bundle = json.loads(response_txt)
+                bundle = json_facade.loads(response_txt)
 
                 if "stix_validator" in self.connection['options'] and self.connection['options'].get("stix_validator") is True:
                     results = validate_instance(bundle)
@@ -1,5 +1,6 @@
 import re
 import json
+from stix_shifter_utils.utils import json_facade
 import datetime
 import copy
 from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import ObservationExpression, ComparisonExpression, \
@@ -106,7 +107,7 @@ class QueryStringPatternTranslator:
         regex8 = r"'"
         out_str = "[" + re.sub(regex8, '"', out_str, 0) + "]"
 
-        return json.loads(out_str)
+        return json_facade.loads(out_str)
 
     def transform_qsearch_call_to_json(self, qsearch_call):
         # Convert the report call (string) into an array of JSON.  Note, inside each json obj multiple key/value parmeter are "OR"
@@ -140,7 +141,7 @@ class QueryStringPatternTranslator:
         regex8 = r"'"
         out_str = "[" + re.sub(regex8, '"', out_str, 0) + "]"
 
-        return json.loads(out_str)
+        return json_facade.loads(out_str)
 
     # Guardium report parameters are "AND"ed in a Gaurdium query.
     # Our Json object array contains multiple json objects.  Each object may have one or many key/value pairs -- these are report params
@@ -306,7 +307,7 @@ class QueryStringPatternTranslator:
 
     def set_filters_format(self, qse):
         for i in range(len(qse)):
-            filters = json.loads(qse[i])["filters"]
+            filters = json_facade.loads(qse[i])["filters"]
             qse_prefix = qse[i][0:str.find(qse[i], "filters") - 1:1]
             qse_suffix = qse[i][str.find(qse[i], ", \"query")::1]
             str_filters = ''
@@ -327,7 +328,7 @@ class QueryStringPatternTranslator:
 
     def set_query_format(self, qse):
         for i in range(len(qse)):
-            query = json.loads(qse[i])["query"]
+            query = json_facade.loads(qse[i])["query"]
             qse_prefix = qse[i][0:str.find(qse[i], "query") - 1:1]
             qse_suffix = qse[i][str.find(qse[i], ", \"fetchSize")::1]
             str_query = ''
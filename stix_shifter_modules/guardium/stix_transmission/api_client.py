@@ -3,6 +3,7 @@ from stix_shifter_utils.stix_transmission.utils.RestApiClient import ResponseWra
 from stix_shifter_utils.utils import logger
 from requests.models import Response
 import json
+from stix_shifter_utils.utils import json_facade
 import base64
 
 
@@ -136,10 +137,11 @@ class APIClient():
             # possibility that the token returned is only valid for a second and response_code = 401 is returned.
             # Catch that situation (though remote) and process again.
             if status_code != 200:
-                error_msg = json.loads(str(response.read(), 'utf-8'))
+                error_msg = json_facade.loads(str(response.read(), 'utf-8'))
                 error_code = error_msg.get('error', None)
                 if status_code == 401 and error_code == "invalid_token":
                     self.authorization = None
+                    self.client_aux.invalidate_token()
                     if self.client_aux.get_token():
                         response = self.client_aux.handle_report(self.query, indx, fetch_size)
                         status_code = response.response.status_code
@@ -164,12 +166,12 @@ class APIClient():
         # These value (self.credential, self.query) must be present.  self.authorization may not.
         try:
             id_dec64 = base64.b64decode(self.search_id)
-            jObj = json.loads(id_dec64.decode('utf-8'))
+            jObj = json_facade.loads(id_dec64.decode('utf-8'))
         except:
             raise IOError(
                 3001, "Could not decode search id content - " + self.search_id)
 
-        self.query = json.loads(jObj.get("query", None))
+        self.query = json_facade.loads(jObj.get("query", None))
         self.credential = jObj.get("credential", None)
         self.authorization = jObj.get("authorization", None)
         return
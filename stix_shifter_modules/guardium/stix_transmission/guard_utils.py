@@ -2,11 +2,13 @@ import argparse
 import datetime
 import hashlib
 import json
+from stix_shifter_utils.utils import json_facade
 import re
 import sys
 import traceback
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
 from stix_shifter_utils.utils import logger
+from stix_shifter_utils.utils.token_cache import get_token_cache
 
 
 class GuardApiClient(RestApiClient):
@@ -53,7 +55,7 @@ class GuardApiClient(RestApiClient):
             file = open("./last_run", "r")
             try:
                 text = file.read()
-                from_file = json.loads(text)
+                from_file = json_facade.loads(text)
             finally:
                 file.close()
         except:
@@ -90,11 +92,25 @@ class GuardApiClient(RestApiClient):
         # print("secret="+self.secret)
         # print("user="+self.user)
         # print("password="+self.password)
-        response = self.request_token()
-        # if self.validate_response(response, "token ", True):
-        self.access_token = json.loads(response.read())['access_token']
+        def fetch_token():
+            response = self.request_token()
+            # if self.validate_response(response, "token ", True):
+            token = json_facade.loads(response.read())
+            return token['access_token'], token.get('expires_in')
+
+        # requested once for the clients of the credentials, until it is about to expire
+        self.access_token = get_token_cache().get_token('guardium', self.url, self._credentials(), fetch_token)
         # print("token="+ self.access_token)
         self.headers = {'Content-Type': 'application/json', 'Authorization': 'Bearer {0}'.format(self.access_token)}
+        return self.access_token
+
+    def invalidate_token(self):
+        # the token was rejected before it expires in the token cache
+        get_token_cache().invalidate('guardium', self.url, self._credentials(), token=self.access_token)
+
+    def _credentials(self):
+        return {'client_id': self.client_id, 'client_secret': self.secret, 'username': self.user,
+                'password': self.password}
 
     def request_token(self):
         self.token_data = 'client_id={0}&grant_type=password&client_secret={1}&username={2}&password={3}'.format(
@@ -170,7 +186,7 @@ class GuardApiClient(RestApiClient):
                     response = self.client.call_api(self.qs_target, 'POST', data=rest_data, headers=self.headers)
             except:
                 pass
-        response.content = self.translate_response(json.loads(self.fields), json.loads(response.read()))
+        response.content = self.translate_response(json_facade.loads(self.fields), json_facade.loads(response.read()))
         return response
 
     def get_field_titles(self):
@@ -178,9 +194,9 @@ class GuardApiClient(RestApiClient):
         response = self.client.call_api(self.fields_target, 'GET', headers=self.headers)
         # response = requests.get(self.url + self.fields_target, headers=self.headers, verify=False)
         try:
-            msg = json.loads(response.read())["Message"]
+            msg = json_facade.loads(response.read())["Message"]
         except Exception as e:
-            self.fields = json.dumps(json.loads(response.read())[0])
+            self.fields = json.dumps(json_facade.loads(response.read())[0])
             return
         self.fields = msg
 
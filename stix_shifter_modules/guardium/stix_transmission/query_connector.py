@@ -1,7 +1,7 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_query_connector import BaseQueryConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
-import json
+from stix_shifter_utils.utils import json_facade
 
 class QueryConnector(BaseQueryConnector):
     def __init__(self, api_client):
@@ -14,7 +14,7 @@ class QueryConnector(BaseQueryConnector):
             response = self.api_client.create_search(query)
 
             response_code = response.code
-            response_dict = json.loads(response.read())
+            response_dict = json_facade.loads(response.read())
 
             # Construct a response object
             return_obj= dict()
@@ -2,6 +2,7 @@ from stix_shifter_utils.modules.base.stix_transmission.base_results_connector im
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
 import json
+from stix_shifter_utils.utils import json_facade
 
 
 class ResultsConnector(BaseResultsConnector):
@@ -22,9 +23,9 @@ class ResultsConnector(BaseResultsConnector):
             if response_code == 200:
                 return_obj['success'] = True
                 if hasattr(response,'content'):
-                    data= json.loads(response.content)
+                    data= json_facade.loads(response.content)
                 else:    
-                    data = json.loads(response.read())
+                    data = json_facade.loads(response.read())
                 #print("+++++++++++++++++data ="+json.dumps(data))    
                 if type(data) == dict and 'ID' in data.keys() and 'Message' in data.keys() and data['ID'] == 0 and\
                         'The Query did not retrieve any records' == data['Message']:
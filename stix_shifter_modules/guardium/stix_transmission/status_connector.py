@@ -1,7 +1,7 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector
 from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import Status
 from enum import Enum
-import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.utils.error_response import ErrorResponder
 
 class GuardiumStatus(Enum):
@@ -34,7 +34,7 @@ class StatusConnector(BaseStatusConnector):
         # Verify the input
         response = self.api_client.get_status(search_id)
         response_code = response.code
-        response_dict = json.loads(response.read())
+        response_dict = json_facade.loads(response.read())
 
         # Construct a response object
         return_obj = dict()
@@ -1,6 +1,4 @@
 # -*- coding: utf-8 -*-
-import json
-
 from stix_shifter_utils.stix_translation.src.json_to_stix import json_to_stix_translator
 from stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix import JSONToStix
 from stix_shifter_utils.stix_translation.src.utils.exceptions import LoadJsonResultsException, TranslationResultException
@@ -13,8 +11,8 @@ class ResultsTranslator(JSONToStix):
 
     def translate_results(self, data_source, data):
         try:
-            json_data = json.loads(data)
-            data_source = json.loads(data_source)
+            json_data = self.load_json(data)
+            data_source = self.load_json(data_source)
         except Exception as exc:
             raise LoadJsonResultsException() from exc
 
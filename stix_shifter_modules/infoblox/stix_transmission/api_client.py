@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
 from stix_shifter_utils.utils import logger
@@ -46,7 +46,7 @@ class APIClient:
         # Return the search results. Results must be in JSON format before being translated into STIX
         # endpoint = self.endpoint_start + '/api/dnsdata/v2/dns_event'
 
-        payload = json.loads(search_id)
+        payload = json_facade.loads(search_id)
         if payload['source'] == 'dnsEventData':
             return self._get_dnseventdata_results(search_id, range_start, range_end)
         elif payload['source'] == 'dossierData':
@@ -62,7 +62,7 @@ class APIClient:
         headers = dict()
         headers['Content-Type'] = 'application/json'
         headers['Accept'] = 'application/json'
-        payload = json.loads(search_id)
+        payload = json_facade.loads(search_id)
         resp_dict = dict()
         resp_dict["data"] = []
 
@@ -78,14 +78,14 @@ class APIClient:
                 if resp.code == 401:
                     resp_dict["message"] = resp.read().decode("utf-8")
                 else:
-                    response_payload = json.loads(resp.read())
+                    response_payload = json_facade.loads(resp.read())
                     resp_dict["message"] = "\n".join([error["message"] for error in response_payload["error"]])
 
                 del resp_dict["data"]
                 return resp_dict
 
             # successful request, append data to collection and recalculate offset
-            response_payload = json.loads(resp.read())
+            response_payload = json_facade.loads(resp.read())
             if "result" not in response_payload or len(response_payload["result"]) == 0:
                 self.logger.debug("No additional results found")
                 break
@@ -112,7 +112,7 @@ class APIClient:
         headers = dict()
         headers['Content-Type'] = 'application/json'
         headers['Accept'] = 'application/json'
-        payload = json.loads(search_id)
+        payload = json_facade.loads(search_id)
         resp_dict = dict()
         resp_dict["data"] = []
         start = range_start if range_start else 0
@@ -127,12 +127,12 @@ class APIClient:
             if resp.code == 401:
                 resp_dict["message"] = resp.read().decode("utf-8")
             else:
-                response_payload = json.loads(resp.read())
+                response_payload = json_facade.loads(resp.read())
                 resp_dict["message"] = response_payload["error"]
             del resp_dict["data"]
             return resp_dict
 
-        response_payload = json.loads(resp.read())
+        response_payload = json_facade.loads(resp.read())
         for i in response_payload["results"]:
             for j in i["data"]["items"]:
                 restructure_payload = {'job': {'create_time': response_payload['job']['create_time']},'results': [{'data': {'items': [j]}}]}
@@ -154,7 +154,7 @@ class APIClient:
         headers = dict()
         headers['Content-Type'] = 'application/json'
         headers['Accept'] = 'application/json'
-        payload = json.loads(search_id)
+        payload = json_facade.loads(search_id)
         resp_dict = dict()
         resp_dict["data"] = []
 
@@ -177,12 +177,12 @@ class APIClient:
             if resp.code == 401:
                 resp_dict["message"] = resp.read().decode("utf-8")
             else:
-                response_payload = json.loads(resp.read())
+                response_payload = json_facade.loads(resp.read())
                 resp_dict["message"] = response_payload["error"]
             del resp_dict["data"]
             return resp_dict
 
-        response_payload = json.loads(resp.read())
+        response_payload = json_facade.loads(resp.read())
         for i in response_payload["threat"]:
             resp_dict["data"].append({"tideDbData": i})
 
@@ -8,6 +8,17 @@ logger = logging.getLogger(__name__)
 
 class QueryTranslator(BaseQueryTranslator):
 
+    # Object paths whose IN comparisons (in~) are translated like the equivalent ORed equalities (=~),
+    # mac addresses and ports are not: their equalities are converted first
+    SET_COMPARISON_PATHS = frozenset([
+        'ipv4-addr:value', 'ipv6-addr:value', 'url:value', 'domain-name:value', 'file:name', 'process:name',
+        'file:hashes.MD5', "file:hashes.'SHA-1'", "file:hashes.'SHA-256'", 'user-account:user_id'
+    ])
+
+    def can_merge_set_value(self, value):
+        # quotes are dropped from the values of IN comparisons
+        return isinstance(value, str) and "'" not in value and '"' not in value
+
     def transform_antlr(self, data, antlr_parsing_object):
         """
         Transforms STIX query into KQL query format. Based on a mapping file
@@ -1,9 +1,10 @@
-import json
+from stix_shifter_utils.utils import json_facade
 import adal
 from stix_shifter_utils.modules.base.stix_transmission.base_sync_connector import BaseSyncConnector
 from .api_client import APIClient
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
+from stix_shifter_utils.utils.token_cache import get_token_cache
 import copy
 
 
@@ -17,6 +18,8 @@ class Connector(BaseSyncConnector):
         :param configuration: dict,config dict"""
         
         try:
+            self.connection = connection
+            self.configuration = configuration
             self.token = Connector.generate_token(connection, configuration)
             configuration['auth']['access_token'] = self.token
             self.api_client = APIClient(connection, configuration)
@@ -24,6 +27,21 @@ class Connector(BaseSyncConnector):
         except Exception as ex:
             self.init_error = ex
 
+    def _call_api(self, call, *args):
+        """Calls the API with the shared token, or with a new one when the data source rejects it: the token
+        may have been revoked before it expires in the token cache
+        :param call: function, method of the API client
+        :param args: arguments of the method
+        :return: response of the API"""
+        response = call(*args)
+        if response.code == 401:
+            resource, credentials = Connector._token_owner(self.connection, self.configuration)
+            get_token_cache().invalidate('msatp', resource, credentials, token=self.token)
+            self.token = Connector.generate_token(self.connection, self.configuration)
+            self.api_client.client.headers['Authorization'] = "Bearer " + self.token
+            response = call(*args)
+        return response
+
     @staticmethod
     def _handle_errors(response, return_obj):
         """Handling API error response
@@ -41,7 +59,7 @@ class Connector(BaseSyncConnector):
             ErrorResponder.fill_error(return_obj, message=response_txt)
             raise Exception(return_obj)
         elif ErrorResponder.is_json_string(response_txt):
-            response_json = json.loads(response_txt)
+            response_json = json_facade.loads(response_txt)
             ErrorResponder.fill_error(return_obj, response_json, ['reason'])
             raise Exception(return_obj)
         else:
@@ -52,7 +70,7 @@ class Connector(BaseSyncConnector):
         return_obj = dict()
         if self.init_error:
             raise self.init_error
-        response = self.api_client.ping_box()
+        response = self._call_api(self.api_client.ping_box)
         response_code = response.code
         if 200 <= response_code < 300:
             return_obj['success'] = True
@@ -77,9 +95,9 @@ class Connector(BaseSyncConnector):
         try:
             if self.init_error:
                 raise self.init_error
-            response = self.api_client.run_search(query, offset, length)
+            response = self._call_api(self.api_client.run_search, query, offset, length)
             return_obj = self._handle_errors(response, return_obj)
-            response_json = json.loads(return_obj["data"])
+            response_json = json_facade.loads(return_obj["data"])
             return_obj['data'] = response_json['Results']
             # Customizing the output json,
             # Get 'TableName' attribute from each row of event data
@@ -115,6 +133,15 @@ class Connector(BaseSyncConnector):
             else:
                 raise ex
 
+    @staticmethod
+    def _token_owner(connection, configuration):
+        """The resource and the credentials the token is cached for
+        :param connection: dict, connection dict
+        :param configuration: dict,config dict"""
+        resource = "https://" + str(connection.get('host'))
+        credentials = {key: configuration['auth'].get(key) for key in ('tenant', 'clientId', 'clientSecret')}
+        return resource, credentials
+
     @staticmethod
     def generate_token(connection, configuration):
         """To generate the Token
@@ -123,9 +150,9 @@ class Connector(BaseSyncConnector):
 
         authority_url = ('https://login.windows.net/' +
                          configuration['auth']['tenant'])
-        resource = "https://" + str(connection.get('host'))
+        resource, credentials = Connector._token_owner(connection, configuration)
 
-        try:
+        def acquire_token():
             context = adal.AuthenticationContext(
                 authority_url, validate_authority=configuration['auth']['tenant'] != 'adfs',
             )
@@ -133,9 +160,11 @@ class Connector(BaseSyncConnector):
                 resource,
                 configuration['auth']['clientId'],
                 configuration['auth']['clientSecret'])
+            return token['accessToken'], token.get('expiresIn')
 
-            token_value = token['accessToken']
-            return token_value
+        try:
+            # requested once for the connectors of the credentials, until it is about to expire
+            return get_token_cache().get_token('msatp', resource, credentials, acquire_token)
 
         except Exception as ex:
             return_obj = dict()
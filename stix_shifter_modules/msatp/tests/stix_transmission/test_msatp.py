@@ -254,3 +254,41 @@ class TestMSATPConnection(unittest.TestCase):
         assert status_response is not None
         assert 'success' in status_response
         assert status_response['success'] is True
+
+
+@patch('stix_shifter_utils.stix_transmission.utils.RestApiClient.RestApiClient.call_api', autospec=True)
+@patch('stix_shifter_modules.msatp.stix_transmission.connector.adal.AuthenticationContext')
+class TestMSATPToken(unittest.TestCase):
+    def config(self):
+        return {
+            "auth": {
+                "tenant": "bla",
+                "clientId": "bla",
+                "clientSecret": "bla"
+            }
+        }
+
+    def connection(self):
+        return {
+            "host": "hostbla",
+            "port": 8080
+            }
+
+    def test_rejected_token_renewed(self, mock_context, mock_call_api):
+        tokens = iter(['revoked', 'renewed'])
+        mock_context.return_value.acquire_token_with_client_credentials.side_effect = \
+            lambda *args: {'accessToken': next(tokens), 'expiresIn': 3600}
+        authorizations = []
+
+        def call_api(client, endpoint, method, **kwargs):
+            authorizations.append(client.headers['Authorization'])
+            return MSATPMockResponse(401 if client.headers['Authorization'] == 'Bearer revoked' else 200, '{}')
+        mock_call_api.side_effect = call_api
+
+        ping_response = stix_transmission.StixTransmission('msatp', self.connection(), self.config()).ping()
+        assert ping_response['success']
+        ping_response = stix_transmission.StixTransmission('msatp', self.connection(), self.config()).ping()
+        assert ping_response['success']
+
+        assert authorizations == ['Bearer revoked', 'Bearer renewed', 'Bearer renewed']
+        assert mock_context.return_value.acquire_token_with_client_credentials.call_count == 2
@@ -60,11 +60,8 @@ class APIClient():
             results_list = []
 
             # Put table data in JSON format
-            for tuple in result_collection:
-                results_object = {}
-                for index, datum in enumerate(tuple):
-                    results_object[column_list[index]] = datum
-                results_list.append(results_object)
+            for row in result_collection:
+                results_list.append(dict(zip(column_list, row)))
 
             response["result"] = results_list
 
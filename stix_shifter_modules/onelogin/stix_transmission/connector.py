@@ -1,5 +1,6 @@
 import datetime
 import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.modules.base.stix_transmission.base_sync_connector import BaseSyncConnector
 from .api_client import APIClient
 from stix_shifter_utils.utils.error_response import ErrorResponder
@@ -47,7 +48,7 @@ class Connector(BaseSyncConnector):
             event_list = []
             for event in response.get("data", []):
                 event = json.dumps(event.__dict__, default=Connector.default)
-                event_list.append(json.loads(event))
+                event_list.append(json_facade.loads(event))
             return_obj = dict()
             if response_code == 200:
                 return_obj['success'] = True
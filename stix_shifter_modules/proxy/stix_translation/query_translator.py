@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 from .utils import unwrap_connection_options
 from stix_shifter_utils.modules.base.stix_translation.empty_query_translator import EmptyQueryTranslator
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
@@ -19,12 +19,12 @@ class QueryTranslator(EmptyQueryTranslator):
         connection, configuration = unwrap_connection_options(self.options)
 
         client = RestApiClient(proxy_host, proxy_port, url_modifier_function=lambda host_port, endpoint, headers: f'https://{host_port}{endpoint}', cert_verify=self.options.get('proxy_cert'))
-        response = client.call_api('/parse_query', 'POST', data=json.dumps({'module': connection['type'],
+        response = client.call_api('/parse_query', 'POST', data=json_facade.encode_bytes({'module': connection['type'],
                                                                             'data_source': {},
                                                                             'data': data,
                                                                             'options': connection['options']}),
                                    timeout=self.options.get('timeout'))
-        return json.loads(response.bytes)
+        return json_facade.loads(response.bytes)
 
     def transform_query(self, data):
         # A proxy translation call passes the entire data source connection object in as the options
@@ -35,9 +35,9 @@ class QueryTranslator(EmptyQueryTranslator):
         connection, configuration = unwrap_connection_options(self.options)
 
         client = RestApiClient(proxy_host, proxy_port, url_modifier_function=lambda host_port, endpoint, headers: f'https://{host_port}{endpoint}', cert_verify=self.options.get('proxy_cert'))
-        response = client.call_api('/transform_query', 'POST', data=json.dumps({'module': connection['type'],
+        response = client.call_api('/transform_query', 'POST', data=json_facade.encode_bytes({'module': connection['type'],
                                                                                 'data_source': {},
                                                                                 'data': data,
                                                                                 'options': connection['options']}),
                                    timeout=self.options.get('timeout'))
-        return json.loads(response.bytes)
+        return json_facade.loads(response.bytes)
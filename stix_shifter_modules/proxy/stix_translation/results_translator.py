@@ -1,4 +1,4 @@
-import json
+from stix_shifter_utils.utils import json_facade
 from .utils import unwrap_connection_options
 from stix_shifter_utils.modules.base.stix_translation.base_results_translator import BaseResultTranslator
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
@@ -16,7 +16,12 @@ class ResultsTranslator(BaseResultTranslator):
         proxy_port = self.options['proxy_port']
 
         connection, configuration = unwrap_connection_options(self.options)
+        # the proxy service receives the data source and data as JSON text
+        if not isinstance(data_source, str):
+            data_source = json_facade.encode(data_source)
+        if not isinstance(data, str):
+            data = json_facade.encode(data)
 
         client = RestApiClient(proxy_host, proxy_port, url_modifier_function=lambda host_port, endpoint, headers: f'https://{host_port}{endpoint}', cert_verify=self.options.get('proxy_cert'))
-        response = client.call_api('/translate_results', 'POST', data=json.dumps({'module': connection['type'], "data_source": data_source, "data": data, "options": connection['options']}), timeout=self.options.get('timeout'))
-        return json.loads(response.bytes)
+        response = client.call_api('/translate_results', 'POST', data=json_facade.encode_bytes({'module': connection['type'], "data_source": data_source, "data": data, "options": connection['options']}), timeout=self.options.get('timeout'))
+        return json_facade.loads(response.bytes)
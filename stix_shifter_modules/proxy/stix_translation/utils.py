@@ -1,11 +1,11 @@
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 def unwrap_connection_options(options):
     destination_params = options.get('destination')
     if type(destination_params) == str:
         if len(destination_params):
-            destination_params = json.loads(destination_params)
+            destination_params = json_facade.loads(destination_params)
         else:
             destination_params = {}
     return destination_params['connection'], destination_params['configuration']
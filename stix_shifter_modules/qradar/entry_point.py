@@ -8,6 +8,7 @@ class EntryPoint(BaseEntryPoint):
         super().__init__(connection, configuration, options)
         if connection:
             self.setup_transmission_simple(connection, configuration)
+            self.setup_transmission_simple_async(connection, configuration)
 
         self.setup_translation_simple(dialect_default='flows')
         dialect = 'aql'
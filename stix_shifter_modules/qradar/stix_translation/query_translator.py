@@ -8,6 +8,14 @@ logger = logging.getLogger(__name__)
 
 class QueryTranslator(BaseQueryTranslator):
 
+    # Object paths whose IN comparisons are translated like the equivalent ORed equalities,
+    # domain-name:value is not one of them since its equalities are translated to LIKE
+    SET_COMPARISON_PATHS = frozenset([
+        'ipv4-addr:value', 'ipv6-addr:value', 'mac-addr:value', 'url:value', 'file:name', 'process:name',
+        'file:hashes.MD5', "file:hashes.'SHA-1'", "file:hashes.'SHA-256'", 'user-account:user_id',
+        'network-traffic:src_port', 'network-traffic:dst_port'
+    ])
+
     def __init__(self, options, dialect, basepath):
         super().__init__(options, dialect, basepath)
         self.select_fields = read_json(f"aql_{self.dialect}_fields", options)
@@ -15,6 +23,10 @@ class QueryTranslator(BaseQueryTranslator):
     def map_selections(self):
         return ", ".join(self.select_fields['default'])
 
+    def can_merge_set_value(self, value):
+        # CIDR values are compared with INCIDR
+        return '/' not in str(value)
+
     def transform_antlr(self, data, antlr_parsing_object):
         """
         Transforms STIX pattern into a different query format. Based on a mapping file
@@ -1,5 +1,3 @@
-import json
-
 from stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix import JSONToStix
 
 class ResultsTranslator(JSONToStix):
@@ -8,20 +6,22 @@ class ResultsTranslator(JSONToStix):
     super().__init__(options, dialect, base_file_path)
 
   def translate_results(self, data_source, data):
-    results = json.loads(data)
-    for result in results:
+    results = []
+    for result in self.load_json(data):
+      mime_types = {}
       if result.get('eventpayload') or result.get('Message'):
-        result['mime_type_eventpayload'] = 'text/plain'
+        mime_types['mime_type_eventpayload'] = 'text/plain'
       
       if result.get('Message'):
-        result['mime_type_message'] = 'text/plain'
+        mime_types['mime_type_message'] = 'text/plain'
       
       if result.get('flowsourcepayload'):
-        result['mime_type_flowsourcepayload'] = 'application/octet-stream'
+        mime_types['mime_type_flowsourcepayload'] = 'application/octet-stream'
       
       if result.get('flowdestinationpayload'):
-        result['mime_type_flowdestinationpayload'] = 'application/octet-stream'
+        mime_types['mime_type_flowdestinationpayload'] = 'application/octet-stream'
 
-    data = json.dumps(results, indent=4)
+      # the records of the caller are left untouched
+      results.append(dict(result, **mime_types) if mime_types else result)
 
-    return super().translate_results(data_source, data)
\ No newline at end of file
+    return super().translate_results(data_source, results)
\ No newline at end of file
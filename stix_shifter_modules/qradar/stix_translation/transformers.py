@@ -5,6 +5,7 @@ LOGGER = logger.set_logger(__name__)
 
 class ObjectnameToStixRegistryKey(ValueTransformer):
     """A value transformer to convert QRadar ObjectName to windows-registry-key.key STIX"""
+    cacheable = True
 
     @staticmethod
     def transform(registry):
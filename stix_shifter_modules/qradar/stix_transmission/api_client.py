@@ -1,4 +1,5 @@
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
+from stix_shifter_utils.stix_transmission.utils.AsyncRestApiClient import AsyncRestApiClient
 from stix_shifter_utils.utils import logger
 
 class APIClient():
@@ -10,6 +11,8 @@ class APIClient():
     # This class will encode any data or query parameters which will then be
     # sent to the call_api() method of the RestApiClient
 
+    rest_client_class = RestApiClient
+
     def __init__(self, connection, configuration):
         # This version of the ariel APIClient is designed to function with
         # version 6.0 of the ariel API.
@@ -43,13 +46,14 @@ class APIClient():
 
         self.timeout = connection['options'].get('timeout')
 
-        self.client = RestApiClient(host_port,
-                                    None,
-                                    headers,
-                                    url_modifier_function,
-                                    cert_verify=connection.get('selfSignedCert', True),
-                                    sni=connection.get('sni', None)
-                                    )
+        self.client = self.rest_client_class(host_port,
+                                             None,
+                                             headers,
+                                             url_modifier_function,
+                                             cert_verify=connection.get('selfSignedCert', True),
+                                             sni=connection.get('sni', None),
+                                             pool_size=connection['options'].get('connection_pool_size')
+                                             )
 
     def add_endpoint_to_url_header(self, url, endpoint, headers):
         # this function is called from 'call_api' with proxy forwarding,
@@ -131,3 +135,8 @@ class APIClient():
         endpoint = self.endpoint_start + "searches" + '/' + search_id
 
         return self.client.call_api(endpoint, 'DELETE', timeout=self.timeout)
+
+
+class AsyncAPIClient(APIClient):
+    # The methods return coroutines of the responses, to await
+    rest_client_class = AsyncRestApiClient
@@ -1,6 +1,7 @@
-from stix_shifter_utils.modules.base.stix_transmission.base_delete_connector import BaseDeleteConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_delete_connector import BaseDeleteConnector, \
+    BaseAsyncDeleteConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 class DeleteConnector(BaseDeleteConnector):
@@ -9,8 +10,11 @@ class DeleteConnector(BaseDeleteConnector):
 
     def delete_query_connection(self, search_id):
         response = self.api_client.delete_search(search_id)
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
         response_code = response.code
-        response_json = json.loads(response.read())
+        response_json = json_facade.loads(response.read())
         # Construct a response object
         return_obj = dict()
         if response_code == 202:
@@ -18,4 +22,11 @@ class DeleteConnector(BaseDeleteConnector):
         else:
             ErrorResponder.fill_error(return_obj, response_json, ['message'])
 
-        return return_obj
\ No newline at end of file
+        return return_obj
+
+
+class AsyncDeleteConnector(BaseAsyncDeleteConnector, DeleteConnector):
+
+    async def delete_query_connection(self, search_id):
+        response = await self.api_client.delete_search(search_id)
+        return self._handle_response(response)
@@ -1,7 +1,8 @@
-from stix_shifter_utils.modules.base.stix_transmission.base_ping_connector import BasePingConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_ping_connector import BasePingConnector, \
+    BaseAsyncPingConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger as utils_logger
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 class PingConnector(BasePingConnector):
@@ -12,13 +13,16 @@ class PingConnector(BasePingConnector):
 
     def ping_connection(self):
         response = self.api_client.ping_box()
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
         response_code = response.code
 
         response_text = response.read()
         error = None
         response_dict = dict()
         try:
-            response_dict = json.loads(response_text)
+            response_dict = json_facade.loads(response_text)
         except Exception as ex:
             self.logger.debug(response_text)
             error = Exception(f'Can not parse response: {ex} : {response_text}')
@@ -31,3 +35,10 @@ class PingConnector(BasePingConnector):
         else:
             ErrorResponder.fill_error(return_obj, response_dict, ['message'], error=error)
         return return_obj
+
+
+class AsyncPingConnector(BaseAsyncPingConnector, PingConnector):
+
+    async def ping_connection(self):
+        response = await self.api_client.ping_box()
+        return self._handle_response(response)
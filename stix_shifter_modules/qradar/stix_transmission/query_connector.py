@@ -1,7 +1,8 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_connector import BaseQueryConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_query_connector import BaseAsyncQueryConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 class QueryConnector(BaseQueryConnector):
@@ -10,15 +11,18 @@ class QueryConnector(BaseQueryConnector):
         self.logger = logger.set_logger(__name__)
 
     def create_query_connection(self, query):
-        # Grab the response, extract the response code, and convert it to readable json
         response = self.api_client.create_search(query)
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
+        # Extract the response code, and convert the response to readable json
         response_code = response.code
         response_text = response.read()
         error = None
         response_dict = dict()
 
         try:
-            response_dict = json.loads(response_text)
+            response_dict = json_facade.loads(response_text)
         except ValueError as ex:
             self.logger.debug(response_text)
             error = Exception(f'Can not parse response: {ex} : {response_text}')
@@ -33,3 +37,10 @@ class QueryConnector(BaseQueryConnector):
             ErrorResponder.fill_error(return_obj, response_dict, ['message'], error=error)
         
         return return_obj
+
+
+class AsyncQueryConnector(BaseAsyncQueryConnector, QueryConnector):
+
+    async def create_query_connection(self, query):
+        response = await self.api_client.create_search(query)
+        return self._handle_response(response)
@@ -1,7 +1,8 @@
-from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector, \
+    BaseAsyncResultsConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 class ResultsConnector(BaseResultsConnector):
@@ -12,9 +13,11 @@ class ResultsConnector(BaseResultsConnector):
     def create_results_connection(self, search_id, offset, length):
         min_range = offset
         max_range = offset + length
-        # Grab the response, extract the response code, and convert it to readable json
-
         response = self.api_client.get_search_results(search_id, 'application/json', min_range, max_range)
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
+        # Extract the response code, and convert the response to readable json
         response_code = response.code
 
         # Construct a response object
@@ -23,7 +26,7 @@ class ResultsConnector(BaseResultsConnector):
         response_text = response.read()
 
         try:
-            response_dict = json.loads(response_text)
+            response_dict = json_facade.loads(response_text)
         except ValueError as ex:
             self.logger.debug(response_text)
             error = Exception(f'Can not parse response: {ex} : {response_text}')
@@ -35,3 +38,12 @@ class ResultsConnector(BaseResultsConnector):
             ErrorResponder.fill_error(return_obj, response_dict, ['message'], error=error)
 
         return return_obj
+
+
+class AsyncResultsConnector(BaseAsyncResultsConnector, ResultsConnector):
+
+    async def create_results_connection(self, search_id, offset, length):
+        min_range = offset
+        max_range = offset + length
+        response = await self.api_client.get_search_results(search_id, 'application/json', min_range, max_range)
+        return self._handle_response(response)
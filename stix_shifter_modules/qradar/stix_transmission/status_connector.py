@@ -1,9 +1,10 @@
-from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector, \
+    BaseAsyncStatusConnector
 from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import Status
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger as utils_logger
 from enum import Enum
-import json
+from stix_shifter_utils.utils import json_facade
 
 
 class QRadarStatus(Enum):
@@ -33,8 +34,11 @@ class StatusConnector(BaseStatusConnector):
         return switcher.get(qradar_status).value
 
     def create_status_connection(self, search_id):
-        # Grab the response, extract the response code, and convert it to readable json
         response = self.api_client.get_search(search_id)
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
+        # Extract the response code, and convert the response to readable json
         response_code = response.code
         response_text = response.read()
 
@@ -42,7 +46,7 @@ class StatusConnector(BaseStatusConnector):
         response_dict = dict()
 
         try:
-            response_dict = json.loads(response_text)
+            response_dict = json_facade.loads(response_text)
         except Exception as ex:
             self.logger.debug(response_text)
             error = Exception(f'Can not parse response: {ex} : {response_text}')
@@ -57,3 +61,10 @@ class StatusConnector(BaseStatusConnector):
         else:
             ErrorResponder.fill_error(return_obj, response_dict, ['message'], error=error)
         return return_obj
+
+
+class AsyncStatusConnector(BaseAsyncStatusConnector, StatusConnector):
+
+    async def create_status_connection(self, search_id):
+        response = await self.api_client.get_search(search_id)
+        return self._handle_response(response)
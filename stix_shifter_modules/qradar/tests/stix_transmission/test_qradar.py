@@ -1,8 +1,10 @@
 from stix_shifter_modules.qradar.entry_point import EntryPoint
 from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import Status
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
+from stix_shifter_utils.stix_transmission.utils import AsyncRestApiClient
 from stix_shifter.stix_transmission import stix_transmission
 from unittest.mock import patch
+import asyncio
 import unittest
 
 
@@ -211,6 +213,33 @@ class TestQRadarConnection(unittest.TestCase, object):
         assert 'events' in results_response['data']
         assert len(results_response['data']) > 0
 
+    @patch('stix_shifter_modules.qradar.stix_transmission.api_client.APIClient.delete_search')
+    def test_delete_async_without_aiohttp(self, mock_delete_response, mock_api_client):
+        mock_api_client.return_value = None
+        mock_delete_response.return_value = QRadarMockResponse(202, '{}')
+
+        config = {
+            "auth": {
+                "sec": "bla"
+            }
+        }
+        connection = {
+            "host": "hostbla",
+            "port": 8080
+        }
+
+        with patch.object(AsyncRestApiClient, 'aiohttp', None):
+            transmission = stix_transmission.StixTransmission('qradar', connection, config)
+        # the synchronous connector is run in the default executor
+        loop = asyncio.new_event_loop()
+        try:
+            delete_response = loop.run_until_complete(transmission.delete_async('id'))
+        finally:
+            loop.close()
+
+        assert delete_response == {'success': True}
+        mock_delete_response.assert_called_once_with('id')
+
 class RequestsResponse():
     def __init__(self, response_code, object):
         self.code = response_code
@@ -0,0 +1,82 @@
+from stix_shifter_modules.qradar.entry_point import EntryPoint
+from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import Status
+from stix_shifter_utils.stix_transmission.utils import AsyncRestApiClient
+from stix_shifter.stix_transmission import stix_transmission
+from unittest.mock import patch
+import asyncio
+import json
+import unittest
+import pytest
+import sys
+
+if sys.version_info < (3, 8):
+    # the async connectors require aiohttp, which requires Python 3.8
+    pytest.skip('IsolatedAsyncioTestCase and AsyncMock require Python 3.8', allow_module_level=True)
+
+from unittest.mock import AsyncMock  # noqa: E402
+
+config = {
+    "auth": {
+        "sec": "bla"
+    }
+}
+connection = {
+    "host": "hostbla",
+    "port": 8080
+}
+
+
+class QRadarMockResponse:
+    def __init__(self, response_code, object):
+        self.code = response_code
+        self.object = object
+
+    def read(self):
+        return self.object
+
+
+@unittest.skipIf(AsyncRestApiClient.aiohttp is None, 'the async connectors require aiohttp')
+@patch('stix_shifter_modules.qradar.stix_transmission.api_client.APIClient.__init__', autospec=True)
+class TestQRadarAsyncConnection(unittest.IsolatedAsyncioTestCase):
+
+    @patch('stix_shifter_modules.qradar.stix_transmission.api_client.AsyncAPIClient.create_search',
+           new_callable=AsyncMock)
+    async def test_concurrent_queries(self, mock_query_response, mock_api_client):
+        mock_api_client.return_value = None
+        mock_query_response.side_effect = lambda query: QRadarMockResponse(201, json.dumps({'search_id': query}))
+
+        transmission = stix_transmission.StixTransmission('qradar', connection, config)
+        queries = ['query {}'.format(i) for i in range(200)]
+        responses = await asyncio.gather(*[transmission.query_async(query) for query in queries])
+
+        assert responses == [{'success': True, 'search_id': query} for query in queries]
+
+    @patch('stix_shifter_modules.qradar.stix_transmission.api_client.AsyncAPIClient.get_search_results',
+           new_callable=AsyncMock)
+    @patch('stix_shifter_modules.qradar.stix_transmission.api_client.AsyncAPIClient.get_search',
+           new_callable=AsyncMock)
+    async def test_status_and_results(self, mock_status_response, mock_results_response, mock_api_client):
+        mock_api_client.return_value = None
+        mock_status_response.return_value = QRadarMockResponse(200, json.dumps({'status': 'COMPLETED',
+                                                                                 'progress': 100}))
+        mock_results_response.return_value = QRadarMockResponse(200, json.dumps({'events': [{'qid': 1}]}))
+
+        transmission = stix_transmission.StixTransmission('qradar', connection, config)
+        status_response = await transmission.status_async('id')
+        results_response = await transmission.results_async('id', 0, 1)
+
+        assert status_response == {'success': True, 'status': Status.COMPLETED.value, 'progress': 100}
+        assert results_response == {'success': True, 'data': [{'qid': 1}]}
+        mock_results_response.assert_awaited_once_with('id', 'application/json', 0, 1)
+
+    @patch('stix_shifter_modules.qradar.stix_transmission.api_client.AsyncAPIClient.create_search',
+           new_callable=AsyncMock)
+    def test_sync_callers(self, mock_query_response, mock_api_client):
+        mock_api_client.return_value = None
+        mock_query_response.return_value = QRadarMockResponse(201, json.dumps({'search_id': 'id'}))
+
+        entry_point = EntryPoint(dict(connection), dict(config))
+        # a module with async connectors only
+        entry_point._BaseEntryPoint__query_connector = None
+        assert entry_point.create_query_connection('query') == {'success': True, 'search_id': 'id'}
+
@@ -1,6 +1,6 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_sync_connector import BaseSyncConnector
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
-import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.utils.error_response import ErrorResponder
 
 
@@ -46,7 +46,7 @@ class Connector(BaseSyncConnector):
             if ErrorResponder.is_plain_string(response_txt):
                 ErrorResponder.fill_error(return_obj, message=response_txt)
             elif ErrorResponder.is_json_string(response_txt):
-                response_json = json.loads(response_txt)
+                response_json = json_facade.loads(response_txt)
                 ErrorResponder.fill_error(return_obj, response_json, ['reason'])
             else:
                 raise UnexpectedResponseException
@@ -60,7 +60,7 @@ class Connector(BaseSyncConnector):
                 response_text = response.read()
 
                 try:
-                    response_dict = json.loads(response_text)
+                    response_dict = json_facade.loads(response_text)
                 except ValueError as ex:
                     self.logger.debug(response_text)
                     error = Exception(f'Can not parse response: {ex} : {response_text}')
@@ -1,5 +1,6 @@
 import base64
 import json
+from stix_shifter_utils.utils import json_facade
 import re
 from datetime import date, timedelta
 from dateutil import parser
@@ -8,9 +9,10 @@ from datetime import datetime
 from requests import Response
 from stix_shifter_utils.utils import logger
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient, ResponseWrapper, \
-    CONNECT_TIMEOUT_DEFAULT
+    CONNECT_TIMEOUT_DEFAULT, POOL_SIZE_DEFAULT
 import random
 from stix_shifter_utils.utils.error_response import ErrorResponder
+from stix_shifter_utils.utils.token_cache import get_token_cache
 
 
 class APIClient():
@@ -21,21 +23,27 @@ class APIClient():
          self.secret_detail = "/SecretServer/api/v1/secrets"
          self.connect_timeout = os.getenv('STIXSHIFTER_CONNECT_TIMEOUT', CONNECT_TIMEOUT_DEFAULT)
          self.connect_timeout = int(self.connect_timeout)
-         self.server_cert_content = False
+         self.cert_verify = False
+         self.pool_size = POOL_SIZE_DEFAULT
          self.auth = None
          self.sni = None
          self.retry_max = 1
          self.logger = logger.set_logger(__name__)
-         self.server_cert_file_content_exists = False
          self.url_modifier_function = None
          self.headers = {
              'Content-Type': 'application/x-www-form-urlencoded'
          }
          self.payload = 'username=%s&password=%s&grant_type=password' % (
              configuration["auth"]["username"], configuration["auth"]["password"])
+         self.credentials = {key: configuration["auth"][key] for key in ("username", "password")}
          self.server_ip = connection["host"]
 
     def get_token(self):
+        # requested once for the clients of the credentials, until it is about to expire
+        self.accessToken = get_token_cache().get_token('secretserver', self.url, self.credentials, self.request_token)
+        return self.accessToken
+
+    def request_token(self):
         response = RestApiClient.call_api(self, self.auth_token_url, 'GET', headers=self.headers,
                                           data=self.payload,
                                           urldata=None,
@@ -46,14 +54,27 @@ class APIClient():
         response_txt = response.response.text
 
         if (response_code == 200):
-            json_obj = json.loads(response_txt)
+            json_obj = json_facade.loads(response_txt)
             token = json_obj.get('access_token')
-            self.accessToken = 'Bearer' + " " + token
-            return self.accessToken
+            return 'Bearer' + " " + token, json_obj.get('expires_in')
         else:
             ErrorResponder.fill_error(return_obj, message=response_txt)
             raise Exception(return_obj)
 
+    def call_with_token(self, endpoint, method, data):
+        # the token may have been revoked before it expires in the token cache, a rejected one is renewed once
+        for attempt in range(2):
+            headers = {
+                'Authorization': self.accessToken,
+                'Content-Type': 'application/json'
+            }
+            response = RestApiClient.call_api(self, endpoint, method, headers=headers, data=data, urldata=None,
+                                              timeout=None)
+            if response.code != 401 or attempt:
+                return response
+            get_token_cache().invalidate('secretserver', self.url, self.credentials, token=self.accessToken)
+            self.get_token()
+
     def ping_data_source(self):
         response = RestApiClient.call_api(self, self.auth_token_url, 'GET', headers=self.headers, data=self.payload,
                                           urldata=None,
@@ -121,7 +142,7 @@ class APIClient():
         # These value (date, self.query) must be present.
         try:
             id_dec64 = base64.b64decode(self.search_id)
-            jObj = json.loads(id_dec64.decode('utf-8'))
+            jObj = json_facade.loads(id_dec64.decode('utf-8'))
         except:
             raise IOError(
                 3001, "Could not decode search id content - " + self.search_id)
@@ -141,14 +162,9 @@ class APIClient():
     def get_events(self):
         payload = "{\"name\": \"Secret Server Events Logs\", \"parameters\": [{\"name\": \"startDate\", \"value\": '%s'} , {\"name\":\"endDate\",\"value\": '%s'}]}" % (
             self.startDate, self.endDate)
-        headers = {
-            'Authorization': self.accessToken,
-            'Content-Type': 'application/json'
-        }
         endpoint = "SecretServer/api/v1/reports/execute"
 
-        response = RestApiClient.call_api(self, endpoint, 'POST', headers=headers, data=payload, urldata=None,
-                                          timeout=None)
+        response = self.call_with_token(endpoint, 'POST', payload)
         return_obj = {}
         if response.code != 200:
             response_txt = response.response.text
@@ -157,7 +173,7 @@ class APIClient():
 
         collection = []
         json_data = response.response.text
-        eventData = json.loads(json_data)
+        eventData = json_facade.loads(json_data)
         col = eventData['columns']
         for obj in eventData['rows']:
             obj = dict(zip(col, obj))
@@ -174,18 +190,12 @@ class APIClient():
         unique = set(secretIdList)
         for id in unique:
             secret_server_user_url = self.secret_detail + "/%s" % id
-            headers = {
-                'Authorization': self.accessToken,
-                'Content-Type': 'application/json'
-            }
             payload = {}
-            response = RestApiClient.call_api(self, secret_server_user_url, 'GET', headers=headers, data=payload,
-                                              urldata=None,
-                                              timeout=None)
+            response = self.call_with_token(secret_server_user_url, 'GET', payload)
 
             secretCollection.append(response.response.text)
         json_data = json.dumps(secretCollection)
-        collection = json.loads(json_data)
+        collection = json_facade.loads(json_data)
         return collection
 
     def get_response(self):
@@ -195,7 +205,7 @@ class APIClient():
         secretCollection = {}
         updateCollection = []
         for obj in secretDetail:
-            next = json.loads(obj)
+            next = json_facade.loads(obj)
             updateSecret.append(next)
         for item in eventDetail:
             for getId in updateSecret:
@@ -3,9 +3,8 @@ from audioop import error
 from stix_shifter_utils.modules.base.stix_transmission.base_connector import BaseQueryConnector
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
-import json
+from stix_shifter_utils.utils import json_facade
 
-import json
 from urllib import response
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.modules.base.stix_transmission.base_query_connector import BaseQueryConnector
@@ -21,7 +20,7 @@ class QueryConnector(BaseQueryConnector):
 
             response = self.api_client.create_search(query)
             response_code = response.code
-            response_dict = json.loads(response.read())
+            response_dict = json_facade.loads(response.read())
 
             # Construct a response object
             return_obj = dict()
@@ -1,5 +1,6 @@
 import requests
 import os
+from stix_shifter_utils.utils.token_cache import get_token_cache
 class Auth():
     IAM_URL = os.getenv('IAM_URL', 'https://iam.cloud.ibm.com/identity/token')
     ADMIN_API_URL = os.getenv('ADMIN_API_URL', 'https://compliance.cloud.ibm.com/admin/v1')
@@ -8,6 +9,13 @@ class Auth():
     def obtainAccessToken(self):
         if(not self.apiKey):
             raise Exception("Authorizaion Failed")
+        # requested once for the connectors of the api key, until it is about to expire
+        return get_token_cache().get_token('security_advisor', self.IAM_URL, {'apiKey': self.apiKey},
+                                           self.requestAccessToken)
+    def invalidateAccessToken(self, token):
+        # the token was rejected before it expires in the token cache
+        get_token_cache().invalidate('security_advisor', self.IAM_URL, {'apiKey': self.apiKey}, token=token)
+    def requestAccessToken(self):
         iamTokenURL = self.IAM_URL
         requestBody = "grant_type=urn:ibm:params:oauth:grant-type:apikey&apikey={}&response_type=cloud_iam".format(self.apiKey)
         header = {
@@ -19,7 +27,7 @@ class Auth():
         except Exception as e:
             raise Exception("Authorizaion Failed" + str(e))
         if( response.json().get("access_token") ):
-            return response.json()["access_token"]
+            return response.json()["access_token"], response.json().get("expires_in")
         else:
             raise Exception("Authorizaion Failed")
     def find_location(self, accountID, host):
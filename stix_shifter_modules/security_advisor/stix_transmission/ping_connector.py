@@ -33,6 +33,8 @@ class PingConnector(BasePingConnector):
             response = requests.get(url,headers= header)
             response_code = response.status_code
 
+            if (response_code == 401):
+                self.auth_token.invalidateAccessToken(authorization[len("Bearer "):])
             if (response_code == 200):
                 return_obj["success"] = True
             else:
@@ -33,5 +33,7 @@ class ResultsConnector(BaseResultsConnector):
             return return_obj
 
         except Exception as e:
+            # the error of the findings API does not tell a rejected token apart, the next call requests a new one
+            self.auth_token.invalidateAccessToken(params["accessToken"])
             ErrorResponder.fill_error(return_obj, {'code':"query_failed"}, message= str(e))
             return return_obj
@@ -155,7 +155,7 @@ class _ObservationExpressionTranslator:
             if stix_object == 'x-ibm-finding' and stix_path == 'name':
                 return f'index=_audit ss_name="{expression.value}" action=alert_fired'
             # Check if mapping has multiple fields
-            if isinstance(field_mapping, list):
+            if isinstance(field_mapping, (list, tuple)):
                 comparison_string = ""
                 mapped_fields_count = len(field_mapping)
                 for mapped_field in field_mapping:
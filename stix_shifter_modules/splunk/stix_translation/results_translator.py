@@ -1,5 +1,3 @@
-import json
-
 from stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix import JSONToStix
 from .splunk_utils import hash_type_lookup
 
@@ -9,11 +7,7 @@ class ResultsTranslator(JSONToStix):
     super().__init__(options, dialect, base_file_path, hash_type_lookup)
 
   def translate_results(self, data_source, data):
-    results = json.loads(data)
-    for result in results:
-      if result.get('_raw'):
-        result['mime_type_raw'] = 'text/plain'
-    
-    data = json.dumps(results, indent=4)
+    results = [dict(result, mime_type_raw='text/plain') if result.get('_raw') else result
+               for result in self.load_json(data)]
 
-    return super().translate_results(data_source, data)
\ No newline at end of file
+    return super().translate_results(data_source, results)
\ No newline at end of file
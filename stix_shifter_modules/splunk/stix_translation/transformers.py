@@ -3,6 +3,7 @@ from stix_shifter_utils.stix_translation.src.utils.transformers import ValueTran
 
 class SplunkToTimestamp(ValueTransformer):
     """A value transformer for converting Splunk timestamp to regular timestamp"""
+    cacheable = True
 
     @staticmethod
     def transform(splunkTime):
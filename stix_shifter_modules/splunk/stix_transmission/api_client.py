@@ -1,5 +1,7 @@
+import asyncio
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
-import json
+from stix_shifter_utils.stix_transmission.utils.AsyncRestApiClient import AsyncRestApiClient
+from stix_shifter_utils.utils import json_facade
 
 class APIClient():
     # API METHODS
@@ -10,6 +12,8 @@ class APIClient():
     # This class will encode any data or query parameters which will then be
     # sent to the call_api() method of its inherited class.
 
+    rest_client_class = RestApiClient
+
     def __init__(self, connection, configuration):
 
         # This version of the Splunk APIClient is designed to function with
@@ -20,12 +24,13 @@ class APIClient():
         self.endpoint_start = 'services/'
         self.authenticated = False
         headers = dict()
-        self.client = RestApiClient(connection.get('host'),
-                                    connection.get('port'),
-                                    headers,
-                                    cert_verify=connection.get('selfSignedCert', True),
-                                    sni=connection.get('sni', None)
-                                    )
+        self.client = self.rest_client_class(connection.get('host'),
+                                             connection.get('port'),
+                                             headers,
+                                             cert_verify=connection.get('selfSignedCert', True),
+                                             sni=connection.get('sni', None),
+                                             pool_size=connection['options'].get('connection_pool_size')
+                                             )
         self.auth = configuration.get('auth')
         self.headers = headers
         self.timeout = connection['options'].get('timeout')
@@ -39,7 +44,7 @@ class APIClient():
         data = {'username': auth['username'], 'password': auth['password'], 'output_mode': 'json'}
         endpoint = self.endpoint_start + 'auth/login'
         try:
-            response_json = json.load(self.client.call_api(endpoint, 'POST', headers, data=data, timeout=self.timeout))
+            response_json = json_facade.load(self.client.call_api(endpoint, 'POST', headers, data=data, timeout=self.timeout))
             headers['Authorization'] = "Splunk " + response_json['sessionKey']
         except KeyError as e:
             raise Exception('Authentication error occured while getting auth token: ' + str(e))
@@ -88,3 +93,60 @@ class APIClient():
         endpoint = self.endpoint_start + 'search/jobs/' + search_id
         data = {'output_mode': self.output_mode}
         return self.client.call_api(endpoint, 'DELETE', data=data, timeout=self.timeout)
+
+
+class AsyncAPIClient(APIClient):
+    # The methods return coroutines of the responses, to await. The session key is requested before the first call,
+    # once for the concurrent calls.
+
+    rest_client_class = AsyncRestApiClient
+
+    def __init__(self, connection, configuration):
+        super().__init__(connection, configuration)
+        self.auth_lock = None
+        self.auth_lock_loop = None
+
+    def authenticate(self):
+        # the methods of APIClient authenticate synchronously, authenticate_async is awaited before them
+        pass
+
+    async def authenticate_async(self):
+        loop = asyncio.get_event_loop()
+        if self.auth_lock_loop is not loop:
+            # a lock belongs to the event loop it is used in
+            self.auth_lock = asyncio.Lock()
+            self.auth_lock_loop = loop
+        async with self.auth_lock:
+            if not self.authenticated:
+                await self.set_splunk_auth_token(self.auth, self.headers)
+                self.authenticated = True
+
+    async def set_splunk_auth_token(self, auth, headers):
+        data = {'username': auth['username'], 'password': auth['password'], 'output_mode': 'json'}
+        endpoint = self.endpoint_start + 'auth/login'
+        try:
+            response_json = json_facade.load(await self.client.call_api(endpoint, 'POST', headers, data=data,
+                                                                        timeout=self.timeout))
+            headers['Authorization'] = "Splunk " + response_json['sessionKey']
+        except KeyError as e:
+            raise Exception('Authentication error occured while getting auth token: ' + str(e))
+
+    async def ping_box(self):
+        await self.authenticate_async()
+        return await super().ping_box()
+
+    async def create_search(self, query_expression):
+        await self.authenticate_async()
+        return await super().create_search(query_expression)
+
+    async def get_search(self, search_id):
+        await self.authenticate_async()
+        return await super().get_search(search_id)
+
+    async def get_search_results(self, search_id, offset, count):
+        await self.authenticate_async()
+        return await super().get_search_results(search_id, offset, count)
+
+    async def delete_search(self, search_id):
+        await self.authenticate_async()
+        return await super().delete_search(search_id)
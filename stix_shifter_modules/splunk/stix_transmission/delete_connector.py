@@ -1,5 +1,6 @@
-from stix_shifter_utils.modules.base.stix_transmission.base_delete_connector import BaseDeleteConnector
-import json
+from stix_shifter_utils.modules.base.stix_transmission.base_delete_connector import BaseDeleteConnector, \
+    BaseAsyncDeleteConnector
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.utils.error_response import ErrorResponder
 from stix_shifter_utils.utils import logger
 
@@ -10,10 +11,13 @@ class DeleteConnector(BaseDeleteConnector):
         self.logger = logger.set_logger(__name__)
     
     def delete_query_connection(self, search_id):
-        # Grab the response, extract the response code, and convert it to readable json
         response = self.api_client.delete_search(search_id)
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
+        # Extract the response code, and convert the response to readable json
         response_code = response.code
-        response_dict = json.load(response)
+        response_dict = json_facade.load(response)
 
         # Construct a response object
         return_obj = dict()
@@ -24,3 +28,10 @@ class DeleteConnector(BaseDeleteConnector):
             ErrorResponder.fill_error(return_obj, response_dict, ['messages',0,'text'])
 
         return return_obj
+
+
+class AsyncDeleteConnector(BaseAsyncDeleteConnector, DeleteConnector):
+
+    async def delete_query_connection(self, search_id):
+        response = await self.api_client.delete_search(search_id)
+        return self._handle_response(response)
@@ -1,5 +1,6 @@
-from stix_shifter_utils.modules.base.stix_transmission.base_ping_connector import BasePingConnector
-import json
+from stix_shifter_utils.modules.base.stix_transmission.base_ping_connector import BasePingConnector, \
+    BaseAsyncPingConnector
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.utils.error_response import ErrorResponder
 
 class PingConnector(BasePingConnector):
@@ -8,9 +9,12 @@ class PingConnector(BasePingConnector):
     
     def ping_connection(self):
         response = self.api_client.ping_box()
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
         response_code = response.code
 
-        response_dict = json.loads(response.read())
+        response_dict = json_facade.loads(response.read())
         
         return_obj = dict()
 
@@ -19,3 +23,10 @@ class PingConnector(BasePingConnector):
         else:
             ErrorResponder.fill_error(return_obj, response_dict, ['messages',0,'text'])
         return return_obj
+
+
+class AsyncPingConnector(BaseAsyncPingConnector, PingConnector):
+
+    async def ping_connection(self):
+        response = await self.api_client.ping_box()
+        return self._handle_response(response)
@@ -1,5 +1,6 @@
 from stix_shifter_utils.modules.base.stix_transmission.base_connector import BaseQueryConnector
-import json
+from stix_shifter_utils.modules.base.stix_transmission.base_query_connector import BaseAsyncQueryConnector
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.utils.error_response import ErrorResponder
 
 
@@ -8,10 +9,13 @@ class QueryConnector(BaseQueryConnector):
         self.api_client = api_client
 
     def create_query_connection(self, query):
-        # Grab the response, extract the response code, and convert it to readable json
         response = self.api_client.create_search(query)
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
+        # Extract the response code, and convert the response to readable json
         response_code = response.code
-        response_dict = json.loads(response.read())
+        response_dict = json_facade.loads(response.read())
 
         # Construct a response object
         return_obj = dict()
@@ -22,3 +26,10 @@ class QueryConnector(BaseQueryConnector):
         else:
             ErrorResponder.fill_error(return_obj, response_dict, ['messages', 0, 'text'])
         return return_obj
+
+
+class AsyncQueryConnector(BaseAsyncQueryConnector, QueryConnector):
+
+    async def create_query_connection(self, query):
+        response = await self.api_client.create_search(query)
+        return self._handle_response(response)
@@ -1,6 +1,7 @@
-from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector, \
+    BaseAsyncResultsConnector
 from .api_client import APIClient
-import json
+from stix_shifter_utils.utils import json_facade
 from stix_shifter_utils.utils.error_response import ErrorResponder
 
 
@@ -9,10 +10,13 @@ class ResultsConnector(BaseResultsConnector):
         self.api_client = api_client
 
     def create_results_connection(self, search_id, offset, length):
-        # Grab the response, extract the response code, and convert it to readable json
         response = self.api_client.get_search_results(search_id, offset, length)
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
+        # Extract the response code, and convert the response to readable json
         response_code = response.code
-        response_dict = json.load(response)
+        response_dict = json_facade.load(response)
 
         # Construct a response object
         return_obj = dict()
@@ -26,3 +30,10 @@ class ResultsConnector(BaseResultsConnector):
         else:
             ErrorResponder.fill_error(return_obj, response_dict, ['messages', 0, 'text'])
         return return_obj
+
+
+class AsyncResultsConnector(BaseAsyncResultsConnector, ResultsConnector):
+
+    async def create_results_connection(self, search_id, offset, length):
+        response = await self.api_client.get_search_results(search_id, offset, length)
+        return self._handle_response(response)
@@ -1,6 +1,7 @@
-from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector, Status
+from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector, Status, \
+    BaseAsyncStatusConnector
 from .api_client import APIClient
-import json
+from stix_shifter_utils.utils import json_facade
 import math
 from enum import Enum
 from stix_shifter_utils.utils.error_response import ErrorResponder
@@ -15,10 +16,13 @@ class StatusConnector(BaseStatusConnector):
         self.api_client = api_client
 
     def create_status_connection(self, search_id):
-        # Grab the response, extract the response code, and convert it to readable json
         response = self.api_client.get_search(search_id)
+        return self._handle_response(response)
+
+    def _handle_response(self, response):
+        # Extract the response code, and convert the response to readable json
         response_code = response.code
-        response_dict = json.load(response)
+        response_dict = json_facade.load(response)
         
         status, progress = '', ''
         
@@ -45,3 +49,10 @@ class StatusConnector(BaseStatusConnector):
         else:
             ErrorResponder.fill_error(return_obj, response_dict, ['messages',0,'text'])
         return return_obj
+
+
+class AsyncStatusConnector(BaseAsyncStatusConnector, StatusConnector):
+
+    async def create_status_connection(self, search_id):
+        response = await self.api_client.get_search(search_id)
+        return self._handle_response(response)
@@ -0,0 +1,70 @@
+from stix_shifter_utils.stix_transmission.utils import AsyncRestApiClient
+from stix_shifter.stix_transmission import stix_transmission
+from unittest.mock import patch
+import asyncio
+import json
+import unittest
+import pytest
+import sys
+
+if sys.version_info < (3, 8):
+    # the async connectors require aiohttp, which requires Python 3.8
+    pytest.skip('IsolatedAsyncioTestCase and AsyncMock require Python 3.8', allow_module_level=True)
+
+config = {
+    "auth": {
+        "username": "user",
+        "password": "pass"
+    }
+}
+connection = {
+    "host": "host",
+    "port": 8080
+}
+
+
+class SplunkMockResponse:
+    def __init__(self, response_code, object):
+        self.code = response_code
+        self.object = object
+
+    def read(self):
+        return self.object
+
+
+@unittest.skipIf(AsyncRestApiClient.aiohttp is None, 'the async connectors require aiohttp')
+class TestSplunkAsyncConnection(unittest.IsolatedAsyncioTestCase):
+
+    @patch('stix_shifter_utils.stix_transmission.utils.AsyncRestApiClient.AsyncRestApiClient.call_api')
+    async def test_concurrent_queries_authenticate_once(self, mock_call_api):
+        calls = []
+
+        async def call_api(endpoint, method, headers=None, data=None, urldata=None, timeout=None):
+            calls.append((endpoint, dict(headers or {})))
+            await asyncio.sleep(0)
+            if endpoint == 'services/auth/login':
+                return SplunkMockResponse(200, json.dumps({'sessionKey': 'key'}))
+            return SplunkMockResponse(201, json.dumps({'sid': data['search']}))
+        mock_call_api.side_effect = call_api
+
+        transmission = stix_transmission.StixTransmission('splunk', connection, config)
+        queries = ['search {}'.format(i) for i in range(50)]
+        responses = await asyncio.gather(*[transmission.query_async(query) for query in queries])
+
+        assert responses == [{'success': True, 'search_id': query} for query in queries]
+        assert [endpoint for endpoint, _ in calls].count('services/auth/login') == 1
+        assert calls[0][0] == 'services/auth/login'
+
+    @patch('stix_shifter_utils.stix_transmission.utils.AsyncRestApiClient.AsyncRestApiClient.call_api')
+    async def test_results(self, mock_call_api):
+        async def call_api(endpoint, method, headers=None, data=None, urldata=None, timeout=None):
+            if endpoint == 'services/auth/login':
+                return SplunkMockResponse(200, json.dumps({'sessionKey': 'key'}))
+            assert urldata == {'output_mode': 'json', 'offset': '0', 'count': '2'}
+            return SplunkMockResponse(200, json.dumps({'results': [{'src_ip': '10.0.0.1'}]}))
+        mock_call_api.side_effect = call_api
+
+        transmission = stix_transmission.StixTransmission('splunk', connection, config)
+        response = await transmission.results_async('id', 0, 2)
+
+        assert response == {'success': True, 'data': [{'src_ip': '10.0.0.1'}]}
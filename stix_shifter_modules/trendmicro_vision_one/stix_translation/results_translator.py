@@ -1,6 +1,4 @@
 # -*- coding: utf-8 -*-
-import json
-
 from stix_shifter_utils.stix_translation.src.json_to_stix import json_to_stix_translator
 from stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix import JSONToStix
 from stix_shifter_utils.stix_translation.src.utils.exceptions import LoadJsonResultsException, TranslationResultException
@@ -13,26 +11,13 @@ class ResultsTranslator(JSONToStix):
 
     def translate_results(self, data_source, data):
         try:
-            json_data = json.loads(data)
+            # the logs of the caller are left untouched, the updated ones are copies
+            json_data = self.load_json(data)
             if self.dialect == "endpointActivityData":
-                for log in json_data:
-                    registry_value = log.get("objectRegistryValue")
-                    if registry_value:
-                        registry_value_type = {"name": registry_value}
-                        registry_data = log.get("objectRegistryData")
-                        if registry_data:
-                            registry_value_type["data"] = registry_data
-                        log["objectRegistryValueType"] = [registry_value_type]
+                json_data = [self._with_registry_value_type(log) for log in json_data]
             elif self.dialect == "messageActivityData":
-                for log in json_data:
-                    message_id = log.get("mail_message_id")
-                    if message_id:
-                        headers = log.get("mail_internet_headers")
-                        if headers:
-                            headers.append({"HeaderName": "Message-ID", "Value": message_id})
-                        else:
-                            log["mail_internet_headers"] = [{"HeaderName": "Message-ID", "Value": message_id}]
-            data_source = json.loads(data_source)
+                json_data = [self._with_message_id_header(log) for log in json_data]
+            data_source = self.load_json(data_source)
         except Exception as e:
             raise LoadJsonResultsException() from e
 
@@ -42,3 +27,22 @@ class ResultsTranslator(JSONToStix):
             raise TranslationResultException("Error when converting results to STIX: %s" % ex) from ex
 
         return results
+
+    @staticmethod
+    def _with_registry_value_type(log):
+        registry_value = log.get("objectRegistryValue")
+        if not registry_value:
+            return log
+        registry_value_type = {"name": registry_value}
+        registry_data = log.get("objectRegistryData")
+        if registry_data:
+            registry_value_type["data"] = registry_data
+        return dict(log, objectRegistryValueType=[registry_value_type])
+
+    @staticmethod
+    def _with_message_id_header(log):
+        message_id = log.get("mail_message_id")
+        if not message_id:
+            return log
+        headers = log.get("mail_internet_headers") or []
+        return dict(log, mail_internet_headers=headers + [{"HeaderName": "Message-ID", "Value": message_id}])
@@ -1,5 +1,6 @@
 import datetime
 import json
+from stix_shifter_utils.utils import json_facade
 
 from stix_shifter_utils.stix_transmission.utils.RestApiClient import RestApiClient
 from stix_shifter_utils.utils import logger
@@ -44,7 +45,7 @@ class APIClient:
         headers = dict()
         headers['Content-Type'] = 'application/json'
         headers['Accept'] = 'application/json'
-        payload = json.loads(search_id)
+        payload = json_facade.loads(search_id)
         resp_dict = dict()
         all_data = list()
         resp_dict["data"] = {"logs": all_data}
@@ -85,5 +86,5 @@ class APIClient:
     def _fetch(self, endpoint, headers, payload, offset):
         payload["offset"] = offset
         resp = self.client.call_api(endpoint, 'POST', headers=headers, data=json.dumps(payload), timeout=self.timeout)
-        payload_dict = json.loads(resp.read())
+        payload_dict = json_facade.loads(resp.read())
         return resp.code, payload_dict
@@ -1,18 +1,56 @@
 from abc import ABCMeta
+import os
 from os import path
+import json
 import re
+import sys
 from stix_shifter_utils.utils import logger
+from stix_shifter_utils.utils.lru_cache import LRUCache
 from stix_shifter_utils.utils.file_helper import read_json as helper_read_json
-from stix_shifter_utils.stix_translation.src.patterns.parser import generate_query
+from stix_shifter_utils.stix_translation.src.patterns.parser import generate_query_cached
+from stix_shifter_utils.stix_translation.src.patterns.traversal import balance, copy_tree
+from stix_shifter_utils.stix_translation.src.patterns.splitter import split_sets, split_in_half
+from stix_shifter_utils.stix_translation.src.patterns.optimizer import optimize_pattern
+from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import SetValue
 from stix_shifter_utils.stix_translation.src.utils.stix_pattern_parser import parse_stix
 from stix_shifter_utils.stix_translation.src.utils.unmapped_attribute_stripper import strip_unmapped_attributes
 from stix2patterns.validator import run_validator
 from stix_shifter_utils.stix_translation.src.utils.exceptions import StixValidationException
 
 START_STOP_PATTERN = r"\s?START\s?t'\d{4}(-\d{2}){2}T\d{2}(:\d{2}){2}(\.\d+)?Z'\sSTOP\s?t'\d{4}(-\d{2}){2}T(\d{2}:){2}\d{2}.\d{1,3}Z'\s?"
+VALIDATION_CACHE_SIZE_DEFAULT = 256
+
+# stix2patterns validation errors keyed by normalized pattern text, shared across dialects and translator instances
+validation_cache = LRUCache(int(os.getenv('STIXSHIFTER_VALIDATION_CACHE_SIZE', VALIDATION_CACHE_SIZE_DEFAULT)))
+
+
+def compile_field_index(map_data):
+    """
+    Flattens a from_stix mapping into a dict keyed by full object path (ie. 'ipv4-addr:value').
+    Keys and field names are interned and field lists become tuples, so the mapped fields can be handed out
+    to the query constructors without being copied.
+    :param map_data: from_stix mapping
+    :type map_data: dict
+    :return: data source fields by object path
+    :rtype: dict
+    """
+    index = {}
+    for stix_object_name, object_mapping in map_data.items():
+        fields = object_mapping.get("fields") if isinstance(object_mapping, dict) else None
+        if not isinstance(fields, dict):
+            continue
+        for stix_property_name, mapped_fields in fields.items():
+            if isinstance(mapped_fields, list):
+                mapped_fields = tuple(sys.intern(field) if isinstance(field, str) else field for field in mapped_fields)
+            index[sys.intern("{}:{}".format(stix_object_name, stix_property_name))] = mapped_fields
+    return index
 
 
 class BaseQueryTranslator(object, metaclass=ABCMeta):
+    _field_index = None
+    _field_index_source = None
+    # Object paths whose IN comparisons the query constructor translates like the equivalent ORed equalities
+    SET_COMPARISON_PATHS = frozenset()
 
     def __init__(self, options, dialect, basepath):
         self.options = options
@@ -21,6 +59,8 @@ class BaseQueryTranslator(object, metaclass=ABCMeta):
         self.select_fields = {}
         self.logger = logger.set_logger(__name__)
         self.map_data = self.fetch_mapping(basepath, dialect, options)
+        # compiled up front rather than on the first translation
+        self.field_index
 
     def read_json(self, filepath, options):
         return helper_read_json(filepath, options)
@@ -38,6 +78,17 @@ class BaseQueryTranslator(object, metaclass=ABCMeta):
             from_stix_path = path.join(basepath, 'json', 'from_stix_map.json')
             return self.read_json(from_stix_path, options)
 
+    @property
+    def field_index(self):
+        """
+        Data source fields by STIX object path, compiled from map_data (again if map_data is replaced)
+        :rtype: dict
+        """
+        if self._field_index_source is not self.map_data:
+            self._field_index = compile_field_index(self.map_data)
+            self._field_index_source = self.map_data
+        return self._field_index
+
     def map_field(self, stix_object_name, stix_property_name):
         """
         Maps the STIX object:property pair to any matching data source fields.
@@ -46,28 +97,36 @@ class BaseQueryTranslator(object, metaclass=ABCMeta):
         :type stix_object_name: str
         :param stix_property_name: STIX property associated to the object (ie. value)
         :type stix_property_name: str
-        :return: A list of 0 or more data source fields that map to a combination of stix_object_name and stix_property_name
-        :rtype: list
+        :return: A tuple of 0 or more data source fields that map to a combination of stix_object_name and stix_property_name
+        :rtype: tuple
         """
-        if stix_object_name in self.map_data and stix_property_name in self.map_data[stix_object_name]["fields"]:
-            return self.map_data[stix_object_name]["fields"][stix_property_name]
-        else:
-            return []
+        return self.field_index.get("{}:{}".format(stix_object_name, stix_property_name), ())
+
+    def map_object_path(self, object_path):
+        """
+        Maps a STIX object path to any matching data source fields, same as map_field without splitting the path
+        :param object_path: STIX object path (ie. url:value)
+        :type object_path: str
+        :return: A tuple of 0 or more data source fields
+        :rtype: tuple
+        """
+        if type(self).map_field is not BaseQueryTranslator.map_field:
+            return self.map_field(*object_path.split(':', 1))
+        return self.field_index.get(object_path, ())
 
     def _validate_pattern(self, pattern):
-        errors = []
         # Temporary work around since pattern validator currently treats multiple qualifiers of the same type as invalid.
         start_stop_count = len(re.findall(START_STOP_PATTERN, pattern))
         if(start_stop_count > 1):
             pattern = re.sub(START_STOP_PATTERN, " ", pattern)
-        errors = run_validator(pattern, stix_version='2.1')
+        pattern = pattern.strip()
+        errors = validation_cache.get_or_create(pattern, lambda: tuple(run_validator(pattern, stix_version='2.1')))
         if errors:
+            errors = list(errors)
             raise StixValidationException("The STIX pattern has the following errors: {}".format(errors))
 
     def parse_query(self, data):
-        if self.options.get('validate_pattern'):
-            self._validate_pattern(data)
-        antlr_parsing = generate_query(data)
+        antlr_parsing = self.parse_pattern(data)
         # Extract pattern elements into parsed stix object
         parsed_stix_dictionary = parse_stix(antlr_parsing, self.options['time_range'])
         parsed_stix = parsed_stix_dictionary['parsed_stix']
@@ -75,25 +134,119 @@ class BaseQueryTranslator(object, metaclass=ABCMeta):
         end_time = parsed_stix_dictionary['end_time']
         return {'parsed_stix': parsed_stix, 'start_time': start_time, 'end_time': end_time}
 
+    def parse_pattern(self, data):
+        """
+        Validates (when enabled) and parses the STIX pattern.
+        The returned pattern is frozen, so a single parsing can be shared by the translators of all dialects.
+        :param data: STIX pattern
+        :type data: str
+        :return: parsed STIX pattern
+        :rtype: Pattern
+        """
+        if self.options.get('validate_pattern'):
+            self._validate_pattern(data)
+        return generate_query_cached(data, self.options.get('pattern_parser'))
+
+    def supports_shared_parsing(self):
+        # Translators overriding transform_query do their own parsing of the pattern (if any)
+        return type(self).transform_query is BaseQueryTranslator.transform_query
+
     def transform_query(self, data):
-        antlr_parsing = None
+        return self.transform_parsed_query(data, self.parse_pattern(data))
+
+    def transform_parsed_query(self, data, antlr_parsing):
+        """
+        Strips the unmapped attributes from an already parsed STIX pattern and translates it
+        :param data: STIX pattern
+        :type data: str
+        :param antlr_parsing: the pattern as returned by parse_pattern, it is not modified
+        :type antlr_parsing: Pattern
+        :return: translated queries and unmapped attributes
+        :rtype: dict
+        """
         unmapped_stix_collection = []
         translated_queries = []
-        # if query_translator.get_language() == 'stix':
-        if self.options.get('validate_pattern'):
-            self._validate_pattern(data)
-        antlr_parsing = generate_query(data)
+        if self.options.get('optimize_pattern'):
+            antlr_parsing = optimize_pattern(antlr_parsing, self.can_merge_into_set)
         stripped_parsing = strip_unmapped_attributes(antlr_parsing, self)
         antlr_parsing = stripped_parsing.get('parsing')
         unmapped_stix = stripped_parsing.get('unmapped_stix')
         if unmapped_stix:
             unmapped_stix_collection.append(unmapped_stix)
         if antlr_parsing:
-            translated_queries = self.transform_antlr(data, antlr_parsing)
-            if isinstance(translated_queries, str):
-                translated_queries = [translated_queries]
+            if self.options.get('max_query_length') or self.options.get('max_set_size'):
+                translated_queries = self._transform_within_limits(data, antlr_parsing)
+            else:
+                translated_queries = self._transform_antlr_balanced(data, antlr_parsing)
         return {'queries': translated_queries, 'unmapped_attributes': unmapped_stix_collection}
 
+    def _transform_antlr_balanced(self, data, antlr_parsing):
+        # long AND/OR chains are rebalanced so the query constructors recurse O(log n) deep on them
+        translated_queries = self.transform_antlr(data, balance(antlr_parsing))
+        if isinstance(translated_queries, str):
+            translated_queries = [translated_queries]
+        return translated_queries
+
+    def _transform_within_limits(self, data, antlr_parsing):
+        """
+        Translates the pattern into queries that respect the max_set_size and max_query_length options.
+        Oversized IN comparisons and OR chains are split, each part of the pattern is translated into its own
+        queries: together they return the same results as the original query would. The result_limit applies to
+        each of these queries, and the results matching several parts are returned once per part: the caller runs
+        the queries and deduplicates their results.
+        """
+        max_query_length = self.options.get('max_query_length')
+        max_set_size = self.options.get('max_set_size')
+        parts = split_sets(antlr_parsing, max_set_size) if max_set_size else [antlr_parsing]
+        translated_queries = []
+        while parts:
+            part = parts.pop(0)
+            # the query constructors modify the comparisons, a part may have to be translated again once split
+            queries = self._transform_antlr_balanced(data, copy_tree(part))
+            if max_query_length and any(self.query_length(query) > max_query_length for query in queries):
+                halves = split_in_half(part)
+                if halves:
+                    parts[0:0] = halves
+                    continue
+                self.logger.warning("Query exceeds max_query_length ({}) but the pattern can not be split "
+                                    "further".format(max_query_length))
+            translated_queries.extend(queries)
+        return translated_queries
+
+    def query_length(self, query):
+        """
+        Returns the length of a translated query, as compared to the max_query_length option
+        :param query: translated query
+        :type query: str or dict
+        :rtype: int
+        """
+        return len(query) if isinstance(query, str) else len(json.dumps(query))
+
+    def can_merge_into_set(self, expression):
+        """
+        Tells if the pattern optimizer (optimize_pattern option) may merge an equality comparison with the ORed
+        ones of the same object path into a single IN comparison: its object path is one of SET_COMPARISON_PATHS
+        and all of its values can be merged.
+        :param expression: comparison expression, either Equal or IN
+        :type expression: ComparisonExpression
+        :return: True if it can be merged
+        :rtype: bool
+        """
+        if expression.object_path not in self.SET_COMPARISON_PATHS:
+            return False
+        values = expression.value.values if isinstance(expression.value, SetValue) else [expression.value]
+        return all(self.can_merge_set_value(value) for value in values)
+
+    def can_merge_set_value(self, value):
+        """
+        Tells if a value of the SET_COMPARISON_PATHS is translated alike in an IN comparison and in an equality.
+        Translators whose query constructor handles some values differently in IN comparisons override this.
+        :param value: value of a comparison expression
+        :return: True if it can be merged
+        :rtype: bool
+        """
+        return True
+
     def transform_antlr(self, data, antlr_parsing_object):
         """
         Transforms STIX pattern into a different query format. Based on a mapping file
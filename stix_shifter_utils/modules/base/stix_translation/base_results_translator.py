@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from stix_shifter_utils.utils import json_facade
 import os
 from stix_shifter_utils.utils import logger
 from stix_shifter_utils.utils.file_helper import read_json as helper_read_json
@@ -21,14 +22,26 @@ class BaseResultTranslator(object, metaclass=ABCMeta):
     def read_json(self, filepath, options):
         return helper_read_json(filepath, options)
 
+    @staticmethod
+    def load_json(value):
+        """
+        Parses JSON text, values already parsed (ie. the records returned by a results connector) are returned as they are
+        :param value: JSON text or parsed value
+        :type value: str, bytes, list or dict
+        :return: parsed value
+        """
+        if isinstance(value, (str, bytes, bytearray)):
+            return json_facade.loads(value)
+        return value
+
     @abstractmethod
     def translate_results(self, data_source, data):
         """
         Translates data into STIX results based on a mapping file
-        :param data_source: STIX identity object representing a data source
-        :type data_source: str
-        :param data: data to translate into STIX format
-        :type data: str
+        :param data_source: STIX identity object representing a data source, JSON text or dict
+        :type data_source: str or dict
+        :param data: data to translate into STIX format, JSON text or the list of records
+        :type data: str or list
         :param mapping: The mapping file path to use as instructions on how to translate the given data to STIX.
         :  This should default to something if it hasn't been passed in
         :type mapping: str (filepath)
@@ -37,3 +50,36 @@ class BaseResultTranslator(object, metaclass=ABCMeta):
         """
         # if translating some datasource to STIX results...
         raise NotImplementedError()
+
+    def translate_results_columns(self, data_source, columns, rows):
+        """
+        Translates tabular data (ie. the result set of a SQL query) into STIX results
+        This default implementation translates the records built from each row, translators able to translate rows
+        directly override it.
+        :param data_source: STIX identity object representing a data source, JSON text or dict
+        :type data_source: str or dict
+        :param columns: the column names, shared by all the rows
+        :type columns: list
+        :param rows: the rows, tuples or lists of values in the order of columns
+        :type rows: iterable
+        :return: translated STIX formatted results
+        :rtype: dict
+        """
+        columns = list(columns)
+        return self.translate_results(data_source, [dict(zip(columns, row)) for row in rows])
+
+    def translate_results_stream(self, data_source, data):
+        """
+        Translates data into STIX objects, yielded one at a time
+        This default implementation yields the objects of the translate_results bundle, translators able to translate
+        records one at a time override it to keep memory use independent of the size of data.
+        :param data_source: STIX identity object representing a data source, JSON text or dict
+        :type data_source: str or dict
+        :param data: data to translate into STIX format, JSON text or any iterable of records
+        :type data: str or iterable
+        :return: translated STIX objects
+        :rtype: generator
+        """
+        if not isinstance(data, (str, bytes, bytearray, list)):
+            data = list(data)
+        yield from self.translate_results(data_source, data)['objects']
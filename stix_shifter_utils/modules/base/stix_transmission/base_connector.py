@@ -3,7 +3,6 @@ from .base_query_connector import BaseQueryConnector
 from .base_status_connector import BaseStatusConnector
 from .base_delete_connector import BaseDeleteConnector
 from .base_results_connector import BaseResultsConnector
-import json
 import time
 
 
@@ -96,7 +95,40 @@ class BaseConnector:
         if result.get('success'):
             data = result['data']
             data = data[:length]
-            result = entry_point.translate_results(data_source, json.dumps(data))
+            result = entry_point.translate_results(data_source, data)
+            stats.append({'action': 'translation', 'time': int(time.time()*1000)})
+        result['stats'] = stats
+        return result
+
+
+class BaseAsyncConnector:
+    """
+    Coroutine version of BaseConnector, run by an asyncio event loop
+    """
+
+    async def create_query_connection(self, query):
+        raise NotImplementedError()
+
+    async def create_status_connection(self, search_id):
+        raise NotImplementedError()
+
+    async def create_results_connection(self, search_id, offset, length):
+        raise NotImplementedError()
+
+    async def delete_query_connection(self, search_id):
+        raise NotImplementedError()
+
+    async def ping_connection(self):
+        raise NotImplementedError()
+
+    async def create_results_stix_connection(self, entry_point, search_id, offset, length, data_source):
+        stats = []
+        result = await entry_point.create_results_connection_async(search_id, offset, length)
+        stats.append({'action': 'transmission', 'time': int(time.time()*1000)})
+        if result.get('success'):
+            data = result['data']
+            data = data[:length]
+            result = entry_point.translate_results(data_source, data)
             stats.append({'action': 'translation', 'time': int(time.time()*1000)})
         result['stats'] = stats
         return result
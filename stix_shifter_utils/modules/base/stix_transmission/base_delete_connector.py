@@ -17,3 +17,12 @@ class BaseDeleteConnector(object, metaclass=ABCMeta):
                     error (str): error message (when success=False)
         """
         raise NotImplementedError()
+
+
+class BaseAsyncDeleteConnector(object, metaclass=ABCMeta):
+    @abstractmethod
+    async def delete_query_connection(self, search_id):
+        """
+        Coroutine version of BaseDeleteConnector.delete_query_connection, run by an asyncio event loop
+        """
+        raise NotImplementedError()
@@ -17,3 +17,12 @@ class BasePingConnector(object, metaclass=ABCMeta):
                     error (str): error message (when success=False)
         """
         raise NotImplementedError()
+
+
+class BaseAsyncPingConnector(object, metaclass=ABCMeta):
+    @abstractmethod
+    async def ping_connection(self):
+        """
+        Coroutine version of BasePingConnector.ping_connection, run by an asyncio event loop
+        """
+        raise NotImplementedError()
@@ -18,3 +18,12 @@ class BaseQueryConnector(object, metaclass=ABCMeta):
                     error (str): error message (when success=False)
         """
         raise NotImplementedError()
+
+
+class BaseAsyncQueryConnector(object, metaclass=ABCMeta):
+    @abstractmethod
+    async def create_query_connection(self, query):
+        """
+        Coroutine version of BaseQueryConnector.create_query_connection, run by an asyncio event loop
+        """
+        raise NotImplementedError()
@@ -1,5 +1,4 @@
 from abc import ABCMeta, abstractmethod
-import json
 import time
 
 
@@ -30,7 +29,28 @@ class BaseResultsConnector(object, metaclass=ABCMeta):
         if result.get('success'):
             data = result['data']
             data = data[:int(length)]
-            result = entry_point.translate_results(data_source, json.dumps(data))
+            result = entry_point.translate_results(data_source, data)
+            stats.append({'action': 'translation', 'time': int(time.time()*1000)})
+        result['stats'] = stats
+        return result
+
+
+class BaseAsyncResultsConnector(object, metaclass=ABCMeta):
+    @abstractmethod
+    async def create_results_connection(self, search_id, offset, length):
+        """
+        Coroutine version of BaseResultsConnector.create_results_connection, run by an asyncio event loop
+        """
+        raise NotImplementedError()
+
+    async def create_results_stix_connection(self, entry_point, search_id, offset, length, data_source):
+        stats = []
+        result = await entry_point.create_results_connection_async(search_id, offset, length)
+        stats.append({'action': 'transmission', 'time': int(time.time()*1000)})
+        if result.get('success'):
+            data = result['data']
+            data = data[:int(length)]
+            result = entry_point.translate_results(data_source, data)
             stats.append({'action': 'translation', 'time': int(time.time()*1000)})
         result['stats'] = stats
         return result
@@ -28,3 +28,12 @@ class BaseStatusConnector(object, metaclass=ABCMeta):
                     error (str): error message (when success=False)
         """
         raise NotImplementedError()
+
+
+class BaseAsyncStatusConnector(object, metaclass=ABCMeta):
+    @abstractmethod
+    async def create_status_connection(self, search_id):
+        """
+        Coroutine version of BaseStatusConnector.create_status_connection, run by an asyncio event loop
+        """
+        raise NotImplementedError()
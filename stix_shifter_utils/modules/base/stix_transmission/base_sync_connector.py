@@ -3,7 +3,7 @@ from .base_query_connector import BaseQueryConnector
 from .base_status_connector import BaseStatusConnector
 from .base_delete_connector import BaseDeleteConnector
 from .base_results_connector import BaseResultsConnector
-from .base_connector import BaseConnector
+from .base_connector import BaseConnector, BaseAsyncConnector
 
 
 class BaseSyncConnector(BaseConnector):
@@ -16,3 +16,14 @@ class BaseSyncConnector(BaseConnector):
     def delete_query_connection(self, search_id):
         return {"success": True}
 
+
+
+class BaseAsyncSyncConnector(BaseAsyncConnector):
+    async def create_query_connection(self, query):
+        return {"success": True, "search_id": query}
+
+    async def create_status_connection(self, search_id):
+        return {"success": True, "status": "COMPLETED", "progress": 100}
+
+    async def delete_query_connection(self, search_id):
+        return {"success": True}
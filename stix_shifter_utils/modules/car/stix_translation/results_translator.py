@@ -1,6 +1,5 @@
 from stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix import JSONToStix
 from os import path
-import json
 
 
 class CarBaseResultsTranslator(JSONToStix):
@@ -11,20 +10,23 @@ class CarBaseResultsTranslator(JSONToStix):
   def translate_results(self, data_source, data, options, mapping=None):
       """
       Translates JSON data into STIX results based on a mapping file
-      :param data: JSON formatted data to translate into STIX format
-      :type data: str
+      :param data: JSON formatted data to translate into STIX format, or the already parsed list of records
+      :type data: str or list
       :param mapping: The mapping file path to use as instructions on how to translate the given JSON data to STIX. Defaults the path to whatever is passed into the constructor for JSONToSTIX (This should be the to_stix_map.json in the module's json directory)
       :type mapping: str (filepath)
       :return: STIX formatted results
       :rtype: str
       """
 
-      json_data = json.loads(data)
-      for obj in json_data:
+      json_data = []
+      for obj in self.load_json(data):
+        # the records of the caller are left untouched
+        obj = dict(obj)
         typ = obj.pop('object', '')
         fields = obj.pop('fields', [])
         for field in fields:
           obj[f"{typ}.{field}"] = fields[field]
+        json_data.append(obj)
 
-      return super().translate_results(data_source, json.dumps(json_data))
+      return super().translate_results(data_source, json_data)
 
@@ -1,4 +1,3 @@
-import json
 import importlib
 from stix_shifter_utils.modules.base.stix_translation.base_results_translator import BaseResultTranslator
 from stix_shifter_utils.stix_translation.src.utils.exceptions import LoadJsonResultsException, TranslationResultException
@@ -9,22 +8,20 @@ class JSONToStix(BaseResultTranslator):
     def translate_results(self, data_source, data):
         """
         Translates JSON data into STIX results based on a mapping file
-        :param data: JSON formatted data to translate into STIX format
-        :type data: str
+        :param data_source: STIX identity object representing a data source, JSON text or dict
+        :type data_source: str or dict
+        :param data: data to translate into STIX format, JSON text or the already parsed list of records
+        :type data: str or list
         :return: STIX formatted results
         :rtype: str
         """
         try:
-            json_data = json.loads(data)
-            data_source = json.loads(data_source)
+            json_data = self.load_json(data)
+            data_source = self.load_json(data_source)
         except Exception:
             raise LoadJsonResultsException()
 
-        try:
-            json_to_stix_translator = importlib.import_module('stix_shifter_modules.%s.stix_translation.json_to_stix_translator' % self.module_name)
-        except Exception as ex:
-            # fall back to default
-            json_to_stix_translator = importlib.import_module('stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix_translator')
+        json_to_stix_translator = self._json_to_stix_translator()
 
         try:
             results = json_to_stix_translator.convert_to_stix(data_source, self.map_data, json_data, self.transformers, self.options, self.callback)
@@ -32,3 +29,68 @@ class JSONToStix(BaseResultTranslator):
             raise TranslationResultException("Error when converting results to STIX: {}".format(ex))
         
         return results
+
+    def translate_results_columns(self, data_source, columns, rows):
+        """
+        Translates tabular data into STIX results based on a mapping file, without building a record per row
+        :param columns: the column names, shared by all the rows
+        :type columns: list
+        :param rows: the rows, tuples or lists of values in the order of columns
+        :type rows: iterable
+        :return: STIX formatted results
+        :rtype: dict
+        """
+        json_to_stix_translator = self._json_to_stix_translator()
+        if type(self).translate_results is not JSONToStix.translate_results or \
+                not hasattr(json_to_stix_translator, 'convert_columns_to_stix'):
+            # the module preprocesses records
+            return super().translate_results_columns(data_source, columns, rows)
+
+        try:
+            data_source = self.load_json(data_source)
+        except Exception:
+            raise LoadJsonResultsException()
+
+        try:
+            results = json_to_stix_translator.convert_columns_to_stix(data_source, self.map_data, columns, rows,
+                                                                      self.transformers, self.options, self.callback)
+        except Exception as ex:
+            raise TranslationResultException("Error when converting results to STIX: {}".format(ex))
+
+        return results
+
+    def translate_results_stream(self, data_source, data):
+        """
+        Translates JSON data into STIX objects one record at a time
+        :param data: JSON formatted data or any iterable of records (ie. a generator reading them from a file)
+        :type data: str or iterable
+        :return: the objects translate_results would bundle, in the same order
+        :rtype: generator
+        """
+        json_to_stix_translator = self._json_to_stix_translator()
+        if type(self).translate_results is not JSONToStix.translate_results or \
+                not hasattr(json_to_stix_translator, 'stream_stix'):
+            # the module works on the whole result set, records can not be streamed
+            return super().translate_results_stream(data_source, data)
+
+        try:
+            json_data = self.load_json(data)
+            data_source = self.load_json(data_source)
+        except Exception:
+            raise LoadJsonResultsException()
+        return self._stream_results(json_to_stix_translator.stream_stix(
+            data_source, self.map_data, json_data, self.transformers, self.options, self.callback))
+
+    @staticmethod
+    def _stream_results(objects):
+        try:
+            yield from objects
+        except Exception as ex:
+            raise TranslationResultException("Error when converting results to STIX: {}".format(ex))
+
+    def _json_to_stix_translator(self):
+        try:
+            return importlib.import_module('stix_shifter_modules.%s.stix_translation.json_to_stix_translator' % self.module_name)
+        except Exception as ex:
+            # fall back to default
+            return importlib.import_module('stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix_translator')
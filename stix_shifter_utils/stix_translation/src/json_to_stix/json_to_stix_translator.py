@@ -1,39 +1,279 @@
-import re
+import atexit
+import functools
+import hashlib
+import itertools
+import math
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
 import uuid
 import json
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from stix_shifter_utils.stix_translation.src.json_to_stix import observable
+from stix_shifter_utils.stix_translation.src.json_to_stix.to_stix_plan import get_plan, DEFAULT
 from stix2validator import validate_instance, print_results
 from datetime import datetime
 from stix_shifter_utils.utils import logger
+from stix_shifter_utils.utils.lru_cache import LRUCache
 
 # "ID Contributing Properties" taken from https://docs.oasis-open.org/cti/stix/v2.1/csprd01/stix-v2.1-csprd01.html#_Toc16070594
 UUID5_NAMESPACE = "00abedb4-aa42-466c-9c01-fed23315a9b7"
+UUID5_NAMESPACE_UUID = uuid.UUID(UUID5_NAMESPACE)
 NUMBER_OBSERVED_KEY = 'number_observed'
 FIRST_OBSERVED_KEY = 'first_observed'
 LAST_OBSERVED_KEY = 'last_observed'
+# records translated by a worker at a time, smaller result sets are not worth the inter-process round trips
+TRANSLATE_CHUNK_SIZE_MIN = 250
+# chunks per worker, so that a worker given slower records does not hold up the others
+TRANSLATE_CHUNKS_PER_WORKER = 4
+# translators a worker process keeps, with their compiled mapping plan, for the translations of different mappings,
+# data sources or options
+TRANSLATORS_PER_WORKER = 8
+SCO_ID_CACHE_SIZE_DEFAULT = 4096
+# distinct values whose transformation is remembered, per cacheable transformer and translation
+TRANSFORM_CACHE_SIZE = int(os.getenv('STIXSHIFTER_TRANSFORM_CACHE_SIZE', 1024))
+
+# Deterministic ids of the cybox objects recurring in results (the same addresses, hosts, files...), keyed by the
+# content their id is generated from
+sco_id_cache = LRUCache(int(os.getenv('STIXSHIFTER_SCO_ID_CACHE_SIZE', SCO_ID_CACHE_SIZE_DEFAULT)))
+_NOT_BATCHED = object()
 
 
 # convert JSON data to STIX object using map_data and transformers
 def convert_to_stix(data_source, map_data, data, transformers, options, callback=None):
 
     ds2stix = DataSourceObjToStixObj(data_source, map_data, transformers, options, callback)
+    workers = int(options.get('translate_workers') or 1)
+    chunks = _chunks(data, workers) if workers > 1 and isinstance(data, list) else None
+    if chunks and len(chunks) > 1:
+        ds2stix.bundle["objects"] = ds2stix.translate_in_pool(chunks, workers)
+    else:
+        ds2stix.bundle["objects"] = list(ds2stix.iter_objects(data))
 
-    # map data list to list of transformed objects
-    observation = ds2stix.transform
-    results = list(map(observation, data))
+    return ds2stix.bundle
 
-    for stix_object in results:
-        if ds2stix.spec_version == "2.1":
-            del stix_object["objects"]
-        ds2stix.bundle["objects"].append(stix_object)
 
-    for key, value in ds2stix.unique_cybox_objects.items():
-        ds2stix.bundle["objects"].append(value)
+def stream_stix(data_source, map_data, data, transformers, options, callback=None):
+    """
+    Translates JSON data to STIX objects one record at a time, the objects are those of the convert_to_stix bundle
+    :param data: the data source records, any iterable
+    :return: generator of the data source identity, an observed-data object per record and, for STIX 2.1,
+        the deduplicated cybox objects once all records have been translated
+    """
+    ds2stix = DataSourceObjToStixObj(data_source, map_data, transformers, options, callback)
+    return ds2stix.iter_objects(data)
+
+
+def convert_columns_to_stix(data_source, map_data, columns, rows, transformers, options, callback=None):
+    """
+    Translates tabular data to STIX, the bundle is the one convert_to_stix returns for the records dict(zip(columns, row))
+    :param columns: the column names, shared by all the rows
+    :type columns: list
+    :param rows: the rows, tuples or lists of values in the order of columns
+    :type rows: iterable
+    :return: STIX bundle
+    :rtype: dict
+    """
+    ds2stix = DataSourceObjToStixObj(data_source, map_data, transformers, options, callback)
+    layout = ColumnLayout(columns, map_data, options.get('unmapped_fallback'))
+    ds2stix.bundle["objects"] = list(ds2stix.iter_objects([ColumnRow(layout, row) for row in rows]))
 
     return ds2stix.bundle
 
 
+def _content_key(value):
+    # hashable form of a property value, equal only for values serialized to the same JSON (ie. not True and 1)
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return dict, tuple((key, _content_key(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return list, tuple(_content_key(item) for item in value)
+    return type(value), value
+
+
+def deterministic_id(cybox_type, cybox_properties):
+    """
+    Returns the STIX 2.1 id of a cybox object, a UUIDv5 of its ID contributing properties
+    :param cybox_type: object type
+    :type cybox_type: str
+    :param cybox_properties: the properties of the object, without its id and references
+    :type cybox_properties: dict
+    :rtype: str
+    """
+    try:
+        key = (cybox_type, _content_key(cybox_properties))
+        hash(key)
+    except TypeError:
+        key = None
+    if key is not None:
+        unique_id = sco_id_cache.get(key)
+        if unique_id is not None:
+            return unique_id
+    unique_id = cybox_type + "--" + str(uuid.uuid5(namespace=UUID5_NAMESPACE_UUID, name=json.dumps(cybox_properties)))
+    if key is not None:
+        sco_id_cache.put(key, unique_id)
+    return unique_id
+
+
+def _memoize_transform(transform):
+    # typed, so that ie. 1, 1.0 and True are transformed separately
+    cached = functools.lru_cache(maxsize=TRANSFORM_CACHE_SIZE, typed=True)(transform)
+    # results of the values of the page being translated, transformed at once, keyed by value and type
+    batched = {}
+
+    def memoized(value):
+        try:
+            hash(value)
+        except TypeError:
+            # unhashable values (lists, dicts) are not cached
+            return transform(value)
+        if batched:
+            result = batched.get((value, type(value)), _NOT_BATCHED)
+            if result is not _NOT_BATCHED:
+                return result
+        return cached(value)
+    memoized.batched = batched
+    return memoized
+
+
+def _chunks(data, workers):
+    size = max(TRANSLATE_CHUNK_SIZE_MIN, math.ceil(len(data) / (workers * TRANSLATE_CHUNKS_PER_WORKER)))
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+# Process pools by number of workers, kept from a translation to the next so that the pages of a result set are not
+# each translated by newly started workers
+_pools = {}
+_pools_lock = threading.Lock()
+# The translators of a worker process, keyed by the fingerprint of their pickled arguments
+_worker_translators = LRUCache(TRANSLATORS_PER_WORKER)
+
+
+def _new_pool(workers):
+    if sys.version_info < (3, 7):
+        # mp_context is not available on Python 3.6, the workers are forked
+        return ProcessPoolExecutor(max_workers=workers)
+    # the pools outlive the call, their workers may be started while other threads of the process hold locks: they
+    # are not forked from it
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    context = multiprocessing.get_context('forkserver')
+    # the fork server imports the translator once, rather than each worker it starts
+    context.set_forkserver_preload([__name__])
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+
+def _get_pool(workers):
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = _new_pool(workers)
+        return pool
+
+
+def _discard_pool(workers, pool):
+    with _pools_lock:
+        if _pools.get(workers) is pool:
+            del _pools[workers]
+
+
+def shutdown_pools():
+    """
+    Stops the worker processes of the results translations, the next translations start new ones
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_pools)
+
+
+def _translate_chunk(translator_key, translator_args, records):
+    # the worker compiles the mapping plan of a translation for its first chunk, then reuses it for the next chunks
+    # and pages (a pool initializer is not available on Python 3.6)
+    ds2stix = _worker_translators.get_or_create(
+        translator_key, lambda: DataSourceObjToStixObj(*pickle.loads(translator_args)))
+    ds2stix.unique_cybox_objects = {}
+    observations = list(ds2stix.iter_observations(records))
+    return observations, ds2stix.unique_cybox_objects
+
+
+@functools.lru_cache(maxsize=4096)
+def _unwrapped_prefixes(name):
+    # the names an object name is derived from by unwrapping, ie. ('file', 'file_0') for 'file_0_1'
+    return tuple(name[:position] for position, char in enumerate(name)
+                 if char == '_' and name[position + 1:position + 2].isdigit())
+
+
+class ObjectNameMap(dict):
+    """
+    Object names of an observation mapped to their object keys, the names of unwrapped objects (a name followed by
+    '_' and the index of the list item, ie. 'file_0' or 'file_0_1') are also indexed by the names they are derived from
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.indexed_names = {}
+
+    def __setitem__(self, name, value):
+        if name not in self and isinstance(name, str):
+            for prefix in _unwrapped_prefixes(name):
+                self.indexed_names.setdefault(prefix, []).append(name)
+        super().__setitem__(name, value)
+
+    def unwrapped(self, name):
+        """
+        Returns the object keys of the items unwrapped from name, in the order they were added
+        """
+        return [self[indexed_name] for indexed_name in self.indexed_names.get(name, ())]
+
+
+class ColumnLayout:
+    """
+    Column names of tabular results, resolved once for all their rows
+    """
+    __slots__ = ('columns', 'positions', 'translated')
+
+    def __init__(self, columns, ds_to_stix_map, unmapped_fallback=False):
+        self.columns = tuple(columns)
+        # like a dict built from the row, a repeated column keeps its first position in the order and its last value
+        self.positions = {column: position for position, column in enumerate(self.columns)}
+        # unmapped columns are skipped up front, unless the unmapped fallback adds them to a custom object
+        self.translated = tuple(column for column in self.positions if unmapped_fallback or column in ds_to_stix_map)
+
+
+class ColumnRow(Mapping):
+    """
+    Read-only record view of a row of tabular results, no dict is built per row
+    """
+    __slots__ = ('layout', 'values')
+
+    def __init__(self, layout, values):
+        self.layout = layout
+        self.values = values
+
+    def __getitem__(self, column):
+        return self.values[self.layout.positions[column]]
+
+    def __contains__(self, column):
+        return column in self.layout.positions
+
+    def __iter__(self):
+        return iter(self.layout.positions)
+
+    def __len__(self):
+        return len(self.layout.positions)
+
+
 class DataSourceObjToStixObj:
     logger = logger.set_logger(__name__)
 
@@ -51,7 +291,9 @@ class DataSourceObjToStixObj:
         self.properties = observable.properties
 
         self.data_source = data_source['name']
-        self.ds_key_map = [val for val in self.gen_dict_extract('ds_key', ds_to_stix_map)]
+        # the mapping is compiled once and shared by the translations of every page
+        self.plan = get_plan(ds_to_stix_map, transformers, self.properties)
+        self.ds_key_map = self.plan.ds_keys
 
         self.bundle = {
             "type": "bundle",
@@ -66,57 +308,114 @@ class DataSourceObjToStixObj:
             self.spec_version = "2.0"
             self.bundle["spec_version"] = "2.0"
         self.unique_cybox_objects = {}
+        self.identity = data_source
+        self.cached_transforms = {}
         self.bundle['objects'] += [data_source]
 
     @staticmethod
-    def _get_value(obj, ds_key, transformer):
+    def _get_value(obj, ds_key, transform):
         """
         Get value from source object, transforming if specified
         :param obj: the input object we are translating to STIX
         :param ds_key: the property from the input object
-        :param transformer: the transform to apply to the property value (can be None)
+        :param transform: the transform function to apply to the property value (can be None)
         :return: the resulting STIX value
         """
         if ds_key not in obj:
             DataSourceObjToStixObj.logger.debug('{} not found in object'.format(ds_key))
             return None
         ret_val = obj[ds_key]
-        if ret_val and transformer is not None:
-            return transformer.transform(ret_val)
+        if ret_val and transform is not None:
+            return transform(ret_val)
         return ret_val
 
+    def _transform_function(self, action):
+        """
+        Returns the transform function of a mapping action, memoized for this translation when its transformer is
+        cacheable
+        """
+        if not action.cacheable or not TRANSFORM_CACHE_SIZE:
+            return action.transform
+        cached = self.cached_transforms.get(action.transform)
+        if cached is None:
+            cached = self.cached_transforms[action.transform] = _memoize_transform(action.transform)
+        return cached
+
+    def transform_page(self, records):
+        """
+        Transforms the values of each top level field of a page of records at once, with the transform_many of the
+        cacheable transformers having a vectorized implementation, the records are then translated with these results
+        :param records: the data source records of the page
+        :type records: list
+        """
+        if not TRANSFORM_CACHE_SIZE or not records:
+            return
+        batch_transforms = {}
+        for ds_key, ds_key_def_obj in self.ds_to_stix_map.items():
+            ds_key_defs = ds_key_def_obj if isinstance(ds_key_def_obj, list) else [ds_key_def_obj]
+            # the definitions of a field, not the map of a complex field
+            if not all(isinstance(ds_key_def, dict) and isinstance(ds_key_def.get('key'), str)
+                       for ds_key_def in ds_key_defs):
+                continue
+            for action in self.plan.actions(ds_key_def_obj):
+                if action is not None and action.transform_many is not None and not action.has_value:
+                    # the custom attributes of an object take their value from another field
+                    field = action.ds_key if action.has_ds_key and action.has_object else ds_key
+                    batch_transforms.setdefault(action.transform, (action, set()))[1].add(field)
+        for action, fields in batch_transforms.values():
+            values = {}
+            for record in records:
+                if not isinstance(record, Mapping):
+                    continue
+                for field in fields:
+                    value = record.get(field)
+                    # _get_value does not transform empty values
+                    if value:
+                        try:
+                            values.setdefault((value, type(value)), value)
+                        except TypeError:
+                            pass
+            batched = self._transform_function(action).batched
+            batched.clear()
+            if values:
+                try:
+                    batched.update(zip(values.keys(), action.transform_many(list(values.values()))))
+                except Exception:
+                    # the records report the error of the value they fail to transform
+                    batched.clear()
+
     @staticmethod
-    def _add_property(obj, key, stix_value, group=False):
+    def _add_property(obj, path, stix_value, group=False):
         """
-        Add stix_value to dictionary based on the input key, the key can be '.'-separated path to inner object
+        Add stix_value to dictionary based on the input key path, the path can lead to an inner object
         :param obj: the dictionary we are adding our key to
-        :param key: the key to add
+        :param path: the split key to add
         :param stix_value: the STIX value translated from the input object
         """
-        split_key = key.split('.')
         child_obj = obj
-        parent_props = split_key[0:-1]
-        for prop in parent_props:
+        for prop in path[:-1]:
             if prop not in child_obj:
                 child_obj[prop] = {}
             child_obj = child_obj[prop]
 
-        if split_key[-1] not in child_obj.keys():
-            child_obj[split_key[-1]] = stix_value
+        if path[-1] not in child_obj:
+            child_obj[path[-1]] = stix_value
         elif group is True:  # Mapping of multiple data fields to single STIX object field. Ex: Network Protocols
-            if (isinstance(child_obj[split_key[-1]], list)):
-                child_obj[split_key[-1]].extend(stix_value)  # append to existing list
+            if (isinstance(child_obj[path[-1]], list)):
+                child_obj[path[-1]].extend(stix_value)  # append to existing list
 
-    def _handle_cybox_key_def(self, key_to_add, observation, stix_value, obj_name_map, obj_name, group=False):
+    def _handle_cybox_key_def(self, key_plan, observation, stix_value, obj_name_map, obj_name, group=False):
         """
         Handle the translation of the input property to its STIX CybOX property
-        :param key_to_add: STIX property key derived from the mapping file
+        :param key_plan: compiled STIX property key derived from the mapping file
         :param observation: the the STIX observation currently being worked on
         :param stix_value: the STIX value translated from the input object
         :param obj_name_map: the mapping of object name to actual object
         :param obj_name: the object name derived from the mapping file
         """
-        obj_type, obj_prop = key_to_add.split('.', 1)
+        if key_plan.cybox_key is None:
+            raise ValueError("{} is not a STIX object property".format(key_plan.key))
+        obj_type, obj_prop_path = key_plan.cybox_key
         objs_dir = observation['objects']
 
         if obj_name in obj_name_map:
@@ -138,68 +437,34 @@ class DataSourceObjToStixObj:
                 if obj_name is not None:
                     obj_name_map[obj_name] = obj_dir_key
 
-        self._add_property(cybox_obj, obj_prop, stix_value, group)
+        self._add_property(cybox_obj, obj_prop_path, stix_value, group)
 
     @staticmethod
-    def _valid_stix_value(props_map, key, stix_value, unwrap=False):
+    def _valid_stix_value(key_plan, stix_value):
         """
         Checks that the given STIX value is valid for this STIX property
-        :param props_map: the map of STIX properties which contains validation attributes
-        :param key: the STIX property name
+        :param key_plan: the compiled STIX property key, with its validation regex
         :param stix_value: the STIX value translated from the input object
-        :param unwrap: unwrapping datasource field value of type list
         :return: whether STIX value is valid for this STIX property
         :rtype: bool
         """
 
         if stix_value is None or stix_value == '':
-            DataSourceObjToStixObj.logger.debug("Removing invalid value '{}' for {}".format(stix_value, key))
+            DataSourceObjToStixObj.logger.debug("Removing invalid value '{}' for {}".format(stix_value, key_plan.key))
             return False
         elif isinstance(stix_value, list):
             if len(stix_value) == 0:
-                DataSourceObjToStixObj.logger.debug("Removing invalid value '{}' for {}".format(stix_value, key))
+                DataSourceObjToStixObj.logger.debug("Removing invalid value '{}' for {}".format(stix_value, key_plan.key))
                 return False
-        elif key in props_map and 'valid_regex' in props_map[key]:
-            pattern = re.compile(props_map[key]['valid_regex'])
-            if unwrap and isinstance(stix_value, list):
-                for val in stix_value:
-                    if not pattern.match(str(val)):
-                        return False
-            else:
-                if not pattern.match(str(stix_value)):
-                    return False
+        elif key_plan.valid_regex is not None and not key_plan.valid_regex.match(str(stix_value)):
+            return False
         return True
 
-    # get the nested ds_keys in the mapping
-    def gen_dict_extract(self, key, var):
-        if hasattr(var, 'items'):
-            for k, v in var.items():
-                if k == key:
-                    yield v
-                if isinstance(v, dict):
-                    for result in self.gen_dict_extract(key, v):
-                        yield result
-                elif isinstance(v, list):
-                    for d in v:
-                        for result in self.gen_dict_extract(key, d):
-                            yield result
-    # update the object key of the mapping
-    @staticmethod
-    def _update_object_key(ds_map, indx):
-        for key, value in ds_map.items():
-            if isinstance(value, dict):
-                if 'object' in value:
-                    value['object'] = str(value['object']) +'_' + str(indx)
-            if isinstance(value, list):
-                for item in value:
-                    if 'object' in item:
-                        item['object'] = str(item['object']) +'_' + str(indx)
-                        if 'references' in item:
-                            item['references'] = str(item['references']) +'_' + str(indx)
-
-        return ds_map
-
-    def _transform(self, object_map, observation, ds_map, ds_key, obj):
+    def _transform(self, object_map, observation, ds_map, ds_key, obj, index=None):
+        """
+        Adds the STIX properties mapped from the ds_key field of obj to the observation
+        :param index: the index of obj when it is an item of an unwrapped list, its object names are suffixed with it
+        """
 
         to_map = obj[ds_key]
 
@@ -213,7 +478,8 @@ class DataSourceObjToStixObj:
                     if to_map is None or to_map == '':
                         self.logger.debug("Removing invalid value '{}' for {}".format(to_map, ds_key))
                         return
-                    self._handle_cybox_key_def(cust_obj["key"], observation, to_map, object_map, cust_obj["object"])
+                    self._handle_cybox_key_def(self.plan.key_plan(cust_obj["key"]), observation, to_map, object_map,
+                                               cust_obj["object"])
             else:
                 self.logger.debug('{} is not found in map, skipping'.format(ds_key))
             return
@@ -228,124 +494,96 @@ class DataSourceObjToStixObj:
         # if the datasource fields is a collection of json object than we need to unwrap it and create multiple objects
         if isinstance(to_map, list):
             self.logger.debug('{} is a list; unwrapping.'.format(to_map))
-            for item in to_map:
+            item_ds_map = ds_map[ds_key]
+            for item_index, item in enumerate(to_map):
                 if isinstance(item, dict):
-                    new_ds_map = self._update_object_key(ds_map[ds_key], to_map.index(item))
                     for field in item.keys():
-                        self._transform(object_map, observation, new_ds_map, field, item)
+                        self._transform(object_map, observation, item_ds_map, field, item, item_index)
         
-        generic_hash_key = ''
+        generic_hash_key = None
 
         # get the stix keys that are mapped
         ds_key_def_obj = ds_map[ds_key]
-        if isinstance(ds_key_def_obj, list):
-            ds_key_def_list = ds_key_def_obj
-        else:
+        if not isinstance(ds_key_def_obj, list):
             # Use callback function to run module-specific logic to handle unknown filehash types
             if self.callback:
                 try:
                     generic_hash_key = self.callback(obj, ds_key, ds_key_def_obj['key'], self.options)
                 except(Exception):
                     return
-
-            ds_key_def_list = [ds_key_def_obj]
-
-
-        for ds_key_def in ds_key_def_list:
-            if ds_key_def is None or 'key' not in ds_key_def:
-                self.logger.debug('{} is not valid (None, or missing key)'.format(ds_key_def))
-                continue
-
             if generic_hash_key:
-                key_to_add = generic_hash_key
-            else:
-                key_to_add = ds_key_def['key']
-
-            transformer = self.transformers[ds_key_def['transformer']] if 'transformer' in ds_key_def else None
+                generic_hash_key = self.plan.key_plan(generic_hash_key)
 
-            group = False
-            unwrap = False
+        for action in self.plan.actions(ds_key_def_obj):
+            if action is None:
+                self.logger.debug('{} is not valid (None, or missing key)'.format(ds_key_def_obj))
+                continue
 
-            # unwrap array of stix values to separate stix objects
-            if 'unwrap' in ds_key_def:
-                unwrap = True
+            key_plan = generic_hash_key or action.key_plan
+            group = action.group
+            unwrap = action.unwrap
+            cybox = self.cybox_default if action.cybox is DEFAULT else action.cybox
 
-            if ds_key_def.get('cybox', self.cybox_default):
-                object_name = ds_key_def.get('object')
-                if 'references' in ds_key_def:
-                    references = ds_key_def['references']
+            if cybox:
+                object_name = action.object_name_at(index)
+                references = action.references_at(index)
+                if action.has_references:
                     if isinstance(references, list):
                         stix_value = []
                         for ref in references:
                             if unwrap:
-                                pattern = re.compile("{}_[0-9]+".format(ref))
-                                for obj_name in object_map:
-                                    if pattern.match(obj_name):
-                                        val = object_map.get(obj_name)
-                                        stix_value.append(val)
+                                stix_value.extend(object_map.unwrapped(ref))
                             else:
                                 val = object_map.get(ref)
-                                if not self._valid_stix_value(self.properties, key_to_add, val):
+                                if not self._valid_stix_value(key_plan, val):
                                     continue
                                 stix_value.append(val)
                         if not stix_value:
                             continue
                     else:
                         if unwrap:
-                            stix_value = []
-                            pattern = re.compile("{}_[0-9]+".format(references))
-                            for obj_name in object_map:
-                                if pattern.match(obj_name):
-                                    val = object_map.get(obj_name)
-                                    stix_value.append(val)
+                            stix_value = object_map.unwrapped(references)
                         else:
                             stix_value = object_map.get(references)
-                            if not self._valid_stix_value(self.properties, key_to_add, stix_value):
+                            if not self._valid_stix_value(key_plan, stix_value):
                                 continue
                 else:
                     # use the hard-coded value in the mapping
-                    if 'value' in ds_key_def:
-                        stix_value = ds_key_def['value']
+                    if action.has_value:
+                        stix_value = action.value
                     else:
-                        stix_value = self._get_value(obj, ds_key, transformer)
-                    if not self._valid_stix_value(self.properties, key_to_add, stix_value, unwrap):
+                        stix_value = self._get_value(obj, ds_key, self._transform_function(action))
+                    if not self._valid_stix_value(key_plan, stix_value):
                         continue
 
-                # Group Values
-                if 'group' in ds_key_def:
-                    group = True
-
-                if unwrap and 'references' not in ds_key_def and isinstance(stix_value, list):
+                if unwrap and not action.has_references and isinstance(stix_value, list):
                     self.logger.debug("Unwrapping {} of {}".format(stix_value, object_name))
                     for i in range(len(stix_value)):
                         obj_i_name = "{}_{}".format(object_name, i + 1)
                         val = stix_value[i]
-                        self._handle_cybox_key_def(key_to_add, observation, val, object_map,
-                                                                     obj_i_name, group)
+                        self._handle_cybox_key_def(key_plan, observation, val, object_map, obj_i_name, group)
                 else:
-                    self._handle_cybox_key_def(key_to_add, observation, stix_value, object_map,
-                                                                 object_name, group)
+                    self._handle_cybox_key_def(key_plan, observation, stix_value, object_map, object_name, group)
             else:
                 # get the object name defined for custom attributes
-                if 'object' in ds_key_def:
-                    object_name = ds_key_def.get('object')
+                if action.has_object:
+                    object_name = action.object_name_at(index)
                     # use the hard-coded value in the mapping
-                    if 'value' in ds_key_def:
-                        stix_value = ds_key_def['value']
+                    if action.has_value:
+                        stix_value = action.value
                     # get the value from mapped key
-                    elif 'ds_key' in ds_key_def:
-                        ds_key = ds_key_def['ds_key']
-                        stix_value = self._get_value(obj, ds_key, transformer)
-                    if not self._valid_stix_value(self.properties, key_to_add, stix_value):
+                    elif action.has_ds_key:
+                        ds_key = action.ds_key
+                        stix_value = self._get_value(obj, ds_key, self._transform_function(action))
+                    if not self._valid_stix_value(key_plan, stix_value):
                         continue
-                    self._handle_cybox_key_def(key_to_add, observation, stix_value, object_map,
-                                                                 object_name, group)
+                    self._handle_cybox_key_def(key_plan, observation, stix_value, object_map, object_name, group)
                 else:
-                    stix_value = self._get_value(obj, ds_key, transformer)
-                    if not self._valid_stix_value(self.properties, key_to_add, stix_value):
+                    stix_value = self._get_value(obj, ds_key, self._transform_function(action))
+                    if not self._valid_stix_value(key_plan, stix_value):
                         continue
 
-                    self._add_property(observation, key_to_add, stix_value, group)
+                    self._add_property(observation, key_plan.path, stix_value, group)
 
     # STIX 2.1 helper methods
     def _generate_and_apply_deterministic_id(self, object_id_map, cybox_objects):
@@ -359,9 +597,9 @@ class DataSourceObjToStixObj:
             for property, value in cybox.items():
                 if property == "type":
                     cybox_type = value
-                if not (property == "id" or re.match(".*_ref$", property)):
+                if not (property == "id" or property.endswith("_ref")):
                     cybox_properties[property] = value
-            unique_id = cybox_type + "--" + str(uuid.uuid5(namespace=uuid.UUID(UUID5_NAMESPACE), name=json.dumps(cybox_properties)))
+            unique_id = deterministic_id(cybox_type, cybox_properties)
             # set id mapping value to new id
             object_id_map[key] = unique_id
             # replace old id with new
@@ -371,7 +609,7 @@ class DataSourceObjToStixObj:
         for key, cybox in cybox_objects.items():
             # replace refs with new ids
             for property, value in cybox.items():
-                if re.match(".*_ref$", property) and str(value) in object_id_map:
+                if property.endswith("_ref") and str(value) in object_id_map:
                     cybox[property] = object_id_map[value]
             cybox["spec_version"] = "2.1"
 
@@ -380,13 +618,63 @@ class DataSourceObjToStixObj:
             if not cybox["id"] in self.unique_cybox_objects:
                 self.unique_cybox_objects[cybox["id"]] = cybox
 
+    def iter_objects(self, data):
+        """
+        Yields the data source identity, the observation of each record of data, then the unique cybox objects
+        of STIX 2.1 observations
+        :param data: the data source records
+        """
+        yield self.identity
+        yield from self.iter_observations(data)
+        yield from self.unique_cybox_objects.values()
+
+    def iter_observations(self, data):
+        """
+        Yields the observation of each record of data, collecting the unique cybox objects of STIX 2.1 observations
+        :param data: the data source records
+        """
+        if isinstance(data, list):
+            self.transform_page(data)
+        for obj in data:
+            stix_object = self.transform(obj)
+            if self.spec_version == "2.1":
+                del stix_object["objects"]
+            yield stix_object
+
+    def translate_in_pool(self, chunks, workers):
+        """
+        Translates chunks of records in a process pool, the objects are those iter_objects yields for all the records
+        :param chunks: the data source records, split in lists
+        :param workers: number of worker processes
+        :return: the data source identity, the observations of the records in order, then the unique cybox objects
+        """
+        objects = [self.identity]
+        # pickled once for all the chunks, the workers which already have the translator do not unpickle them
+        translator_args = pickle.dumps((self.identity, self.ds_to_stix_map, self.transformers, self.options,
+                                        self.callback))
+        translator_key = hashlib.sha256(translator_args).hexdigest()
+        pool = _get_pool(workers)
+        try:
+            for observations, cybox_objects in pool.map(_translate_chunk, itertools.repeat(translator_key),
+                                                        itertools.repeat(translator_args), chunks):
+                objects.extend(observations)
+                # chunks come back in order, the first occurrence of a deterministic id is kept like the serial path
+                for cybox_id, cybox in cybox_objects.items():
+                    self.unique_cybox_objects.setdefault(cybox_id, cybox)
+        except BrokenProcessPool:
+            # a worker died, the next translation starts a new pool
+            _discard_pool(workers, pool)
+            raise
+        objects.extend(self.unique_cybox_objects.values())
+        return objects
+
     def transform(self, obj):
         """
         Transforms the given object in to a STIX observation based on the mapping file and transform functions
         :param obj: the datasource object that is being converted to stix
         :return: the input object converted to stix valid json
         """
-        object_map = {}
+        object_map = ObjectNameMap()
         stix_type = 'observed-data'
         ds_map = self.ds_to_stix_map
         now = "{}Z".format(datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3])
@@ -402,7 +690,10 @@ class DataSourceObjToStixObj:
         }
 
         # create normal type objects
-        if isinstance(obj, dict):
+        if isinstance(obj, ColumnRow):
+            for ds_key in obj.layout.translated:
+                self._transform(object_map, observation, ds_map, ds_key, obj)
+        elif isinstance(obj, dict):
             for ds_key in obj.keys():
                 self._transform(object_map, observation, ds_map, ds_key, obj)
         else:
@@ -0,0 +1,148 @@
+import os
+import re
+from stix_shifter_utils.stix_translation.src.utils.transformers import ValueTransformer
+from stix_shifter_utils.utils.lru_cache import LRUCache
+
+PLAN_CACHE_SIZE_DEFAULT = 64
+
+# Compiled plans keyed by the identity of their to_stix mapping and transformers. An entry holds references to both,
+# so their ids can not be reused by other objects while it is cached.
+plan_cache = LRUCache(int(os.getenv('STIXSHIFTER_TO_STIX_PLAN_CACHE_SIZE', PLAN_CACHE_SIZE_DEFAULT)))
+
+DEFAULT = object()
+
+
+class KeyPlan:
+    """
+    Everything derived from a STIX key of the mapping (ie. 'ipv4-addr.value' or 'first_observed')
+    """
+    __slots__ = ('key', 'cybox_key', 'path', 'valid_regex')
+
+    def __init__(self, key, properties):
+        self.key = key
+        # object type and property path of a cybox key, None when the key has no '.'
+        split_key = key.split('.', 1)
+        self.cybox_key = (split_key[0], tuple(split_key[1].split('.'))) if len(split_key) == 2 else None
+        self.path = tuple(key.split('.'))
+        valid_regex = properties[key].get('valid_regex') if key in properties else None
+        self.valid_regex = re.compile(valid_regex) if valid_regex else None
+
+
+class MappingAction:
+    """
+    A prebound data source key definition of the mapping, ie. {"key": "ipv4-addr.value", "object": "src_ip"}
+    """
+    __slots__ = ('key_plan', 'transform', 'cacheable', 'transform_many', 'unwrap', 'group', 'cybox', 'has_object', 'object_name', 'has_references',
+                 'references', 'indexed_references', 'has_value', 'value', 'has_ds_key', 'ds_key')
+
+    def __init__(self, ds_key_def, plan, in_list=False):
+        self.key_plan = plan.key_plan(ds_key_def['key'])
+        transformer = plan.transformers[ds_key_def['transformer']] if 'transformer' in ds_key_def else None
+        self.transform = transformer.transform if transformer is not None else None
+        self.cacheable = getattr(transformer, 'cacheable', False)
+        # the batch transformation of a cacheable transformer, when it has its own
+        transform_many = getattr(transformer, 'transform_many', None)
+        self.transform_many = transform_many if self.cacheable and transform_many is not None and \
+            getattr(transform_many, '__func__', None) is not ValueTransformer.transform_many.__func__ else None
+        self.unwrap = 'unwrap' in ds_key_def
+        self.group = 'group' in ds_key_def
+        self.cybox = ds_key_def.get('cybox', DEFAULT)
+        self.has_object = 'object' in ds_key_def
+        self.object_name = ds_key_def.get('object')
+        self.has_references = 'references' in ds_key_def
+        self.references = ds_key_def.get('references')
+        # the references of a definition list are suffixed with the index of the unwrapped item too
+        self.indexed_references = in_list and self.has_object and self.has_references
+        self.has_value = 'value' in ds_key_def
+        self.value = ds_key_def.get('value')
+        self.has_ds_key = 'ds_key' in ds_key_def
+        self.ds_key = ds_key_def.get('ds_key')
+
+    def object_name_at(self, index):
+        """
+        Returns the object name of the definition applied to the index-th item of an unwrapped list of records,
+        None for the definitions of records which are not list items
+        """
+        if index is None or not self.has_object:
+            return self.object_name
+        return str(self.object_name) + '_' + str(index)
+
+    def references_at(self, index):
+        """
+        Returns the references of the definition applied to the index-th item of an unwrapped list of records
+        """
+        if index is None or not self.indexed_references:
+            return self.references
+        return str(self.references) + '_' + str(index)
+
+
+class ToStixPlan:
+    """
+    Compiled form of a to_stix mapping: the mapping is interpreted once, the records of every translated page then
+    only run the prebound actions of their data source keys.
+    Nodes are compiled the first time they are used and kept by identity, the mapping must not be modified.
+    The object names of the items of unwrapped lists are derived when they are used, the mapping is never copied.
+    """
+
+    def __init__(self, ds_to_stix_map, transformers, properties):
+        self.ds_to_stix_map = ds_to_stix_map
+        self.transformers = transformers
+        self.properties = properties
+        self.ds_keys = frozenset(gen_dict_extract('ds_key', ds_to_stix_map))
+        self._actions = {}
+        self._key_plans = {}
+
+    def key_plan(self, key):
+        key_plan = self._key_plans.get(key)
+        if key_plan is None:
+            key_plan = self._key_plans[key] = KeyPlan(key, self.properties)
+        return key_plan
+
+    def actions(self, ds_key_def_obj):
+        """
+        Returns the actions of the definition (or list of definitions) of a data source key
+        """
+        entry = self._actions.get(id(ds_key_def_obj))
+        if entry is None:
+            in_list = isinstance(ds_key_def_obj, list)
+            ds_key_def_list = ds_key_def_obj if in_list else [ds_key_def_obj]
+            actions = tuple(MappingAction(ds_key_def, self, in_list)
+                            if ds_key_def is not None and 'key' in ds_key_def else None
+                            for ds_key_def in ds_key_def_list)
+            # the node is kept with its actions so its id is not reused
+            entry = self._actions[id(ds_key_def_obj)] = (ds_key_def_obj, actions)
+        return entry[1]
+
+
+def gen_dict_extract(key, var):
+    # get the nested ds_keys in the mapping
+    if hasattr(var, 'items'):
+        for k, v in var.items():
+            if k == key:
+                yield v
+            if isinstance(v, dict):
+                for result in gen_dict_extract(key, v):
+                    yield result
+            elif isinstance(v, list):
+                for d in v:
+                    for result in gen_dict_extract(key, d):
+                        yield result
+
+
+def get_plan(ds_to_stix_map, transformers, properties):
+    """
+    Returns the compiled plan of a to_stix mapping, shared by every translation using the same mapping
+    :param ds_to_stix_map: to_stix mapping
+    :type ds_to_stix_map: dict
+    :param transformers: value transformers by name
+    :type transformers: dict
+    :param properties: STIX properties validation attributes
+    :type properties: dict
+    :rtype: ToStixPlan
+    """
+    key = (id(ds_to_stix_map), id(transformers), id(properties))
+    plan = plan_cache.get(key)
+    if plan is None or plan.ds_to_stix_map is not ds_to_stix_map or plan.transformers is not transformers \
+            or plan.properties is not properties:
+        plan = plan_cache.put(key, ToStixPlan(ds_to_stix_map, transformers, properties))
+    return plan
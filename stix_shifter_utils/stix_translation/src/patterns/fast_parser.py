@@ -0,0 +1,277 @@
+import re
+
+import dateutil.parser
+from .pattern_objects import ObservationExpression, CombinedComparisonExpression, ObservationOperators, \
+    ComparisonExpressionOperators, ComparisonComparators, SetValue, ComparisonExpression, CombinedObservationExpression, \
+    Pattern, StartStopQualifier
+
+# A hand-written lexer and recursive-descent parser for the STIX patterning grammar (grammar/STIXPattern.g4).
+# It builds the very same pattern objects as STIXQueryBuilder does from the ANTLR parse tree, including the
+# builder's quirks (operands of combined comparison expressions are stored right-to-left, WITHIN and REPEATS
+# qualifiers are dropped, NOT is ignored by ISSUPERSET), but without the ANTLR runtime overhead.
+# Anything it does not handle raises UnsupportedPatternSyntax, the caller is expected to fall back to ANTLR.
+
+
+class UnsupportedPatternSyntax(Exception):
+    pass
+
+
+# Token alternatives are ordered so that the first matching alternative is also the longest ANTLR token.
+_TOKEN_REGEX = re.compile(r"""
+    (?P<WS>[ \t\r\n\u000B\u000C\u0085\u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+)
+  | (?P<COMMENT>/\*.*?\*/|//[^\r\n]*)
+  | (?P<TIMESTAMP>t'[0-9]{4}-(?:0[1-9]|1[012])-(?:0[1-9]|[12][0-9]|3[01])T(?:[01][0-9]|2[0-3]):[0-5][0-9]:(?:[0-5][0-9]|60)(?:\.[0-9]+)?Z')
+  | (?P<HEX>h'(?:[A-Fa-f0-9]{2})*')
+  | (?P<BINARY>b'(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{4}|[A-Za-z0-9+/]{3}=|[A-Za-z0-9+/]{2}==)')
+  | (?P<STRING>'(?:[^'\\]|\\'|\\\\)*')
+  | (?P<FLOAT>[+-]?[0-9]*\.[0-9]+)
+  | (?P<INT>[+-]?(?:0|[1-9][0-9]*))
+  | (?P<WORD>[a-zA-Z_][a-zA-Z0-9_-]*)
+  | (?P<OP>==|!=|<>|<=|>=|[=<>:.,()\[\]*])
+""", re.VERBOSE | re.DOTALL)
+
+_KEYWORDS = {'AND', 'OR', 'NOT', 'FOLLOWEDBY', 'LIKE', 'MATCHES', 'ISSUPERSET', 'ISSUBSET', 'LAST', 'IN', 'START',
+             'STOP', 'SECONDS', 'WITHIN', 'REPEATS', 'TIMES'}
+_OPERATORS = {'=': 'EQ', '==': 'EQ', '!=': 'NEQ', '<>': 'NEQ', '<': 'LT', '<=': 'LE', '>': 'GT', '>=': 'GE',
+              ':': 'COLON', '.': 'DOT', ',': 'COMMA', '(': 'LPAREN', ')': 'RPAREN', '[': 'LBRACK', ']': 'RBRACK',
+              '*': 'ASTERISK'}
+_EOF = ('EOF', '')
+
+_EQUALITY_COMPARATORS = {'EQ': ComparisonComparators.Equal, 'NEQ': ComparisonComparators.NotEqual}
+_ORDER_COMPARATORS = {
+    'GT': ComparisonComparators.GreaterThan,
+    'LT': ComparisonComparators.LessThan,
+    'GE': ComparisonComparators.GreaterThanOrEqual,
+    'LE': ComparisonComparators.LessThanOrEqual
+}
+_STRING_COMPARATORS = {
+    'LIKE': ComparisonComparators.Like,
+    'MATCHES': ComparisonComparators.Matches,
+    'ISSUBSET': ComparisonComparators.IsSubSet,
+    'ISSUPERSET': ComparisonComparators.IsSuperSet
+}
+_ORDERABLE_LITERALS = {'INT_POS', 'INT_NEG', 'FLOAT_POS', 'FLOAT_NEG', 'STRING', 'BINARY', 'HEX', 'TIMESTAMP'}
+
+
+def tokenize(pattern):
+    tokens = []
+    append = tokens.append
+    match = _TOKEN_REGEX.match
+    position = 0
+    length = len(pattern)
+    while position < length:
+        m = match(pattern, position)
+        if not m:
+            raise UnsupportedPatternSyntax("Unexpected character {!r} at {}".format(pattern[position], position))
+        kind = m.lastgroup
+        text = m.group()
+        position = m.end()
+        if kind == 'WS' or kind == 'COMMENT':
+            continue
+        if kind == 'WORD':
+            if '-' in text:
+                kind = 'IDENT_HYPHEN'
+            elif text in _KEYWORDS:
+                kind = text
+            elif text == 'true' or text == 'false':
+                kind = 'BOOL'
+            else:
+                kind = 'IDENT'
+        elif kind == 'OP':
+            kind = _OPERATORS[text]
+        elif kind == 'INT':
+            kind = 'INT_NEG' if text[0] == '-' else 'INT_POS'
+        elif kind == 'FLOAT':
+            kind = 'FLOAT_NEG' if text[0] == '-' else 'FLOAT_POS'
+        append((kind, text))
+    append(_EOF)
+    return tokens
+
+
+class FastPatternParser:
+
+    def __init__(self, pattern):
+        self._tokens = tokenize(pattern)
+        self._index = 0
+
+    def _peek(self):
+        return self._tokens[self._index][0]
+
+    def _next(self):
+        token = self._tokens[self._index]
+        self._index += 1
+        return token
+
+    def _expect(self, *kinds):
+        token = self._next()
+        if token[0] not in kinds:
+            raise UnsupportedPatternSyntax("Expected {} but found {!r}".format(' or '.join(kinds), token[1]))
+        return token
+
+    def parse(self):
+        pattern = Pattern(self._observation_expressions())
+        self._expect('EOF')
+        return pattern
+
+    def _observation_expressions(self):
+        expression = self._observation_expression_or()
+        while self._peek() == 'FOLLOWEDBY':
+            self._index += 1
+            expression = CombinedObservationExpression(expression, self._observation_expression_or(),
+                                                       ObservationOperators.FollowedBy)
+        return expression
+
+    def _observation_expression_or(self):
+        expression = self._observation_expression_and()
+        while self._peek() == 'OR':
+            self._index += 1
+            expression = CombinedObservationExpression(expression, self._observation_expression_and(),
+                                                       ObservationOperators.Or)
+        return expression
+
+    def _observation_expression_and(self):
+        expression = self._observation_expression()
+        while self._peek() == 'AND':
+            self._index += 1
+            expression = CombinedObservationExpression(expression, self._observation_expression(),
+                                                       ObservationOperators.And)
+        return expression
+
+    def _observation_expression(self):
+        kind = self._next()[0]
+        if kind == 'LBRACK':
+            expression = ObservationExpression(self._comparison_expression())
+            self._expect('RBRACK')
+        elif kind == 'LPAREN':
+            expression = self._observation_expressions()
+            self._expect('RPAREN')
+        else:
+            raise UnsupportedPatternSyntax("Observation expression expected")
+
+        while True:
+            kind = self._peek()
+            if kind == 'START':
+                self._index += 1
+                start = self._expect('TIMESTAMP')[1]
+                self._expect('STOP')
+                stop = self._expect('TIMESTAMP')[1]
+                expression = StartStopQualifier('START' + start + 'STOP' + stop, expression, start, stop)
+            elif kind == 'WITHIN':
+                # parsed but, as with the ANTLR query builder, not part of the resulting pattern
+                self._index += 1
+                self._expect('INT_POS', 'FLOAT_POS')
+                self._expect('SECONDS')
+            elif kind == 'REPEATS':
+                self._index += 1
+                self._expect('INT_POS')
+                self._expect('TIMES')
+            else:
+                return expression
+
+    def _comparison_expression(self):
+        expression = self._comparison_expression_and()
+        while self._peek() == 'OR':
+            self._index += 1
+            expression = CombinedComparisonExpression(self._comparison_expression_and(), expression,
+                                                      ComparisonExpressionOperators.Or)
+        return expression
+
+    def _comparison_expression_and(self):
+        expression = self._prop_test()
+        while self._peek() == 'AND':
+            self._index += 1
+            expression = CombinedComparisonExpression(self._prop_test(), expression,
+                                                      ComparisonExpressionOperators.And)
+        return expression
+
+    def _prop_test(self):
+        if self._peek() == 'LPAREN':
+            self._index += 1
+            expression = self._comparison_expression()
+            self._expect('RPAREN')
+            return expression
+
+        object_path = self._object_path()
+        negated = self._peek() == 'NOT'
+        if negated:
+            self._index += 1
+        kind = self._next()[0]
+        if kind in _EQUALITY_COMPARATORS:
+            return ComparisonExpression(object_path, self._literal(), _EQUALITY_COMPARATORS[kind], negated=negated)
+        if kind in _ORDER_COMPARATORS:
+            return ComparisonExpression(object_path, self._literal(), _ORDER_COMPARATORS[kind], negated=negated)
+        if kind == 'IN':
+            return ComparisonExpression(object_path, self._set_literal(), ComparisonComparators.In, negated=negated)
+        if kind in _STRING_COMPARATORS:
+            kind_value, text = self._expect('STRING')
+            value = self._literal_value(kind_value, text)
+            if kind == 'ISSUPERSET':
+                negated = False
+            return ComparisonExpression(object_path, value, _STRING_COMPARATORS[kind], negated=negated)
+        raise UnsupportedPatternSyntax("Comparison operator expected")
+
+    def _object_path(self):
+        parts = [self._expect('IDENT', 'IDENT_HYPHEN')[1], self._expect('COLON')[1],
+                 self._expect('IDENT', 'STRING')[1]]
+        while True:
+            kind = self._peek()
+            if kind == 'DOT':
+                parts.append(self._next()[1])
+                parts.append(self._expect('IDENT', 'STRING')[1])
+            elif kind == 'LBRACK':
+                parts.append(self._next()[1])
+                parts.append(self._expect('INT_POS', 'INT_NEG', 'ASTERISK')[1])
+                parts.append(self._expect('RBRACK')[1])
+            else:
+                return ''.join(parts)
+
+    def _set_literal(self):
+        self._expect('LPAREN')
+        values = SetValue()
+        if self._peek() == 'RPAREN':
+            self._index += 1
+        else:
+            values.append(self._literal())
+            while self._next()[0] == 'COMMA':
+                values.append(self._literal())
+            self._index -= 1
+            self._expect('RPAREN')
+        values.close()
+        return values
+
+    def _literal(self):
+        kind, text = self._next()
+        if kind not in _ORDERABLE_LITERALS:
+            # boolean literals included: the ANTLR query builder does not handle them
+            raise UnsupportedPatternSyntax("Unsupported literal {!r}".format(text))
+        return self._literal_value(kind, text)
+
+    @staticmethod
+    def _literal_value(kind, text):
+        if kind == 'STRING':
+            return text.strip("'").replace("\\\\", "\\")
+        if kind == 'INT_POS' or kind == 'INT_NEG':
+            return int(text)
+        if kind == 'FLOAT_POS' or kind == 'FLOAT_NEG':
+            return float(text)
+        if kind == 'TIMESTAMP':
+            return dateutil.parser.parse(text.strip("'").strip("t"))
+        # binary and hex literals are left as strings
+        return text
+
+
+def parse_pattern(pattern):
+    """
+    Parses a STIX pattern into pattern objects
+    :param pattern: STIX pattern
+    :type pattern: str
+    :return: parsed pattern
+    :rtype: Pattern
+    :raises UnsupportedPatternSyntax: for invalid patterns or syntax this parser does not handle
+    """
+    try:
+        return FastPatternParser(pattern).parse()
+    except UnsupportedPatternSyntax:
+        raise
+    except Exception as e:
+        raise UnsupportedPatternSyntax(e)
@@ -0,0 +1,196 @@
+import dateutil.parser
+from .pattern_objects import ComparisonExpression, CombinedComparisonExpression, ComparisonComparators, \
+    ComparisonExpressionOperators, ObservationExpression, CombinedObservationExpression, ObservationOperators, \
+    StartStopQualifier, SetValue
+from .traversal import transform_chains, flatten, combine, iter_nodes
+
+# Rewrites a parsed pattern into an equivalent, smaller one:
+# - duplicate operands of AND/OR chains are removed, as are the comparisons absorbed by a sibling
+#   (a OR (a AND b) is a)
+# - ORed equality comparisons of the same object path are merged into a single IN comparison, this also applies
+#   to ORed observation expressions made of a single such comparison ([x:y = 'a'] OR [x:y = 'b'])
+# - ORed START/STOP qualified observation expressions sharing the same time window get a single qualifier
+# Merging overlapping (but different) windows would widen the matched time range, so only identical ones are merged.
+
+
+def _value_key(value):
+    if isinstance(value, SetValue):
+        return ('SetValue', tuple(_value_key(item) for item in value.values))
+    try:
+        hash(value)
+    except TypeError:
+        return ('id', id(value))
+    return (type(value).__name__, value)
+
+
+def _window(qualifier):
+    try:
+        return tuple(dateutil.parser.parse(timestamp.strip("t'")) for timestamp in (qualifier.start, qualifier.stop))
+    except (ValueError, OverflowError):
+        return (qualifier.start, qualifier.stop)
+
+
+def node_key(root):
+    """
+    Returns a hashable key of the tree under root, equal trees have equal keys
+    :param root: pattern tree
+    :type root: PatternObject
+    :rtype: tuple
+    """
+    key = []
+    for node in iter_nodes(root):
+        if isinstance(node, ComparisonExpression):
+            key.append((ComparisonExpression, node.object_path, node.comparator, bool(node.negated),
+                        _value_key(node.value)))
+        elif isinstance(node, StartStopQualifier):
+            key.append((StartStopQualifier, _window(node)))
+        elif hasattr(node, 'operator'):
+            key.append((type(node), node.operator))
+        else:
+            key.append(type(node))
+    return tuple(key)
+
+
+class PatternOptimizer:
+
+    def __init__(self, can_merge_into_set=None):
+        """
+        :param can_merge_into_set: tells if an equality comparison may be merged into an IN comparison, i.e. the
+            query constructor translates IN comparisons of its object path like the equivalent ORed equalities.
+            No comparison is merged when not set.
+        :type can_merge_into_set: function
+        """
+        self.can_merge_into_set = can_merge_into_set
+
+    def optimize(self, pattern):
+        return transform_chains(pattern, self._optimize_chain)
+
+    def _optimize_chain(self, node, operands):
+        if isinstance(node, CombinedComparisonExpression):
+            optimized = self._remove_redundant(operands, node.operator, CombinedComparisonExpression)
+            if node.operator == ComparisonExpressionOperators.Or:
+                optimized = self._merge_comparisons(optimized)
+        elif node.operator == ObservationOperators.Or:
+            # [a] AND [a] needs two matching observations, only ORed observation expressions are idempotent.
+            # Some constructors translate observation AND like OR, so ([a] AND [b]) is not absorbed by [a] either.
+            optimized = self._remove_redundant(operands, node.operator, CombinedObservationExpression, absorb=False)
+            optimized = self._merge_qualifiers(optimized)
+            optimized = self._merge_observations(optimized)
+        else:
+            return node
+        if len(optimized) == len(operands) and all(a is b for a, b in zip(optimized, operands)):
+            return node
+        return combine(optimized, node.operator)
+
+    @staticmethod
+    def _remove_redundant(operands, operator, node_class, absorb=True):
+        keys = [node_key(operand) for operand in operands]
+        all_keys = set(keys)
+        kept = []
+        seen = set()
+        for operand, key in zip(operands, keys):
+            if key in seen:
+                continue
+            if absorb and isinstance(operand, node_class) and operand.operator != operator and \
+                    any(node_key(inner) in all_keys for inner in flatten(operand)):
+                # absorbed by a sibling: a OR (a AND b) is a, a AND (a OR b) is a
+                continue
+            seen.add(key)
+            kept.append(operand)
+        return kept
+
+    def _is_mergeable(self, expression):
+        if not isinstance(expression, ComparisonExpression) or expression.negated or not self.can_merge_into_set:
+            return False
+        if expression.comparator == ComparisonComparators.Equal:
+            if isinstance(expression.value, SetValue) or _value_key(expression.value)[0] == 'id':
+                return False
+        elif expression.comparator != ComparisonComparators.In or not isinstance(expression.value, SetValue):
+            return False
+        return self.can_merge_into_set(expression)
+
+    def _merge_comparisons(self, operands, comparisons=None, wrap=None):
+        """
+        Merges the mergeable comparisons of the same object path into an IN comparison, which takes the place
+        of the first of them. comparisons and wrap are used for observation expressions: the comparison of each
+        operand and a function building the operand of a merged comparison.
+        """
+        if comparisons is None:
+            comparisons = operands
+        mergeable = [self._is_mergeable(comparison) for comparison in comparisons]
+        groups = {}
+        for comparison, is_mergeable in zip(comparisons, mergeable):
+            if is_mergeable:
+                groups.setdefault(comparison.object_path, []).append(comparison)
+
+        merged = []
+        for operand, comparison, is_mergeable in zip(operands, comparisons, mergeable):
+            group = groups[comparison.object_path] if is_mergeable else None
+            if not group or len(group) == 1:
+                merged.append(operand)
+            elif comparison is group[0]:
+                set_comparison = self._set_comparison(group)
+                merged.append(wrap(set_comparison) if wrap else set_comparison)
+        return merged
+
+    @staticmethod
+    def _set_comparison(group):
+        values = SetValue()
+        seen = set()
+        for expression in group:
+            items = expression.value.values if expression.comparator == ComparisonComparators.In else \
+                [expression.value]
+            for item in items:
+                key = _value_key(item)
+                if key not in seen:
+                    seen.add(key)
+                    values.append(item)
+        values.close()
+        return ComparisonExpression(group[0].object_path, values, ComparisonComparators.In)
+
+    def _merge_qualifiers(self, operands):
+        groups = {}
+        for operand in operands:
+            if isinstance(operand, StartStopQualifier):
+                groups.setdefault(_window(operand), []).append(operand)
+
+        merged = []
+        for operand in operands:
+            if not isinstance(operand, StartStopQualifier):
+                merged.append(operand)
+                continue
+            group = groups[_window(operand)]
+            if len(group) == 1:
+                merged.append(operand)
+            elif operand is group[0]:
+                inner = []
+                for qualified in group:
+                    expression = qualified.observation_expression
+                    if isinstance(expression, CombinedObservationExpression) and \
+                            expression.operator == ObservationOperators.Or:
+                        inner.extend(flatten(expression))
+                    else:
+                        inner.append(expression)
+                inner = self._remove_redundant(inner, ObservationOperators.Or, CombinedObservationExpression,
+                                               absorb=False)
+                inner = self._merge_observations(inner)
+                merged.append(StartStopQualifier(operand.qualifier, combine(inner, ObservationOperators.Or),
+                                                 operand.start, operand.stop))
+        return merged
+
+    def _merge_observations(self, operands):
+        comparisons = [operand.comparison_expression if isinstance(operand, ObservationExpression) else None
+                       for operand in operands]
+        return self._merge_comparisons(operands, comparisons, ObservationExpression)
+
+def optimize_pattern(pattern, can_merge_into_set=None):
+    """
+    Returns an equivalent pattern with fewer comparisons, the input pattern is not modified
+    :param pattern: parsed STIX pattern
+    :type pattern: Pattern
+    :param can_merge_into_set: tells if an equality comparison may be merged into an IN comparison
+    :type can_merge_into_set: function
+    :return: optimized pattern
+    :rtype: Pattern
+    """
+    return PatternOptimizer(can_merge_into_set).optimize(pattern)
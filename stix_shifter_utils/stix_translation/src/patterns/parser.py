@@ -1,13 +1,24 @@
 import logging
+import os
 
 import dateutil.parser
 from antlr4 import CommonTokenStream, ParseTreeWalker, InputStream
+from antlr4.tree.Tree import ErrorNode, TerminalNode
 from .grammar import STIXPatternListener, STIXPatternParser, STIXPatternLexer
 from .pattern_objects import ObservationExpression, CombinedComparisonExpression, ObservationOperators, \
-    ComparisonExpressionOperators, ComparisonComparators, SetValue, ComparisonExpression, CombinedObservationExpression, Pattern, Qualifier, StartStopQualifier
+    ComparisonExpressionOperators, ComparisonComparators, SetValue, ComparisonExpression, CombinedObservationExpression, Pattern, Qualifier, StartStopQualifier, \
+    freeze
+from .fast_parser import parse_pattern as parse_pattern_fast, UnsupportedPatternSyntax
+from stix_shifter_utils.utils.lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 DEBUG = logger.getEffectiveLevel() == logging.DEBUG
+PATTERN_CACHE_SIZE_DEFAULT = 256
+PARSER_ANTLR = 'antlr'
+PARSER_FAST = 'fast'
+
+# Parsed patterns keyed by parser engine and pattern text, shared across dialects and translator instances
+pattern_cache = LRUCache(int(os.getenv('STIXSHIFTER_PATTERN_CACHE_SIZE', PATTERN_CACHE_SIZE_DEFAULT)))
 
 
 class STIXQueryBuilder(STIXPatternListener):
@@ -245,6 +256,27 @@ class STIXQueryBuilder(STIXPatternListener):
         negated = ctx.NOT()
         self.push(ComparisonExpression(object_path, value, ComparisonComparators.IsSubSet, negated=negated))
 
+class IterativeParseTreeWalker(ParseTreeWalker):
+    """ Same events as ParseTreeWalker.walk, but the tree is walked with an explicit stack instead of recursion.
+    ANTLR nests a context per operand of a left-recursive rule, so the depth of the parse tree grows with the
+    number of comparisons of the pattern. """
+
+    def walk(self, listener, t):
+        # (node, False) entries enter the node, (node, True) entries exit it once its children were walked
+        stack = [(t, False)]
+        while stack:
+            node, exiting = stack.pop()
+            if exiting:
+                self.exitRule(listener, node)
+            elif isinstance(node, ErrorNode):
+                listener.visitErrorNode(node)
+            elif isinstance(node, TerminalNode):
+                listener.visitTerminal(node)
+            else:
+                self.enterRule(listener, node)
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(list(node.getChildren())))
+
 # copied from CASCADE data_model (defined twice)
 
 
@@ -264,14 +296,29 @@ class ParserError(ValueError):
     pass
 
 
-def generate_query(query_string):
+def generate_query(query_string, pattern_parser=None):
+    """
+    Parses a STIX pattern into pattern objects
+    :param query_string: STIX pattern
+    :type query_string: str
+    :param pattern_parser: parser engine, 'antlr' (default) or 'fast'. The fast parser falls back to ANTLR for
+        syntax it does not handle.
+    :type pattern_parser: str
+    :return: parsed pattern
+    :rtype: Pattern
+    """
+    if pattern_parser == PARSER_FAST:
+        try:
+            return parse_pattern_fast(query_string)
+        except UnsupportedPatternSyntax as e:
+            logger.debug("Fast pattern parser fell back to ANTLR: {}".format(e))
     try:
         lexer = STIXPatternLexer(InputStream(query_string))
         stream = CommonTokenStream(lexer)
         parser = STIXPatternParser(stream)
         builder = STIXQueryBuilder()
         tree = parser.pattern()
-        walker = ParseTreeWalker()
+        walker = IterativeParseTreeWalker()
         walker.walk(builder, tree)
         query = builder.pop()
         logger.debug(query)
@@ -279,3 +326,12 @@ def generate_query(query_string):
         raise ParserError(e)
 
     return query
+
+
+def generate_query_cached(query_string, pattern_parser=None):
+    """
+    Same as generate_query, but the parsed pattern is cached and shared between callers.
+    The returned pattern is frozen: strip_unmapped_attributes derives a writable working copy from it.
+    """
+    return pattern_cache.get_or_create((pattern_parser or PARSER_ANTLR, query_string),
+                                       lambda: freeze(generate_query(query_string, pattern_parser)))
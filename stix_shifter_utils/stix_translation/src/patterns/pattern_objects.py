@@ -1,5 +1,6 @@
 from enum import Enum
 import typing
+import copy
 import re
 
 
@@ -46,6 +47,40 @@ class ObservationOperators(Enum):
         return self._name_
 
 
+class PatternObject:
+    """ Base class of the pattern tree nodes.
+    A frozen node is shared (e.g. held by the parsed pattern cache) and rejects attribute assignment,
+    callers that need to change it must work on a copy() instead.
+    child_fields names the attributes holding the child nodes, in evaluation order. """
+    _frozen = False
+    child_fields = ()
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError("{} is frozen, modify a copy() of it instead".format(type(self).__name__))
+        super().__setattr__(name, value)
+
+    def copy(self):
+        """ Returns a writable shallow copy of this node, child nodes are shared with the original """
+        clone = copy.copy(self)
+        clone.__dict__.pop('_frozen', None)
+        return clone
+
+    def is_frozen(self):
+        return self._frozen
+
+
+def freeze(root):
+    """ Freezes every node of the pattern tree under root """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, PatternObject) and not node._frozen:
+            stack.extend(node.__dict__.values())
+            object.__setattr__(node, '_frozen', True)
+    return root
+
+
 class STIX2Value:
     pass
 
@@ -72,7 +107,7 @@ class SetValue(STIX2Value):
         return "({})".format(str(self.values).lstrip('[').rstrip(']'))
 
 
-class BaseComparisonExpression:
+class BaseComparisonExpression(PatternObject):
     pass
 
 
@@ -92,6 +127,8 @@ class ComparisonExpression(BaseComparisonExpression):
 
 
 class CombinedComparisonExpression(BaseComparisonExpression):
+    child_fields = ('expr1', 'expr2')
+
     def __init__(self, expr1: BaseComparisonExpression, expr2: BaseComparisonExpression,
                  operator: ComparisonExpressionOperators) -> None:
         if not all((isinstance(expr1, BaseComparisonExpression), isinstance(expr2, BaseComparisonExpression),
@@ -107,11 +144,13 @@ class CombinedComparisonExpression(BaseComparisonExpression):
                                                                                  expr2=self.expr2)
 
 
-class BaseObservationExpression:
+class BaseObservationExpression(PatternObject):
     pass
 
 
 class ObservationExpression(BaseObservationExpression):
+    child_fields = ('comparison_expression',)
+
     def __init__(self, comparison_expression: BaseComparisonExpression) -> None:
         if not isinstance(comparison_expression, BaseComparisonExpression):
             raise RuntimeWarning("{} constructor called with wrong types".format(__class__)) # noqa: F821
@@ -124,6 +163,8 @@ class ObservationExpression(BaseObservationExpression):
 class CombinedObservationExpression(BaseObservationExpression):
     # This method is recursively hit when there are more than two base observation expressions
     # A CombinedObservationExpression will only contain up to two ObservationExpressions, joined by an ObservationOperator
+    child_fields = ('expr1', 'expr2')
+
     def __init__(self, expr1: BaseObservationExpression, expr2: BaseObservationExpression,
                  operator: ObservationOperators) -> None:
         self.expr1 = expr1
@@ -158,11 +199,13 @@ class CombinedObservationExpression(BaseObservationExpression):
                                                                                   expr2=self.expr2)
 
 
-class BaseQualifier:
+class BaseQualifier(PatternObject):
     pass
 
 
 class Qualifier(BaseQualifier):
+    child_fields = ('observation_expression',)
+
     def __init__(self, qualifier, observation_expression: BaseObservationExpression) -> None:
         if not isinstance(observation_expression, BaseObservationExpression):
             raise RuntimeWarning("{} constructor called with wrong types".format(__class__)) # noqa: F821
@@ -193,7 +236,9 @@ class StartStopQualifier(Qualifier):
     def __repr__(self) -> str:
         return "{observation_expression} StartStopQualifier({qualifier}, start={start}, stop={stop})".format(observation_expression=self.observation_expression, qualifier=self.qualifier, start=self.start, stop=self.stop)
 
-class Pattern:
+class Pattern(PatternObject):
+    child_fields = ('expression',)
+
     def __init__(self, expression: BaseObservationExpression, qualifier=None) -> None:
         self.expression = expression
 
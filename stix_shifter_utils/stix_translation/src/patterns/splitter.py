@@ -0,0 +1,102 @@
+from .pattern_objects import ComparisonExpression, ComparisonComparators, ComparisonExpressionOperators, \
+    ObservationOperators, SetValue, Qualifier, StartStopQualifier
+from .traversal import iter_nodes, chain_heads, flatten, combine, replace_node
+
+# Splits a pattern into several patterns matching, together, the same data as the original one.
+# The comparison and observation operators (AND, OR, FOLLOWEDBY) and the START STOP qualifier are monotonic (NOT only
+# applies to a single comparison), so a pattern P(x OR y), where x OR y is any OR chain or non negated IN comparison
+# of P, matches what P(x) OR P(y) matches: each part of a split pattern can be translated and run as a query of its
+# own. REPEATS is not: [x OR y] REPEATS 2 TIMES matches an x followed by a y, which neither part would. The parsers
+# drop the REPEATS and WITHIN qualifiers, a pattern still holding any qualifier but START STOP is not split.
+
+
+def _set_of(expression):
+    if isinstance(expression, ComparisonExpression) and expression.comparator == ComparisonComparators.In \
+            and isinstance(expression.value, SetValue) and not expression.negated:
+        return expression.value.values
+    return None
+
+
+def _set_comparison(expression, values):
+    value = SetValue()
+    for item in values:
+        value.append(item)
+    value.close()
+    split = expression.copy()
+    split.value = value
+    return split
+
+
+def _oversized_set(pattern, max_set_size):
+    for node in iter_nodes(pattern):
+        values = _set_of(node)
+        if values is not None and len(values) > max_set_size:
+            return node
+    return None
+
+
+def _splittable(pattern):
+    return not any(isinstance(node, Qualifier) and not isinstance(node, StartStopQualifier)
+                   for node in iter_nodes(pattern))
+
+
+def split_sets(pattern, max_set_size):
+    """
+    Splits pattern until none of its IN comparisons has more than max_set_size values.
+    Negated IN comparisons can not be split and are left as they are, as are patterns with qualifiers other than
+    START STOP.
+    :param pattern: parsed STIX pattern
+    :type pattern: Pattern
+    :param max_set_size: maximum number of values of an IN comparison
+    :type max_set_size: int
+    :return: patterns
+    :rtype: list
+    """
+    if not _splittable(pattern):
+        return [pattern]
+    parts = []
+    pending = [pattern]
+    while pending:
+        part = pending.pop(0)
+        oversized = _oversized_set(part, max_set_size)
+        if oversized is None:
+            parts.append(part)
+            continue
+        values = _set_of(oversized)
+        pending[0:0] = [replace_node(part, oversized, _set_comparison(oversized, values[i:i + max_set_size]))
+                        for i in range(0, len(values), max_set_size)]
+    return parts
+
+
+def split_in_half(pattern):
+    """
+    Splits the largest OR chain or IN comparison of pattern in two halves
+    :param pattern: parsed STIX pattern
+    :type pattern: Pattern
+    :return: the two halves, or None when nothing can be split
+    :rtype: list
+    """
+    if not _splittable(pattern):
+        return None
+    largest = None
+    largest_size = 1
+    for node in chain_heads(pattern):
+        if node.operator in (ComparisonExpressionOperators.Or, ObservationOperators.Or):
+            operands = flatten(node)
+            if len(operands) > largest_size:
+                largest, largest_size = node, len(operands)
+    for node in iter_nodes(pattern):
+        values = _set_of(node)
+        if values and len(values) > largest_size:
+            largest, largest_size = node, len(values)
+    if largest is None:
+        return None
+
+    middle = largest_size // 2
+    if isinstance(largest, ComparisonExpression):
+        values = _set_of(largest)
+        halves = [_set_comparison(largest, values[:middle]), _set_comparison(largest, values[middle:])]
+    else:
+        operands = flatten(largest)
+        halves = [combine(operands[:middle], largest.operator), combine(operands[middle:], largest.operator)]
+    return [replace_node(pattern, largest, half) for half in halves]
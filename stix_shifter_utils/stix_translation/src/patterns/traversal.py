@@ -0,0 +1,240 @@
+from .pattern_objects import CombinedComparisonExpression, CombinedObservationExpression, ComparisonExpressionOperators, \
+    ObservationOperators
+
+# Explicit-stack traversal of pattern trees.
+# Patterns built from large indicator lists are chains of thousands of CombinedComparisonExpression (or
+# CombinedObservationExpression) nodes, walking them with recursive functions needs one interpreter frame per
+# operand. The helpers below use their own stacks instead, so the tree depth is only limited by memory.
+
+# Chains with more operands than this are rebalanced by balance()
+BALANCE_THRESHOLD = 64
+
+# Operators for which the order of evaluation of a chain does not matter
+_ASSOCIATIVE_OPERATORS = {
+    CombinedComparisonExpression: (ComparisonExpressionOperators.And, ComparisonExpressionOperators.Or),
+    CombinedObservationExpression: (ObservationOperators.And, ObservationOperators.Or)
+}
+
+
+def children(node):
+    """
+    Returns the child nodes of a pattern node, in evaluation order
+    :param node: pattern node
+    :type node: PatternObject
+    :return: child nodes
+    :rtype: list
+    """
+    return [getattr(node, field) for field in getattr(node, 'child_fields', ())]
+
+
+def iter_nodes(root):
+    """
+    Yields every node of the tree under root in pre-order (parents first, expr1 before expr2)
+    :param root: pattern tree
+    :type root: PatternObject
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(children(node)))
+
+
+def transform(root, visit):
+    """
+    Rebuilds the tree under root bottom-up.
+    visit(node, new_children) is called once per node, after all of its children were visited. new_children maps the
+    node's child fields to the values visit returned for them, the value visit returns for node takes its place in
+    the result.
+    :param root: pattern tree
+    :type root: PatternObject
+    :param visit: node callback
+    :type visit: function
+    :return: the value visit returned for root
+    """
+    # (node, True) entries are visited once the results of their children are on the results stack
+    stack = [(root, False)]
+    results = []
+    while stack:
+        node, children_done = stack.pop()
+        fields = getattr(node, 'child_fields', ())
+        if children_done:
+            new_children = {}
+            for field in reversed(fields):
+                new_children[field] = results.pop()
+            results.append(visit(node, new_children))
+        else:
+            stack.append((node, True))
+            for field in reversed(fields):
+                stack.append((getattr(node, field), False))
+    return results.pop()
+
+
+def replace_children(node, new_children):
+    """
+    Returns node with its children replaced, the node is copied unless all of the children are unchanged
+    :param node: pattern node
+    :type node: PatternObject
+    :param new_children: child field to new child node
+    :type new_children: dict
+    :return: node or an updated copy of it
+    :rtype: PatternObject
+    """
+    if all(getattr(node, field) is child for field, child in new_children.items()):
+        return node
+    node = node.copy()
+    for field, child in new_children.items():
+        setattr(node, field, child)
+    return node
+
+
+def is_chain(node, operator_node):
+    """
+    Tells if node continues the chain of operator_node, i.e. it is combined with the same associative operator
+    """
+    return type(node) is type(operator_node) and node.operator == operator_node.operator and \
+        node.operator in _ASSOCIATIVE_OPERATORS.get(type(node), ())
+
+
+def flatten(expression):
+    """
+    Flattens a chain of combined expressions joined by the same associative operator into its operands, i.e.
+    with each node written as expr1 OPERATOR expr2, ((a OR b) OR c) OR d gives [a, b, c, d].
+    :param expression: combined comparison or observation expression
+    :type expression: PatternObject
+    :return: operands of the n-ary expression
+    :rtype: list
+    """
+    if expression.operator not in _ASSOCIATIVE_OPERATORS.get(type(expression), ()):
+        return [expression.expr1, expression.expr2]
+    operands = []
+    stack = [expression]
+    while stack:
+        node = stack.pop()
+        if is_chain(node, expression):
+            stack.append(node.expr2)
+            stack.append(node.expr1)
+        else:
+            operands.append(node)
+    return operands
+
+
+def combine(operands, operator):
+    """
+    Joins operands with operator into a balanced tree of combined expressions, the reverse of flatten.
+    :param operands: comparison or observation expressions, at least one
+    :type operands: list
+    :param operator: ComparisonExpressionOperators or ObservationOperators member
+    :return: root of the tree, which is no more than log2(len(operands)) + 1 levels deep
+    :rtype: PatternObject
+    """
+    if isinstance(operator, ComparisonExpressionOperators):
+        node_class = CombinedComparisonExpression
+    else:
+        node_class = CombinedObservationExpression
+    level = list(operands)
+    while len(level) > 1:
+        paired = [node_class(level[i], level[i + 1], operator) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def transform_chains(root, visit_chain):
+    """
+    Rebuilds the tree under root bottom-up, handing every chain of combined expressions to visit_chain as a whole.
+    visit_chain(node, operands) is called once per chain, with the first node of the chain and its flattened
+    operands (already processed), the value it returns replaces the chain. Nodes outside of chains are copied
+    when one of their children changed.
+    :param root: pattern tree
+    :type root: Pattern
+    :param visit_chain: chain callback
+    :type visit_chain: function
+    :return: rebuilt pattern tree
+    :rtype: Pattern
+    """
+    # Only the first node of a chain is handed to visit_chain, the rest of the chain is replaced by its result
+    heads = set(id(node) for node in chain_heads(root))
+
+    def visit(node, new_children):
+        chain_head = id(node) in heads
+        node = replace_children(node, new_children)
+        if chain_head:
+            return visit_chain(node, flatten(node))
+        return node
+
+    return transform(root, visit)
+
+
+def chain_heads(root):
+    """
+    Returns the first node of every chain of combined expressions under root (a lone combined expression is a
+    chain of two operands), in pre-order
+    :param root: pattern tree
+    :type root: PatternObject
+    :rtype: list
+    """
+    heads = []
+    chain_tails = set()
+    for node in iter_nodes(root):
+        if isinstance(node, (CombinedComparisonExpression, CombinedObservationExpression)):
+            if id(node) not in chain_tails:
+                heads.append(node)
+            for child in (node.expr1, node.expr2):
+                if is_chain(child, node):
+                    chain_tails.add(id(child))
+    return heads
+
+
+def replace_node(root, target, replacement):
+    """
+    Returns a copy of the tree under root where target is replaced, only the ancestors of target are copied
+    :param root: pattern tree
+    :type root: PatternObject
+    :param target: node of the tree to replace
+    :type target: PatternObject
+    :param replacement: node taking its place
+    :type replacement: PatternObject
+    :rtype: PatternObject
+    """
+    return transform(root, lambda node, new_children: replacement if node is target else
+                     replace_children(node, new_children))
+
+
+def copy_tree(root):
+    """
+    Returns a writable copy of every node of the tree under root
+    :param root: pattern tree
+    :type root: PatternObject
+    :rtype: PatternObject
+    """
+    def visit(node, new_children):
+        if not hasattr(node, 'copy'):
+            return node
+        node = node.copy()
+        for field, child in new_children.items():
+            setattr(node, field, child)
+        return node
+
+    return transform(root, visit)
+
+
+def balance(root, threshold=BALANCE_THRESHOLD):
+    """
+    Rebalances the chains of more than threshold operands joined by AND or OR, so that the recursive query
+    constructors of the modules only need O(log n) frames for them. The operands keep their expr1-first order.
+    The input tree is not modified, unchanged subtrees are shared with it.
+    :param root: pattern tree
+    :type root: Pattern
+    :param threshold: minimum number of operands of the chains to rebalance
+    :type threshold: int
+    :return: balanced pattern tree
+    :rtype: Pattern
+    """
+    def visit_chain(node, operands):
+        if len(operands) > threshold:
+            return combine(operands, node.operator)
+        return node
+
+    return transform_chains(root, visit_chain)
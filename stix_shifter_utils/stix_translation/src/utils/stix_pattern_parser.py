@@ -40,38 +40,42 @@ class PatternTranslator:
         self.parse_expression(pattern)
 
     def _parse_expression(self, expression, qualifier=None) -> str:
-        if isinstance(expression, ComparisonExpression):  # Base Case
-            # Resolve STIX Object Path to a field in the target Data Model
-            stix_object, stix_field = expression.object_path.split(':')
-            comparator = self.comparator_lookup[expression.comparator]
-            if expression.negated:
-                comparator = 'NOT ' + comparator
-            if qualifier is not None:
-                self._convert_qualifier_times_to_unix_times(qualifier)
-            self.parsed_pattern.append({'attribute': expression.object_path, 'comparison_operator': comparator, 'value': expression.value})
-        elif isinstance(expression, CombinedComparisonExpression):
-            if qualifier is not None:
-                self._convert_qualifier_times_to_unix_times(qualifier)
-            self._parse_expression(expression.expr1)
-            self._parse_expression(expression.expr2)
+        # Walks the tree with an explicit stack of (expression, qualifier) pairs, expr1 is parsed before expr2
+        stack = [(expression, qualifier)]
+        while stack:
+            expression, qualifier = stack.pop()
+            if isinstance(expression, ComparisonExpression):  # Base Case
+                # Resolve STIX Object Path to a field in the target Data Model
+                stix_object, stix_field = expression.object_path.split(':')
+                comparator = self.comparator_lookup[expression.comparator]
+                if expression.negated:
+                    comparator = 'NOT ' + comparator
+                if qualifier is not None:
+                    self._convert_qualifier_times_to_unix_times(qualifier)
+                self.parsed_pattern.append({'attribute': expression.object_path, 'comparison_operator': comparator, 'value': expression.value})
+            elif isinstance(expression, CombinedComparisonExpression):
+                if qualifier is not None:
+                    self._convert_qualifier_times_to_unix_times(qualifier)
+                stack.append((expression.expr2, None))
+                stack.append((expression.expr1, None))
 
-        elif isinstance(expression, ObservationExpression):
-            self._parse_expression(expression.comparison_expression, qualifier)
+            elif isinstance(expression, ObservationExpression):
+                stack.append((expression.comparison_expression, qualifier))
 
-        elif hasattr(expression, 'qualifier') and hasattr(expression, 'observation_expression'):
-            if isinstance(expression.observation_expression, CombinedObservationExpression):
-                self._parse_expression(expression.observation_expression.expr1)
-                self._parse_expression(expression.observation_expression.expr2, expression.qualifier)
+            elif hasattr(expression, 'qualifier') and hasattr(expression, 'observation_expression'):
+                if isinstance(expression.observation_expression, CombinedObservationExpression):
+                    stack.append((expression.observation_expression.expr2, expression.qualifier))
+                    stack.append((expression.observation_expression.expr1, None))
+                else:
+                    stack.append((expression.observation_expression.comparison_expression, expression.qualifier))
+            elif isinstance(expression, CombinedObservationExpression):
+                stack.append((expression.expr2, None))
+                stack.append((expression.expr1, None))
+            elif isinstance(expression, Pattern):
+                stack.append((expression.expression, None))
             else:
-                self._parse_expression(expression.observation_expression.comparison_expression, expression.qualifier)
-        elif isinstance(expression, CombinedObservationExpression):
-            self._parse_expression(expression.expr1)
-            self._parse_expression(expression.expr2)
-        elif isinstance(expression, Pattern):
-            self._parse_expression(expression.expression)
-        else:
-            raise RuntimeError("Unknown Recursion Case for expression={}, type(expression)={}".format(
-                expression, type(expression)))
+                raise RuntimeError("Unknown Recursion Case for expression={}, type(expression)={}".format(
+                    expression, type(expression)))
 
     def _convert_qualifier_times_to_unix_times(self, qualifier):
         split_object = qualifier.split("'")
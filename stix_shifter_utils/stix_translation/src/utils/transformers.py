@@ -8,19 +8,79 @@ import ntpath
 
 from stix_shifter_utils.utils import logger
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 LOGGER = logger.set_logger(__name__)
 
+TCP_PROTOCOL_PATTERN = re.compile(r'^tcp', re.I)
+PATH_SEPARATOR_PATTERN = re.compile(r'[\\/]')
+TIMESTAMP_SECONDS_PATTERN = re.compile(r"\d{4}(-\d{2}){2}T\d{2}(:\d{2}){2}Z")
+IPV4_PATTERN = re.compile(r'^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
+TIMESTAMP_MILLISECONDS_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T([01]\d|2[0-3]):[0-5]\d:[0-5]\d\.\d{1,6}Z$')
+# Vectorized conversions give the results of datetime within these bounds: the epoch milliseconds are exact in the
+# float datetime.fromtimestamp is given until 2^33 seconds (year 2242), the microseconds of a timestamp are exact
+# in a float until 2^53 (years 1685 to 2255).
+EPOCH_MILLISECONDS_VECTORIZED_MAX = 2 ** 33 * 1000
+EPOCH_SECONDS_VECTORIZED_MAX = 253402300799
+TIMESTAMP_MICROSECONDS_VECTORIZED_MAX = 2 ** 53
+IPV6_PATTERN = re.compile(r'^(([0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])|([0-9a-fA-F]{1,4}:){1,4}:((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9]))$')
+
+
 class ValueTransformer():
-    """ Base class for value transformers """
+    """
+    Base class for value transformers
+    Transformers whose result only depends on the value and is immutable (not a list or dict) can set cacheable to
+    True: results translation then calls them once per distinct value, and transforms the values of a field
+    across a page of results at once with transform_many
+    """
+    cacheable = False
 
     @staticmethod
     def transform(obj):
         """ abstract function for converting value formats """
         raise NotImplementedError
 
+    @classmethod
+    def transform_many(cls, values):
+        """
+        Transforms a batch of values, overridden by the transformers having a vectorized implementation
+        :param values: the values to transform
+        :type values: list
+        :return: the result of transform for each value, in the same order
+        :rtype: list
+        """
+        return [cls.transform(value) for value in values]
+
+
+def _epochs_to_timestamps(transform, values, unit, maximum):
+    # the epochs numpy converts, the other values are left to transform
+    results = [None] * len(values)
+    positions = []
+    epochs = []
+    for position, value in enumerate(values):
+        try:
+            epoch = int(value)
+        except (TypeError, ValueError):
+            epoch = None
+        if epoch is not None and 0 <= epoch <= maximum:
+            positions.append(position)
+            epochs.append(epoch)
+        else:
+            results[position] = transform(value)
+    if epochs:
+        timestamps = numpy.datetime_as_string(numpy.array(epochs, dtype='int64').view('datetime64[{}]'.format(unit)),
+                                              unit='ms')
+        for position, timestamp in zip(positions, timestamps.tolist()):
+            results[position] = timestamp + 'Z'
+    return results
+
 
 class StringToBool(ValueTransformer):
     """A value transformer for converting String to boolean value"""
+    cacheable = True
 
     @staticmethod
     def transform(value):
@@ -29,6 +89,7 @@ class StringToBool(ValueTransformer):
 
 class EpochToTimestamp(ValueTransformer):
     """A value transformer for the timestamps"""
+    cacheable = True
 
     @staticmethod
     def transform(epoch):
@@ -37,9 +98,16 @@ class EpochToTimestamp(ValueTransformer):
         except ValueError:
             LOGGER.error("Cannot convert epoch value {} to timestamp".format(epoch))
 
+    @classmethod
+    def transform_many(cls, values):
+        if numpy is None:
+            return super().transform_many(values)
+        return _epochs_to_timestamps(cls.transform, values, 'ms', EPOCH_MILLISECONDS_VECTORIZED_MAX)
+
 
 class FormatMac(ValueTransformer):
     """A value transformer to convert Mac address to STIX Mac address format"""
+    cacheable = True
 
     @staticmethod
     def transform(mac):
@@ -52,7 +120,7 @@ class FormatTCPProtocol(ValueTransformer):
 
     @staticmethod
     def transform(protocolname):
-        converted_name = re.search(r'^tcp', protocolname, re.I).group(0)
+        converted_name = TCP_PROTOCOL_PATTERN.search(protocolname).group(0)
         try:
             obj_array = converted_name if isinstance(converted_name, list) else converted_name.split(', ')
             # Loop through entries inside obj_array and make all strings lowercase to meet STIX format
@@ -64,6 +132,7 @@ class FormatTCPProtocol(ValueTransformer):
 
 class EpochSecondsToTimestamp(ValueTransformer):
     """A value transformer for the timestamps"""
+    cacheable = True
 
     @staticmethod
     def transform(epoch):
@@ -73,12 +142,19 @@ class EpochSecondsToTimestamp(ValueTransformer):
         except ValueError:
             LOGGER.error("Cannot convert epoch value {} to timestamp".format(epoch))
 
+    @classmethod
+    def transform_many(cls, values):
+        if numpy is None:
+            return super().transform_many(values)
+        return _epochs_to_timestamps(cls.transform, values, 's', EPOCH_SECONDS_VECTORIZED_MAX)
+
 
 class TimestampToMilliseconds(ValueTransformer):
     """
     A value transformer for converting a UTC timestamp (YYYY-MM-DDThh:mm:ss.000Z) 
     to 13-digit Unix time (epoch + milliseconds)
     """
+    cacheable = True
 
     @staticmethod
     def transform(timestamp):
@@ -90,14 +166,42 @@ class TimestampToMilliseconds(ValueTransformer):
         except ValueError:
             LOGGER.error("Cannot convert the timestamp {} to milliseconds".format(timestamp))
 
+    @classmethod
+    def transform_many(cls, values):
+        if numpy is None:
+            return super().transform_many(values)
+        positions = [position for position, value in enumerate(values)
+                     if isinstance(value, str) and TIMESTAMP_MILLISECONDS_PATTERN.match(value)]
+        results = [None] * len(values)
+        converted = set()
+        if positions:
+            try:
+                microseconds = numpy.array([values[position][:-1] for position in positions], dtype='datetime64[us]')
+            except ValueError:
+                # ie. a day out of range for its month, strptime reports which
+                microseconds = None
+            if microseconds is not None:
+                microseconds = microseconds.astype('int64')
+                # the float operations of transform, timedelta.total_seconds divides the microseconds by 10^6
+                milliseconds = (microseconds.astype('float64') / 10 ** 6 * 1000).astype('int64')
+                for position, micros, millis in zip(positions, microseconds.tolist(), milliseconds.tolist()):
+                    if abs(micros) < TIMESTAMP_MICROSECONDS_VECTORIZED_MAX:
+                        results[position] = millis
+                        converted.add(position)
+        for position, value in enumerate(values):
+            if position not in converted:
+                results[position] = cls.transform(value)
+        return results
+
 
 class ToInteger(ValueTransformer):
     """A value transformer for expected integer values"""
+    cacheable = True
 
     @staticmethod
     def transform(obj):
         try:
-            if type(obj) is str and re.search('\.', obj):
+            if type(obj) is str and '.' in obj:
                 obj = float(obj)
             return int(obj)
         except ValueError:
@@ -106,6 +210,7 @@ class ToInteger(ValueTransformer):
 
 class ToString(ValueTransformer):
     """A value transformer for expected string values"""
+    cacheable = True
 
     @staticmethod
     def transform(obj):
@@ -131,6 +236,7 @@ class ToLowercaseArray(ValueTransformer):
 
 class ToBase64(ValueTransformer):
     """A value transformer for expected base 64 values"""
+    cacheable = True
 
     @staticmethod
     def transform(obj):
@@ -142,17 +248,19 @@ class ToBase64(ValueTransformer):
 
 class ToFilePath(ValueTransformer):
     """A value transformer for expected file paths"""
+    cacheable = True
 
     @staticmethod
     def transform(obj):
         try:
-            return obj[0:len(obj) - len(re.split(r'[\\/]', obj)[-1])]
+            return obj[0:len(obj) - len(PATH_SEPARATOR_PATTERN.split(obj)[-1])]
         except ValueError:
             LOGGER.error("Cannot convert input to path string")
 
 
 class ToDirectoryPath(ValueTransformer):
     """A value transformer for expected directory path"""
+    cacheable = True
 
     @staticmethod
     def transform(obj):
@@ -165,17 +273,19 @@ class ToDirectoryPath(ValueTransformer):
 
 class ToFileName(ValueTransformer):
     """A value transformer for expected file names"""
+    cacheable = True
 
     @staticmethod
     def transform(obj):
         try:
-            return re.split(r'[\\/]', obj)[-1]
+            return PATH_SEPARATOR_PATTERN.split(obj)[-1]
         except ValueError:
             LOGGER.error("Cannot convert input to file name")
 
 
 class ToDomainName(ValueTransformer):
     """A value transformer for expected domain name"""
+    cacheable = True
 
     @staticmethod
     def transform(url):
@@ -192,6 +302,7 @@ class ToDomainName(ValueTransformer):
 
 class ToIPv4(ValueTransformer):
     """A value transformer for converting an unsigned long to IPv4 string"""
+    cacheable = True
 
     @staticmethod
     def transform(value):
@@ -203,6 +314,7 @@ class ToIPv4(ValueTransformer):
 
 class DateTimeToUnixTimestamp(ValueTransformer):
     """A value transformer for converting python datetime object to Unix (millisecond) timestamp"""
+    cacheable = True
 
     @staticmethod
     def transform(obj):
@@ -236,6 +348,7 @@ class TimestampToUTC(ValueTransformer):
     A value transformer for converting a UTC timestamp (YYYY-MM-DDThh:mm:ss.000Z)
     to %d %b %Y %H:%M:%S %z"(23 Oct 2018 12:20:14 +0000)
     """
+    cacheable = True
 
     @staticmethod
     def transform(timestamp, is_default=False):
@@ -247,7 +360,7 @@ class TimestampToUTC(ValueTransformer):
                             False if timestamp like datetime.datetime(2019, 8, 22, 15, 44, 11, 716805)
         :return: str, e.g. : 25 Jul 2019 10:43:10 +0000
         """
-        if re.search(r"\d{4}(-\d{2}){2}T\d{2}(:\d{2}){2}Z", str(timestamp)):
+        if TIMESTAMP_SECONDS_PATTERN.search(str(timestamp)):
             input_time_pattern = '%Y-%m-%dT%H:%M:%SZ'
         else:
             input_time_pattern = '%Y-%m-%dT%H:%M:%S.%fZ'
@@ -263,6 +376,7 @@ class TimestampToUTC(ValueTransformer):
 
 class SetToOne(ValueTransformer):
     """Send back integer = 1 irrespective of the obj"""
+    cacheable = True
 
     @staticmethod
     def transform(obj):
@@ -277,7 +391,7 @@ class FilterIPv4List(ValueTransformer):
     @staticmethod
     def transform(obj):
         if isinstance(obj, list):
-            pattern = re.compile(r'^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
+            pattern = IPV4_PATTERN
             result = []
             for val in obj:
                 if pattern.match(str(val)):
@@ -291,7 +405,7 @@ class FilterIPv6List(ValueTransformer):
     @staticmethod
     def transform(obj):
         if isinstance(obj, list):
-            pattern = re.compile(r'^(([0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])|([0-9a-fA-F]{1,4}:){1,4}:((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9]))$')
+            pattern = IPV6_PATTERN
             result = []
             for val in obj:
                 if pattern.match(str(val)):
@@ -307,6 +421,7 @@ class ValueToList(ValueTransformer):
 
 class GraphIDToPID(ValueTransformer):
     """A value transformer that converts a single value into a list container the value"""
+    cacheable = True
 
     @staticmethod
     def transform(obj):
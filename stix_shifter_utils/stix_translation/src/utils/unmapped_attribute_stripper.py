@@ -1,19 +1,24 @@
 from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import StartStopQualifier, ObservationExpression, \
     ComparisonExpression, Pattern, CombinedComparisonExpression, CombinedObservationExpression
+from stix_shifter_utils.stix_translation.src.patterns.traversal import transform
 from stix_shifter_utils.stix_translation.src.utils.exceptions import DataMappingException
 
 
 class UnmappedAttributeStripper:
+    """
+    Removes the comparisons whose STIX attribute is not mapped by the data model.
+    The input tree is never modified: the stripped tree is built from copies of its nodes, so the input can be
+    a frozen pattern shared by several dialects and the result can be freely modified by the query constructors.
+    The tree is walked with an explicit stack, large patterns do not hit the interpreter recursion limit.
+    """
 
     def __init__(self, antlr_object, data_model_mapping):
         self.dmm = data_model_mapping
+        self._map_object_path = getattr(data_model_mapping, 'map_object_path', None)
         self.unmapped_attributes = []
-        self.transformed_parsing = self._traverse_parsing_tree(antlr_object)
-
-    def _traverse_combined_expression(self, root):
-        expression1 = self._traverse_parsing_tree(root.expr1)
-        expression2 = self._traverse_parsing_tree(root.expr2)
+        self.transformed_parsing = transform(antlr_object, self._strip_node) if antlr_object else antlr_object
 
+    def _traverse_combined_expression(self, root, expression1, expression2):
         if (not isinstance(root, CombinedObservationExpression) and
             (expression1 == "delete" or expression2 == "delete") and
                 root.operator.name == "And"):
@@ -28,57 +33,58 @@ class UnmappedAttributeStripper:
         if (expression2 == "delete"):
             return expression1
 
+        root = root.copy()
         root.expr1 = expression1
         root.expr2 = expression2
 
         return root
 
-    def _parse_pattern_expression(self, root):
-        expression = self._traverse_parsing_tree(root.expression)
+    def _parse_pattern_expression(self, root, expression):
         if (expression == "delete"):
             expression = None
+        root = root.copy()
         root.expression = expression
         return root
 
-    def _parse_start_stop_qualifier(self, root):
-        expression = self._traverse_parsing_tree(root.observation_expression)
+    def _parse_start_stop_qualifier(self, root, expression):
         if (expression == "delete"):
             return expression
+        root = root.copy()
         root.observation_expression = expression
         return root
 
-    def _parse_observation_expression(self, root):
-        if (root.comparison_expression):
-            expression = self._traverse_parsing_tree(root.comparison_expression)
-            if (expression == "delete"):
-                return expression
-            root.comparison_expression = expression
+    def _parse_observation_expression(self, root, expression):
+        if (expression == "delete"):
+            return expression
+        root = root.copy()
+        root.comparison_expression = expression
         return root
 
     def _parse_comparison_expression(self, root):
-        stix_object, stix_field = root.object_path.split(':')
-        mapped_fields_array = self.dmm.map_field(stix_object, stix_field)
+        if self._map_object_path:
+            mapped_fields_array = self._map_object_path(root.object_path)
+        else:
+            stix_object, stix_field = root.object_path.split(':')
+            mapped_fields_array = self.dmm.map_field(stix_object, stix_field)
         if not mapped_fields_array:
             self.unmapped_attributes.append(root.object_path)
             return "delete"
         else:
-            return root
-
-    def _traverse_parsing_tree(self, root):
-        if root:
-            if isinstance(root, Pattern):
-                root = self._parse_pattern_expression(root)
-            if isinstance(root, StartStopQualifier):
-                root = self._parse_start_stop_qualifier(root)
-            if isinstance(root, CombinedObservationExpression):
-                return self._traverse_combined_expression(root)
-            if isinstance(root, ObservationExpression):
-                root = self._parse_observation_expression(root)
-            if isinstance(root, CombinedComparisonExpression):
-                return self._traverse_combined_expression(root)
-            if isinstance(root, ComparisonExpression):
-                root = self._parse_comparison_expression(root)
-            return root
+            return root.copy()
+
+    def _strip_node(self, root, children):
+        # Called bottom-up by transform, children holds the already stripped child nodes of root
+        if isinstance(root, Pattern):
+            return self._parse_pattern_expression(root, children['expression'])
+        if isinstance(root, StartStopQualifier):
+            return self._parse_start_stop_qualifier(root, children['observation_expression'])
+        if isinstance(root, (CombinedObservationExpression, CombinedComparisonExpression)):
+            return self._traverse_combined_expression(root, children['expr1'], children['expr2'])
+        if isinstance(root, ObservationExpression):
+            return self._parse_observation_expression(root, children['comparison_expression'])
+        if isinstance(root, ComparisonExpression):
+            return self._parse_comparison_expression(root)
+        return root
 
 
 def strip_unmapped_attributes(antlr_parsing, data_model_mapping=None):
@@ -0,0 +1,195 @@
+import asyncio
+import os
+import ssl
+import weakref
+import requests
+from requests.structures import CaseInsensitiveDict
+from stix_shifter_utils.stix_transmission.utils.RestApiClient import ResponseWrapper, RETRY_MAX_DEFAULT, \
+    CONNECT_TIMEOUT_DEFAULT, POOL_SIZE_DEFAULT
+from stix_shifter_utils.utils import logger
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# This is the asyncio counterpart of RestApiClient: calls are coroutines, an event loop can run many of them at once
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_METHODS = ("HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE")
+# seconds before retrying a failed connection, doubled on each retry up to the maximum
+CONNECT_BACKOFF_DEFAULT = 0.5
+CONNECT_BACKOFF_MAX = 10
+
+# Sessions by event loop (an aiohttp session belongs to the loop it is created in), then by server, certificate,
+# SNI and pool size
+_sessions = weakref.WeakKeyDictionary()
+
+
+async def close_sessions():
+    """
+    Closes the sessions of the running event loop and their connections, the next calls open new ones
+    """
+    sessions = _sessions.pop(asyncio.get_event_loop(), {})
+    for session in sessions.values():
+        await session.close()
+
+
+def _without_none(values):
+    # like requests, the parameters and form fields with a None value are not sent
+    if isinstance(values, dict):
+        return {key: value for key, value in values.items() if value is not None}
+    if isinstance(values, (list, tuple)):
+        return [(key, value) for key, value in values if value is not None]
+    return values
+
+
+class BufferedResponse:
+    """
+    Response read in full, with the attributes of a requests response that ResponseWrapper uses
+    """
+
+    def __init__(self, status_code, reason, url, headers, content):
+        self.status_code = status_code
+        self.reason = reason
+        self.url = url
+        self.headers = headers
+        self.content = content
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            raise requests.exceptions.HTTPError('{} Error: {} for url: {}'.format(self.status_code, self.reason,
+                                                                                 self.url), response=self)
+
+
+class AsyncRestApiClient:
+    # cert_verify can be
+    #  True -- do proper signed cert check that is in trust store,
+    #  False -- skip all cert checks,
+    #  or The String content of your self signed cert required for TLS communication
+    # pool_size is the number of concurrent connections to the server, STIXSHIFTER_CONNECTION_POOL_SIZE by default
+    def __init__(self, host, port=None, headers={}, url_modifier_function=None, cert_verify=True, sni=None, auth=None,
+                 pool_size=None):
+        self.retry_max = int(os.getenv('STIXSHIFTER_RETRY_MAX', RETRY_MAX_DEFAULT))
+        self.connect_timeout = int(os.getenv('STIXSHIFTER_CONNECT_TIMEOUT', CONNECT_TIMEOUT_DEFAULT))
+        self.pool_size = int(pool_size or os.getenv('STIXSHIFTER_CONNECTION_POOL_SIZE', POOL_SIZE_DEFAULT))
+
+        self.logger = logger.set_logger(__name__)
+        server_ip = host
+        if port is not None:
+            server_ip += ":" + str(port)
+        self.server_ip = server_ip
+        # sni is none unless we are using a server cert
+        self.sni = None
+        self.cert_verify = cert_verify if isinstance(cert_verify, (bool, str)) else False
+        if isinstance(cert_verify, str) and sni is not None:
+            self.sni = sni
+        self.ssl_context = None
+
+        self.headers = headers
+        self.url_modifier_function = url_modifier_function
+        self.auth = auth
+
+    def _ssl(self):
+        # the ssl argument of aiohttp: None verifies with the trust store, False does not verify
+        if self.cert_verify is True:
+            return None
+        if self.cert_verify is False:
+            return False
+        if self.ssl_context is None:
+            self.ssl_context = ssl.create_default_context(cadata=self.cert_verify)
+        return self.ssl_context
+
+    def _session(self):
+        sessions = _sessions.setdefault(asyncio.get_event_loop(), {})
+        key = (self.server_ip, self.cert_verify, self.sni, self.pool_size)
+        session = sessions.get(key)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=0, limit_per_host=self.pool_size)
+            # cookies are not carried from a call to the next, like with RestApiClient
+            session = sessions[key] = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+        return session
+
+    # This method is used to set up an HTTP request and send it to the server
+    async def call_api(self, endpoint, method, headers=None, data=None, urldata=None, timeout=None):
+        if aiohttp is None:
+            raise ImportError('AsyncRestApiClient requires the aiohttp package')
+        actual_headers = self.headers.copy()
+        if headers is not None:
+            for header_key in headers:
+                actual_headers[header_key] = headers[header_key]
+
+        if self.url_modifier_function is not None:
+            url = self.url_modifier_function(self.server_ip, endpoint, actual_headers)
+        else:
+            url = 'https://' + self.server_ip + '/' + endpoint
+        if self.sni is not None:
+            actual_headers["Host"] = self.sni
+        try:
+            request = self._request(method, url, actual_headers, data, urldata)
+            response = await (asyncio.wait_for(request, timeout) if timeout else request)
+            if 'Deprecated' in response.headers.get('Content-Type', ''):
+                self.logger.error("WARNING: " + response.headers['Content-Type'])
+            return ResponseWrapper(response)
+        except asyncio.TimeoutError as e:
+            # a connection not established within the connect timeout is not the timeout of the call
+            if not isinstance(e, aiohttp.ServerTimeoutError):
+                e = Exception(f'timeout_error ({timeout} sec)')
+            self.logger.error('exception occured during requesting url: ' + str(e))
+            raise e
+        except Exception as e:
+            self.logger.error('exception occured during requesting url: ' + str(e))
+            raise e
+
+    async def _request(self, method, url, headers, data, urldata):
+        kwargs = {
+            'headers': {key: value.decode('utf-8') if isinstance(value, bytes) else value
+                        for key, value in headers.items()},
+            'params': _without_none(urldata),
+            'data': _without_none(data.encode('utf-8') if isinstance(data, str) else data),
+            'ssl': self._ssl(),
+            'timeout': aiohttp.ClientTimeout(total=None, sock_connect=self.connect_timeout),
+        }
+        if isinstance(self.auth, tuple):
+            kwargs['auth'] = aiohttp.BasicAuth(*self.auth)
+        elif self.auth is not None:
+            kwargs['auth'] = self.auth
+        if isinstance(kwargs['data'], (bytes, bytearray)) and 'content-type' not in map(str.lower, headers):
+            # requests does not give a type to raw bodies
+            kwargs['skip_auto_headers'] = ('Content-Type',)
+        if self.sni is not None:
+            kwargs['server_hostname'] = self.sni
+        session = self._session()
+        # retried like the requests of RestApiClient: failed connections, and the listed statuses of idempotent methods
+        retries = self.retry_max
+        backoff = CONNECT_BACKOFF_DEFAULT
+        while True:
+            try:
+                async with session.request(method.upper(), url, **kwargs) as response:
+                    content = await response.read()
+            except aiohttp.ClientConnectorError:
+                if retries <= 0:
+                    raise
+                retries -= 1
+                # a server refusing connections is not asked again right away
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, CONNECT_BACKOFF_MAX)
+                continue
+            if response.status in RETRY_STATUS_CODES and method.upper() in RETRY_METHODS:
+                if retries <= 0:
+                    raise requests.exceptions.RetryError(
+                        'Max retries exceeded with url: {} (too many {} error responses)'.format(url, response.status))
+                retries -= 1
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    await asyncio.sleep(int(retry_after))
+                continue
+            return BufferedResponse(response.status, response.reason, str(response.url),
+                                    CaseInsensitiveDict(response.headers), content)
+
+    # Simple getters that can be used to inspect the state of this client.
+    def get_headers(self):
+        return self.headers.copy()
+
+    def get_server_ip(self):
+        return self.server_ip
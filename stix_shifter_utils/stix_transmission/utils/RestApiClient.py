@@ -1,12 +1,14 @@
 import requests
 from requests_toolbelt.adapters import host_header_ssl
 from requests.packages.urllib3.util.retry import Retry
+from requests.packages.urllib3.util.ssl_ import create_urllib3_context
 from stix_shifter_utils.stix_transmission.utils.timeout_http_adapter import TimeoutHTTPAdapter
+from http.cookiejar import DefaultCookiePolicy
+import atexit
 import sys
-import collections
+import collections.abc
 import os
-import errno
-import uuid
+import time
 from stix_shifter_utils.utils import logger
 import threading
 
@@ -14,30 +16,179 @@ import threading
 
 RETRY_MAX_DEFAULT = 1
 CONNECT_TIMEOUT_DEFAULT = 2
+POOL_SIZE_DEFAULT = 10
+READ_CHUNK_SIZE = 64 * 1024
 
+# monotonic time the call being made by the thread must be answered by, the call runs in the thread of its caller
+_deadline = threading.local()
 
-class InterruptableThread(threading.Thread):
-    def __init__(self, func, *args, **kwargs):
-        threading.Thread.__init__(self)
-        self._func = func
-        self._args = args
-        self._kwargs = kwargs
-        self._result = None
-        self.setDaemon(True)
+# Sessions shared by the clients of a server, their connections are kept alive from a call to the next so that
+# status polls and result pages do not each open a new TCP and TLS connection
+_sessions = {}
+_sessions_lock = threading.Lock()
 
-    def run(self):
-        self._result = self._func(*self._args, **self._kwargs)
 
-    @property
-    def result(self):
-        return self._result
+class SSLContextAdapterMixin:
+    """
+    Adapter connecting with an SSL context built in memory, which trusts the self signed certificate of the server
+    instead of a CA bundle file
+    """
+
+    def __init__(self, *args, ssl_context=None, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.ssl_context is not None:
+            kwargs['ssl_context'] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        if self.ssl_context is not None:
+            proxy_kwargs['ssl_context'] = self.ssl_context
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if self.ssl_context is not None and verify:
+            # the certificates trusted by the context only, the CA bundle is not loaded into it
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+class SSLContextAdapter(SSLContextAdapterMixin, TimeoutHTTPAdapter):
+    pass
+
+
+class HostHeaderSSLContextAdapter(SSLContextAdapterMixin, host_header_ssl.HostHeaderSSLAdapter):
+    pass
+
+
+def create_ssl_context(cert_content):
+    """
+    Creates the SSL context verifying the server with its self signed certificate
+    :param cert_content: content of the certificate, PEM encoded
+    :type cert_content: str
+    :rtype: ssl.SSLContext
+    """
+    # the host name is matched by urllib3, against the Host header with SNI
+    context = create_urllib3_context()
+    context.load_verify_locations(cadata=cert_content)
+    return context
+
+
+def _new_session(cert_verify, sni, pool_size, retry_max):
+    session = requests.Session()
+    # cookies are not carried from a call to the next (or to another client), like when each call had its own session
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    retry_strategy = DeadlineRetry(total=retry_max, backoff_factor=0, status_forcelist=[429, 500, 502, 503, 504],
+                                   method_whitelist=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"])
+    session.mount("http://", TimeoutHTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size,
+                                                pool_maxsize=pool_size))
+    # built once for the session, the connections of its pool share it
+    ssl_context = create_ssl_context(cert_verify) if isinstance(cert_verify, str) else None
+    if sni is not None:
+        # only use the tool belt session in case of SNI for safety
+        session.mount('https://', HostHeaderSSLContextAdapter(max_retries=DeadlineRetry.from_int(retry_max),
+                                                              pool_connections=pool_size, pool_maxsize=pool_size,
+                                                              ssl_context=ssl_context))
+    else:
+        session.mount("https://", SSLContextAdapter(max_retries=retry_strategy, pool_connections=pool_size,
+                                                    pool_maxsize=pool_size, ssl_context=ssl_context))
+    return session
 
 
-def exception_catcher(func, *args, **kwargs):
+def get_session(server_ip, cert_verify, sni, pool_size, retry_max):
+    """
+    Returns the session shared by the clients of a server with the same certificate, SNI and pool settings
+    :param server_ip: host and port of the server
+    :type server_ip: str
+    :param cert_verify: True, False or the content of the self signed certificate
+    :param sni: server name of the certificate, None when the host is used
+    :type sni: str
+    :param pool_size: connections kept alive per host
+    :type pool_size: int
+    :param retry_max: retries of the failed requests
+    :type retry_max: int
+    :rtype: requests.Session
+    """
+    key = (server_ip, cert_verify, sni, pool_size, retry_max)
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _sessions[key] = _new_session(cert_verify, sni, pool_size, retry_max)
+    return session
+
+
+def close_sessions():
+    """
+    Closes the shared sessions and their connections, the next calls open new ones
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_sessions)
+
+
+class DeadlineRetry(Retry):
+    """
+    Retry strategy which does not retry once the deadline of the call is past
+    """
+
+    def is_exhausted(self):
+        deadline = getattr(_deadline, 'value', None)
+        return super().is_exhausted() or (deadline is not None and time.monotonic() >= deadline)
+
+
+def _set_read_timeout(response, timeout):
+    # the socket timeout of the next reads of the body
+    connection = getattr(response.raw, 'connection', None)
+    sock = getattr(connection, 'sock', None)
+    if sock is not None:
+        sock.settimeout(max(timeout, 0.001))
+
+
+def _read_before(response, deadline):
+    """
+    Reads the body of a streamed response before the deadline, each socket read waits for the time left at most
+    :raises TimeoutError: the body is not read at the deadline, the response is closed
+    """
+    raw = response.raw
+    fp = getattr(raw, '_fp', None)
     try:
-        return func(*args, **kwargs)
-    except Exception as ex:
-        return ex
+        chunks = []
+        if response.headers.get('Content-Encoding', 'identity') == 'identity' and hasattr(fp, 'read1'):
+            # read1 returns what a single socket read receives, a body sent slowly can not hold the call
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError
+                _set_read_timeout(response, remaining)
+                chunk = fp.read1(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            raw.release_conn()
+        else:
+            # decoded while it is read, the time left is checked between chunks
+            _set_read_timeout(response, deadline - time.monotonic())
+            for chunk in response.iter_content(READ_CHUNK_SIZE):
+                chunks.append(chunk)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError
+                _set_read_timeout(response, remaining)
+    except Exception:
+        response.close()
+        raise
+    response._content = b''.join(chunks)
+    response._content_consumed = True
 
 
 class RestApiClient:
@@ -45,15 +196,16 @@ class RestApiClient:
     #  True -- do proper signed cert check that is in trust store,
     #  False -- skip all cert checks,
     #  or The String content of your self signed cert required for TLS communication
-    def __init__(self, host, port=None, headers={}, url_modifier_function=None, cert_verify=True,  sni=None, auth=None):
+    # pool_size is the number of connections kept alive to the server, STIXSHIFTER_CONNECTION_POOL_SIZE by default
+    def __init__(self, host, port=None, headers={}, url_modifier_function=None, cert_verify=True,  sni=None, auth=None,
+                 pool_size=None):
         self.retry_max = os.getenv('STIXSHIFTER_RETRY_MAX', RETRY_MAX_DEFAULT)
         self.retry_max = int(self.retry_max)
         self.connect_timeout = os.getenv('STIXSHIFTER_CONNECT_TIMEOUT', CONNECT_TIMEOUT_DEFAULT)
         self.connect_timeout = int(self.connect_timeout)
+        self.pool_size = int(pool_size or os.getenv('STIXSHIFTER_CONNECTION_POOL_SIZE', POOL_SIZE_DEFAULT))
 
         self.logger = logger.set_logger(__name__)
-        unique_file_handle = uuid.uuid4()
-        self.server_cert_name = "/tmp/{0}-server_cert.pem".format(unique_file_handle)
         server_ip = host
         if port is not None:
             server_ip += ":" + str(port)
@@ -61,19 +213,10 @@ class RestApiClient:
         # sni is none unless we are using a server cert
         self.sni = None
 
-        self.server_cert_file_content_exists = False
-        self.server_cert_content = False
-        if isinstance(cert_verify, bool):
-            # verify certificate non self signed case
-            if cert_verify:
-                self.server_cert_content = True
-        # self signed cert provided
-        elif isinstance(cert_verify, str):
-            self.server_cert_content = self.server_cert_name
-            self.server_cert_file_content_exists = True
-            self.server_cert_file_content = cert_verify
-            if sni is not None:
-                self.sni = sni
+        # a self signed cert is verified with the SSL context of the session
+        self.cert_verify = cert_verify if isinstance(cert_verify, (bool, str)) else False
+        if isinstance(cert_verify, str) and sni is not None:
+            self.sni = sni
 
         self.headers = headers
         self.url_modifier_function = url_modifier_function
@@ -81,65 +224,47 @@ class RestApiClient:
 
     # This method is used to set up an HTTP request and send it to the server
     def call_api(self, endpoint, method, headers=None, data=None, urldata=None, timeout=None):
+        url = None
+        actual_headers = self.headers.copy()
+        if headers is not None:
+            for header_key in headers:
+                actual_headers[header_key] = headers[header_key]
+
+        if self.url_modifier_function is not None:
+            url = self.url_modifier_function(
+                self.server_ip, endpoint, actual_headers)
+        else:
+            url = 'https://' + self.server_ip + '/' + endpoint
         try:
-            # covnert server cert to file
-            if self.server_cert_file_content_exists is True:
-                with open(self.server_cert_name, 'w') as f:
-                    try:
-                        f.write(self.server_cert_file_content)
-                    except IOError:
-                        self.logger.error('Failed to setup certificate')
-
-            url = None
-            actual_headers = self.headers.copy()
-            if headers is not None:
-                for header_key in headers:
-                    actual_headers[header_key] = headers[header_key]
-
-            if self.url_modifier_function is not None:
-                url = self.url_modifier_function(
-                    self.server_ip, endpoint, actual_headers)
-            else:
-                url = 'https://' + self.server_ip + '/' + endpoint
+            session = get_session(self.server_ip, self.cert_verify, self.sni, self.pool_size, self.retry_max)
+            if self.sni is not None:
+                actual_headers["Host"] = self.sni
+            call = getattr(session, method.lower())
+            # the timeout is the deadline of the whole call, retries and body included: the socket reads wait
+            # for the time left at most and the body is streamed to stop reading it at the deadline
+            deadline = time.monotonic() + timeout if timeout else None
+            previous_deadline = getattr(_deadline, 'value', None)
+            _deadline.value = deadline
             try:
-                session = requests.Session()
-                retry_strategy = Retry(total=self.retry_max, backoff_factor=0, status_forcelist=[429, 500, 502, 503, 504],
-                                       method_whitelist=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"])
-                session.mount("http://", TimeoutHTTPAdapter(max_retries=retry_strategy))
-
-                if self.sni is not None:
-                    # only use the tool belt session in case of SNI for safety
-                    session.mount('https://', host_header_ssl.HostHeaderSSLAdapter(max_retries=self.retry_max))
-                    actual_headers["Host"] = self.sni
-                else:
-                    session.mount("https://", TimeoutHTTPAdapter(max_retries=retry_strategy))
-                call = getattr(session, method.lower())
-                it = InterruptableThread(exception_catcher, call, url, headers=actual_headers, params=urldata, data=data,
-                                         verify=self.server_cert_content,
-                                         timeout=(self.connect_timeout, timeout),
-                                         auth=self.auth)
-                it.start()
-                it.join(timeout)
-                if it.is_alive():
+                response = call(url, headers=actual_headers, params=urldata, data=data,
+                                verify=self.cert_verify is not False, timeout=(self.connect_timeout, timeout),
+                                auth=self.auth, stream=deadline is not None)
+                if deadline is not None and isinstance(response, requests.Response):
+                    _read_before(response, deadline)
+            except Exception as ex:
+                if deadline is not None and (isinstance(ex, TimeoutError) or time.monotonic() >= deadline):
                     raise Exception(f'timeout_error ({timeout} sec)')
-                response = it.result
-                if isinstance(response, Exception):
-                    raise response
-                if 'headers' in dir(response) and isinstance(response.headers, collections.Mapping) and \
-                   'Content-Type' in response.headers and "Deprecated" in response.headers['Content-Type']:
-                    self.logger.error("WARNING: " +
-                                      response.headers['Content-Type'], file=sys.stderr)
-                return ResponseWrapper(response)
-            except Exception as e:
-                self.logger.error('exception occured during requesting url: ' + str(e))
-                raise e
-        finally:
-            if self.server_cert_file_content_exists is True:
-                try:
-                    os.remove(self.server_cert_name)
-                except OSError as e:
-                    if e.errno != errno.ENOENT:
-                        raise
+                raise
+            finally:
+                _deadline.value = previous_deadline
+            if 'headers' in dir(response) and isinstance(response.headers, collections.abc.Mapping) and \
+               'Content-Type' in response.headers and "Deprecated" in response.headers['Content-Type']:
+                self.logger.error("WARNING: " +
+                                  response.headers['Content-Type'], file=sys.stderr)
+            return ResponseWrapper(response)
+        except Exception as e:
+            self.logger.error('exception occured during requesting url: ' + str(e))
+            raise e
 
     # Simple getters that can be used to inspect the state of this client.
     def get_headers(self):
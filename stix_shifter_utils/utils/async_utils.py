@@ -0,0 +1,48 @@
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from stix_shifter_utils.stix_transmission.utils import AsyncRestApiClient
+
+
+async def _run_and_close_sessions(coroutine):
+    try:
+        return await coroutine
+    finally:
+        # the sessions belong to the event loop, which is closed after the call
+        await AsyncRestApiClient.close_sessions()
+
+
+def _run_in_new_loop(coroutine):
+    # asyncio.run is not available on Python 3.6
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(_run_and_close_sessions(coroutine))
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _loop_running():
+    if sys.version_info >= (3, 7):
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+    # asyncio.get_running_loop is not available on Python 3.6, get_event_loop returns the running loop there
+    try:
+        return asyncio.get_event_loop().is_running()
+    except RuntimeError:
+        # no event loop in a thread other than the main one
+        return False
+
+
+def run_sync(coroutine):
+    """
+    Runs a coroutine to completion from synchronous code, in a new event loop.
+    When the calling thread already runs an event loop, the new one runs in another thread.
+    """
+    if not _loop_running():
+        return _run_in_new_loop(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_in_new_loop, coroutine).result()
@@ -1,21 +1,29 @@
+import asyncio
 import importlib
 import traceback
 import os
 import functools
-import json
+from stix_shifter_utils.utils import json_facade
 import glob
 from stix_shifter_utils.utils.module_discovery import dialect_list
 from stix_shifter_utils.modules.base.stix_translation.base_query_translator import BaseQueryTranslator
 from stix_shifter_utils.modules.base.stix_translation.base_results_translator import BaseResultTranslator
-from stix_shifter_utils.modules.base.stix_transmission.base_connector import BaseConnector
-from stix_shifter_utils.modules.base.stix_transmission.base_delete_connector import BaseDeleteConnector
-from stix_shifter_utils.modules.base.stix_transmission.base_query_connector import BaseQueryConnector
-from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector
-from stix_shifter_utils.modules.base.stix_transmission.base_ping_connector import BasePingConnector
-from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_connector import BaseConnector, BaseAsyncConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_delete_connector import BaseDeleteConnector, \
+    BaseAsyncDeleteConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_query_connector import BaseQueryConnector, \
+    BaseAsyncQueryConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_status_connector import BaseStatusConnector, \
+    BaseAsyncStatusConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_ping_connector import BasePingConnector, \
+    BaseAsyncPingConnector
+from stix_shifter_utils.modules.base.stix_transmission.base_results_connector import BaseResultsConnector, \
+    BaseAsyncResultsConnector
 from stix_shifter_utils.utils.param_validator import param_validator, modernize_objects
 from stix_shifter_utils.stix_translation.src.utils.exceptions import UnsupportedDialectException
 from stix_shifter_utils.utils.error_response import ErrorResponder
+from stix_shifter_utils.utils.async_utils import run_sync
+from stix_shifter_utils.stix_transmission.utils import AsyncRestApiClient
 
 OPTION_LANGUAGE = 'language'
 
@@ -37,6 +45,8 @@ class BaseEntryPoint:
         self.__status_connector = None
         self.__delete_connector = None
         self.__query_connector = None
+        self.__ping_connector = None
+        self.__async_connectors = {}
 
         module_name = self.__connector_module
         module = importlib.import_module(
@@ -51,7 +61,7 @@ class BaseEntryPoint:
 
         if connection:
             validation_obj = {'connection': connection, 'configuration': configuration}
-            validation_obj = json.loads(json.dumps(validation_obj))
+            validation_obj = json_facade.deep_copy(validation_obj)
             modernize_objects(self.__connector_module, validation_obj)
             validation_obj = param_validator(self.__connector_module, validation_obj)
             connection.clear()
@@ -80,9 +90,17 @@ class BaseEntryPoint:
         return wrapper_func
 
     def __check_transmission_configured(self):
-        if not(self.__results_connector and self.__status_connector and self.__delete_connector and self.__query_connector):
+        if not(self.__results_connector and self.__status_connector and self.__delete_connector and self.__query_connector) \
+                and not all(self.__async_connectors.get(action) for action in ('query', 'status', 'results', 'delete')):
             raise Exception('EntryPoint: one of transmission connectors is not configured')
 
+    async def __transmit_async(self, action, sync_method, *args):
+        connector = self.__async_connectors.get(action)
+        if connector is None:
+            # the connectors of a module without async ones block, they are run in the default executor
+            return await asyncio.get_event_loop().run_in_executor(None, functools.partial(sync_method, *args))
+        return await getattr(connector, sync_method.__name__)(*args)
+
     def add_dialect(self, dialect, query_translator=None, results_translator=None, default=False, default_include=True):
         if not query_translator:
             query_translator = self.create_default_query_translator(dialect)
@@ -140,7 +158,7 @@ class BaseEntryPoint:
             for filename in glob.glob(basepath + os.sep + "*.json"):
                 key = os.path.basename(filename)[:-5]
                 with open(filename, 'r') as f:
-                    jsondata = json.load(f)
+                    jsondata = json_facade.load(f)
                     mapping[key] = jsondata
         return mapping
 
@@ -165,8 +183,10 @@ class BaseEntryPoint:
         return translator.parse_query(data)
 
     @translation
-    def transform_query(self, dialect, data):
+    def transform_query(self, dialect, data, antlr_parsing=None):
         translator = self.get_query_translator(dialect)
+        if antlr_parsing is not None and translator.supports_shared_parsing():
+            return translator.transform_parsed_query(data, antlr_parsing)
         return translator.transform_query(data)
 
     @translation
@@ -179,6 +199,24 @@ class BaseEntryPoint:
             ErrorResponder.fill_error(result, message_struct={'exception': ex})
             return result
 
+    @translation
+    def translate_results_columns(self, data_source, columns, rows):
+        translator = self.get_results_translator()
+        try:
+            return translator.translate_results_columns(data_source, columns, rows)
+        except Exception as ex:
+            result = {}
+            ErrorResponder.fill_error(result, message_struct={'exception': ex})
+            return result
+
+    @translation
+    def translate_results_stream(self, data_source, data):
+        """
+        Translates data source results into STIX objects, yielded one at a time.
+        Unlike translate_results, errors are raised: part of the objects may already have been consumed.
+        """
+        return self.get_results_translator().translate_results_stream(data_source, data)
+
     @translation
     def get_dialects(self, include_hidden=False):
         if include_hidden:
@@ -236,55 +274,161 @@ class BaseEntryPoint:
         self.set_delete_connector(connector)
         self.set_ping_connector(connector)
 
+    def setup_transmission_simple_async(self, connection, configuration):
+        if AsyncRestApiClient.aiohttp is None:
+            # without aiohttp, the connectors set up by setup_transmission_simple are run in the default executor
+            return
+        module_name = self.__connector_module
+        module_path = "stix_shifter_modules." + module_name + ".stix_transmission"
+        module = importlib.import_module(module_path + ".api_client")
+        api_client = module.AsyncAPIClient(connection, configuration)
+
+        module = importlib.import_module(module_path + ".ping_connector")
+        self.set_async_ping_connector(module.AsyncPingConnector(api_client))
+
+        module = importlib.import_module(module_path + ".query_connector")
+        self.set_async_query_connector(module.AsyncQueryConnector(api_client))
+
+        module = importlib.import_module(module_path + ".status_connector")
+        self.set_async_status_connector(module.AsyncStatusConnector(api_client))
+
+        module = importlib.import_module(module_path + ".results_connector")
+        self.set_async_results_connector(module.AsyncResultsConnector(api_client))
+
+        module = importlib.import_module(module_path + ".delete_connector")
+        self.set_async_delete_connector(module.AsyncDeleteConnector(api_client))
+
+    def setup_transmission_basic_async(self, connection, configuration):
+        if AsyncRestApiClient.aiohttp is None:
+            # without aiohttp, the connectors set up by setup_transmission_basic are run in the default executor
+            return
+        module_name = self.__connector_module
+        module_path = "stix_shifter_modules." + module_name + ".stix_transmission"
+        module = importlib.import_module(module_path + ".connector")
+        connector = module.AsyncConnector(connection, configuration)
+
+        if not isinstance(connector, BaseAsyncConnector):
+            raise Exception('connector is not instance of BaseAsyncConnector')
+        self.set_async_query_connector(connector)
+        self.set_async_status_connector(connector)
+        self.set_async_results_connector(connector)
+        self.set_async_delete_connector(connector)
+        self.set_async_ping_connector(connector)
+
     def set_query_connector(self, connector):
         if not (isinstance(connector, (BaseConnector, BaseQueryConnector)) or issubclass(connector, BaseConnector)):
             raise Exception('connector is not instance of BaseConnector (or it\'s subclass) or BaseQueryConnector')
         self.__query_connector = connector
 
+    def set_async_query_connector(self, connector):
+        if not isinstance(connector, (BaseAsyncConnector, BaseAsyncQueryConnector)):
+            raise Exception('connector is not instance of BaseAsyncConnector or BaseAsyncQueryConnector')
+        self.__async_connectors['query'] = connector
+
     @transmission
     def create_query_connection(self, query):
+        if self.__query_connector is None and 'query' in self.__async_connectors:
+            return run_sync(self.create_query_connection_async(query))
         return self.__query_connector.create_query_connection(query)
 
+    @transmission
+    async def create_query_connection_async(self, query):
+        return await self.__transmit_async('query', self.create_query_connection, query)
+
     def set_status_connector(self, connector):
         if not (isinstance(connector, (BaseConnector, BaseStatusConnector)) or issubclass(connector, BaseConnector)):
             raise Exception('connector is not instance of BaseConnector (or it\'s subclass) or BaseStatusConnector')
         self.__status_connector = connector
 
+    def set_async_status_connector(self, connector):
+        if not isinstance(connector, (BaseAsyncConnector, BaseAsyncStatusConnector)):
+            raise Exception('connector is not instance of BaseAsyncConnector or BaseAsyncStatusConnector')
+        self.__async_connectors['status'] = connector
+
     @transmission
     def create_status_connection(self, search_id):
+        if self.__status_connector is None and 'status' in self.__async_connectors:
+            return run_sync(self.create_status_connection_async(search_id))
         return self.__status_connector.create_status_connection(search_id)
 
+    @transmission
+    async def create_status_connection_async(self, search_id):
+        return await self.__transmit_async('status', self.create_status_connection, search_id)
+
     def set_results_connector(self, connector):
         if not isinstance(connector, (BaseConnector, BaseResultsConnector)):
             raise Exception('connector is not instance of BaseConnector or BaseResultsConnector')
         self.__results_connector = connector
 
+    def set_async_results_connector(self, connector):
+        if not isinstance(connector, (BaseAsyncConnector, BaseAsyncResultsConnector)):
+            raise Exception('connector is not instance of BaseAsyncConnector or BaseAsyncResultsConnector')
+        self.__async_connectors['results'] = connector
+
     @transmission
     def create_results_connection(self, search_id, offset, length):
+        if self.__results_connector is None and 'results' in self.__async_connectors:
+            return run_sync(self.create_results_connection_async(search_id, offset, length))
         return self.__results_connector.create_results_connection(search_id, offset, length)
 
+    @transmission
+    async def create_results_connection_async(self, search_id, offset, length):
+        return await self.__transmit_async('results', self.create_results_connection, search_id, offset, length)
+
     @transmission
     def create_results_stix_connection(self, search_id, offset, length, data_source):
+        if self.__results_connector is None and 'results' in self.__async_connectors:
+            return run_sync(self.create_results_stix_connection_async(search_id, offset, length, data_source))
         return self.__results_connector.create_results_stix_connection(self, search_id, offset, length, data_source)
 
+    @transmission
+    async def create_results_stix_connection_async(self, search_id, offset, length, data_source):
+        connector = self.__async_connectors.get('results')
+        if connector is None:
+            return await self.__transmit_async('results', self.create_results_stix_connection, search_id, offset,
+                                               length, data_source)
+        return await connector.create_results_stix_connection(self, search_id, offset, length, data_source)
+
     def set_delete_connector(self, connector):
         if not isinstance(connector, (BaseConnector, BaseDeleteConnector)):
             raise Exception('connector is not instance of BaseConnector or BaseDeleteConnector')
         self.__delete_connector = connector
 
+    def set_async_delete_connector(self, connector):
+        if not isinstance(connector, (BaseAsyncConnector, BaseAsyncDeleteConnector)):
+            raise Exception('connector is not instance of BaseAsyncConnector or BaseAsyncDeleteConnector')
+        self.__async_connectors['delete'] = connector
+
     @transmission
     def delete_query_connection(self, search_id):
+        if self.__delete_connector is None and 'delete' in self.__async_connectors:
+            return run_sync(self.delete_query_connection_async(search_id))
         return self.__delete_connector.delete_query_connection(search_id)
 
+    @transmission
+    async def delete_query_connection_async(self, search_id):
+        return await self.__transmit_async('delete', self.delete_query_connection, search_id)
+
     def set_ping_connector(self, connector):
         if not isinstance(connector, (BaseConnector, BasePingConnector)):
             raise Exception('connector is not instance of BaseConnector or BasePingConnector')
         self.__ping_connector = connector
 
+    def set_async_ping_connector(self, connector):
+        if not isinstance(connector, (BaseAsyncConnector, BaseAsyncPingConnector)):
+            raise Exception('connector is not instance of BaseAsyncConnector or BaseAsyncPingConnector')
+        self.__async_connectors['ping'] = connector
+
     @transmission
     def ping_connection(self):
+        if self.__ping_connector is None and 'ping' in self.__async_connectors:
+            return run_sync(self.ping_connection_async())
         return self.__ping_connector.ping_connection()
 
+    @transmission
+    async def ping_connection_async(self):
+        return await self.__transmit_async('ping', self.ping_connection)
+
     def set_async(self, is_async):
         self.__async = is_async
 
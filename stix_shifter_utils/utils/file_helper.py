@@ -1,4 +1,5 @@
 import json
+from stix_shifter_utils.utils import json_facade
 import traceback
 import os
 from pathlib import Path
@@ -34,7 +35,7 @@ def read_json(filepath, options, search_path=__default_search_path):
         file_path = os.path.join(json_path, file_name)
         logger.debug('returning in_module_path for: ' + filepath + '->' + file_path)
     with open(file_path, 'r') as f:
-        return json.load(f)
+        return json_facade.load(f)
 
 
 def get_json_path(search_path=__default_search_path, depth=3):
@@ -0,0 +1,144 @@
+"""
+JSON encoding and decoding through the fastest library installed: orjson, then ujson, then the standard library.
+The backend can be forced with the STIXSHIFTER_JSON_BACKEND environment variable (orjson, ujson or json).
+
+The results are those of the standard json module: decoding falls back to it for the documents the backend
+rejects (ie. NaN or integers over 64 bits) so errors are still json.JSONDecodeError, and dumps keeps its formatting.
+encode and encode_bytes are the fast way to serialize when only the content matters, their output is compact.
+"""
+import json
+import os
+from stix_shifter_utils.utils import logger
+
+BACKEND_ORJSON = 'orjson'
+BACKEND_UJSON = 'ujson'
+BACKEND_STDLIB = 'json'
+BACKENDS = (BACKEND_ORJSON, BACKEND_UJSON, BACKEND_STDLIB)
+
+JSONDecodeError = json.JSONDecodeError
+
+_logger = logger.set_logger(__name__)
+_backend = None
+_loads = json.loads
+_decode_error = json.JSONDecodeError
+_encode = None
+_encode_bytes = None
+
+
+def _stdlib_encode(obj, default=None):
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=default)
+
+
+def _stdlib_encode_bytes(obj, default=None):
+    return _stdlib_encode(obj, default=default).encode('utf-8')
+
+
+def set_backend(name=None):
+    """
+    Selects the JSON library used, the first one installed when name is None
+    :param name: orjson, ujson or json
+    :type name: str
+    :return: the name of the selected backend
+    :rtype: str
+    """
+    global _backend, _loads, _decode_error, _encode, _encode_bytes
+    names = [name] if name else BACKENDS
+    for candidate in names:
+        if candidate == BACKEND_ORJSON:
+            try:
+                import orjson
+            except ImportError:
+                continue
+            _loads = orjson.loads
+            _decode_error = orjson.JSONDecodeError
+            _encode_bytes = lambda obj, default=None: orjson.dumps(obj, default=default)
+            _encode = lambda obj, default=None: orjson.dumps(obj, default=default).decode('utf-8')
+        elif candidate == BACKEND_UJSON:
+            try:
+                import ujson
+            except ImportError:
+                continue
+            _loads = ujson.loads
+            _decode_error = ValueError
+            _encode = lambda obj, default=None: ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                                                            default=default)
+            _encode_bytes = lambda obj, default=None: _encode(obj, default=default).encode('utf-8')
+        elif candidate == BACKEND_STDLIB:
+            _loads = json.loads
+            _decode_error = json.JSONDecodeError
+            _encode = _stdlib_encode
+            _encode_bytes = _stdlib_encode_bytes
+        else:
+            raise ValueError("Unknown JSON backend: {}".format(candidate))
+        _backend = candidate
+        return _backend
+    _logger.debug("JSON backend {} is not installed, using the standard library".format(name))
+    return set_backend(BACKEND_STDLIB)
+
+
+def get_backend():
+    return _backend
+
+
+def loads(data, **kwargs):
+    """
+    Decodes a JSON document
+    :param data: JSON text
+    :type data: str or bytes
+    :param kwargs: json.loads arguments, the standard library decodes the documents needing them
+    :return: decoded value
+    """
+    if kwargs or _backend == BACKEND_STDLIB:
+        return json.loads(data, **kwargs)
+    try:
+        return _loads(data)
+    except _decode_error:
+        # the standard library either accepts it or raises the error the callers expect
+        return json.loads(data)
+
+
+def load(fp, **kwargs):
+    return loads(fp.read(), **kwargs)
+
+
+def dumps(obj, **kwargs):
+    """
+    Encodes obj exactly like json.dumps, for output compared or hashed as text
+    """
+    return json.dumps(obj, **kwargs)
+
+
+def encode(obj, default=None):
+    """
+    Encodes obj to compact JSON text with the fastest backend
+    :param obj: value to encode
+    :param default: called with the objects that can not be encoded, returns an encodable version of them
+    :type default: function
+    :rtype: str
+    """
+    try:
+        return _encode(obj, default=default)
+    except Exception:
+        # ie. non string keys or integers over 64 bits
+        return _stdlib_encode(obj, default=default)
+
+
+def encode_bytes(obj, default=None):
+    """
+    Encodes obj to compact UTF-8 JSON with the fastest backend, ie. for request bodies
+    :rtype: bytes
+    """
+    try:
+        return _encode_bytes(obj, default=default)
+    except Exception:
+        return _stdlib_encode_bytes(obj, default=default)
+
+
+def deep_copy(obj):
+    """
+    Copies a JSON compatible value, faster than copy.deepcopy
+    """
+    return loads(encode_bytes(obj))
+
+
+set_backend(os.getenv('STIXSHIFTER_JSON_BACKEND'))
@@ -0,0 +1,90 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe least-recently-used cache.
+    Values are created outside of the lock, so a slow factory never blocks readers of other keys.
+    """
+
+    def __init__(self, maxsize=128):
+        if maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if not self.maxsize:
+            return value
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def get_or_create(self, key, factory):
+        """
+        Returns the cached value for key, calling factory() to build and store it on a miss.
+        Exceptions raised by the factory propagate and nothing is cached.
+        """
+        sentinel = _MISSING
+        value = self.get(key, sentinel)
+        if value is not sentinel:
+            return value
+        value = factory()
+        with self._lock:
+            # another thread may have raced us to it; keep the first stored value
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+        return self.put(key, value)
+
+    def invalidate(self, predicate=None):
+        """
+        Removes entries from the cache
+        :param predicate: callable taking a key, only keys for which it returns True are removed; None removes everything
+        :return: number of removed entries
+        """
+        with self._lock:
+            if predicate is None:
+                removed = len(self._data)
+                self._data.clear()
+            else:
+                keys = [key for key in self._data if predicate(key)]
+                for key in keys:
+                    del self._data[key]
+                removed = len(keys)
+        return removed
+
+    def clear(self):
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+_MISSING = object()
@@ -0,0 +1,31 @@
+from stix_shifter_utils.utils import json_facade
+
+
+def read_ndjson(lines):
+    """
+    Parses newline delimited JSON, one value per line, blank lines are skipped
+    :param lines: text lines, ie. an open file or sys.stdin
+    :type lines: iterable
+    :return: the parsed values
+    :rtype: generator
+    """
+    for line in lines:
+        if line.strip():
+            yield json_facade.loads(line)
+
+
+def write_ndjson(values, output):
+    """
+    Writes values to output as newline delimited JSON, one value per line
+    :param values: JSON serializable values, ie. a generator of STIX objects
+    :type values: iterable
+    :param output: text stream, ie. sys.stdout
+    :return: number of written values
+    :rtype: int
+    """
+    count = 0
+    for value in values:
+        output.write(json_facade.encode(value))
+        output.write('\n')
+        count += 1
+    return count
@@ -1,5 +1,5 @@
 import re
-import json
+from stix_shifter_utils.utils import json_facade
 from jsonmerge import merge
 import importlib
 from os import path
@@ -14,10 +14,10 @@ def get_merged_config(module):
     module_config_path = path.join(base_path, module, 'configuration', 'config.json')
     base_config_path = path.join(base_path, 'config.json')
     with open(module_config_path) as mapping_file:
-        module_configs = json.load(mapping_file)
+        module_configs = json_facade.load(mapping_file)
     if path.isfile(base_config_path):
         with open(base_config_path) as mapping_file:
-            base_configs = json.load(mapping_file)
+            base_configs = json_facade.load(mapping_file)
         module_configs = merge(base_configs, module_configs)
     return module_configs
 
@@ -0,0 +1,254 @@
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+from stix_shifter_utils.utils import logger
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# seconds before its expiry a token is refreshed, at most half of its lifetime
+REFRESH_AHEAD_DEFAULT = 60
+
+
+def token_key(module, host, credentials):
+    """
+    Returns the key of a token: the credentials are only kept as a fingerprint
+    :param module: name of the connector module
+    :type module: str
+    :param host: server the token is for
+    :type host: str
+    :param credentials: credentials the token is requested with
+    :type credentials: dict
+    :return: key of the token
+    :rtype: str
+    """
+    fingerprint = hashlib.sha256(json.dumps(credentials, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return '{}|{}|{}'.format(module, host, fingerprint)
+
+
+class MemoryTokenStore:
+    """
+    Tokens of the process
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def put(self, key, entry):
+        self._entries[key] = entry
+
+    def delete(self, key):
+        self._entries.pop(key, None)
+
+    def lock(self, key):
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+class _FileLock:
+    # lock of the threads of the process, then of the processes sharing the file (when fcntl is available)
+
+    def __init__(self, path):
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._file = None
+
+    def acquire(self, blocking=True):
+        if not self._thread_lock.acquire(blocking):
+            return False
+        if fcntl is None:
+            return True
+        lock_file = os.fdopen(os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o600), 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            self._thread_lock.release()
+            return False
+        self._file = lock_file
+        return True
+
+    def release(self):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+
+class FileTokenStore:
+    """
+    Tokens shared by the processes of a host, in the files of a directory readable by their owner only
+    """
+
+    def __init__(self, directory):
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # makedirs leaves the mode of an existing directory as it is
+        status = os.stat(directory)
+        if hasattr(os, 'getuid') and status.st_uid != os.getuid():
+            raise PermissionError("Token cache directory {} is not owned by the user".format(directory))
+        if stat.S_IMODE(status.st_mode) & 0o077:
+            os.chmod(directory, 0o700)
+        self.directory = directory
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest())
+
+    def get(self, key):
+        try:
+            with open(self._path(key) + '.json') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, entry):
+        # written aside then renamed, the readers never see a partial file
+        fd, path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entry, f)
+        os.replace(path, self._path(key) + '.json')
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key) + '.json')
+        except FileNotFoundError:
+            pass
+
+    def lock(self, key):
+        with self._locks_lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = _FileLock(self._path(key) + '.lock')
+            return lock
+
+
+class TokenCache:
+    """
+    Cache of the authentication tokens of the connectors, by module, host and credentials.
+    A token is refreshed ahead of its expiry by one caller, the others keep using it meanwhile; without a valid token,
+    the concurrent callers wait for a single request of a new one.
+    """
+
+    def __init__(self, store=None, refresh_ahead=REFRESH_AHEAD_DEFAULT):
+        self.store = store if store is not None else MemoryTokenStore()
+        self.refresh_ahead = refresh_ahead
+        self.logger = logger.set_logger(__name__)
+
+    def get_token(self, module, host, credentials, fetch):
+        """
+        Returns the cached token, or the token requested with fetch when there is no valid one
+        :param module: name of the connector module
+        :type module: str
+        :param host: server the token is for
+        :type host: str
+        :param credentials: credentials the token is requested with
+        :type credentials: dict
+        :param fetch: function requesting a token, returning it and its lifetime in seconds (None when unknown,
+            the token is then not cached). Its exceptions propagate and nothing is cached.
+        :type fetch: function
+        :return: the token
+        """
+        key = token_key(module, host, credentials)
+        entry = self.store.get(key)
+        now = time.time()
+        if entry is not None and now < entry['expires_at']:
+            if now < entry['refresh_at']:
+                return entry['token']
+            lock = self.store.lock(key)
+            if not lock.acquire(blocking=False):
+                # being refreshed by another caller
+                return entry['token']
+            try:
+                return self._refresh(key, fetch)
+            except Exception as ex:
+                self.logger.warning('token refresh failed, the current token is used until it expires: ' + str(ex))
+                return entry['token']
+            finally:
+                lock.release()
+        lock = self.store.lock(key)
+        lock.acquire()
+        try:
+            return self._refresh(key, fetch)
+        finally:
+            lock.release()
+
+    def _refresh(self, key, fetch):
+        entry = self.store.get(key)
+        if entry is not None and time.time() < entry['refresh_at']:
+            # refreshed by another caller meanwhile
+            return entry['token']
+        token, lifetime = fetch()
+        if lifetime:
+            now = time.time()
+            lifetime = float(lifetime)
+            self.store.put(key, {'token': token, 'expires_at': now + lifetime,
+                                 'refresh_at': now + lifetime - min(self.refresh_ahead, lifetime / 2)})
+        return token
+
+    def invalidate(self, module, host, credentials, token=None):
+        """
+        Removes a token, rejected by the server before its expiry
+        :param module: name of the connector module
+        :type module: str
+        :param host: server the token is for
+        :type host: str
+        :param credentials: credentials the token is requested with
+        :type credentials: dict
+        :param token: the rejected token: it is only removed when it is still the cached one, not when another caller
+            already replaced it
+        :type token: str
+        """
+        key = token_key(module, host, credentials)
+        with self.store.lock(key):
+            entry = self.store.get(key)
+            if entry is not None and (token is None or entry['token'] == token):
+                self.store.delete(key)
+
+
+_token_cache = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache():
+    """
+    Returns the token cache shared by the connectors. Its tokens are kept in the files of the
+    STIXSHIFTER_TOKEN_CACHE_DIR directory when it is set, for the processes of a host, in the process otherwise.
+    :rtype: TokenCache
+    """
+    global _token_cache
+    with _token_cache_lock:
+        if _token_cache is None:
+            directory = os.getenv('STIXSHIFTER_TOKEN_CACHE_DIR')
+            _token_cache = TokenCache(FileTokenStore(directory) if directory else MemoryTokenStore())
+        return _token_cache
+
+
+def set_token_cache(token_cache):
+    """
+    Replaces the token cache shared by the connectors, for instance with a cache having another store
+    :param token_cache: the cache, None for the default one
+    :type token_cache: TokenCache
+    """
+    global _token_cache
+    with _token_cache_lock:
+        _token_cache = token_cache
@@ -0,0 +1,34 @@
+import json
+from stix_shifter.stix_translation import stix_translation
+
+translation = stix_translation.StixTranslation()
+
+DATA_SOURCE = '{"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "QRadar", ' \
+              '"identity_class": "events"}'
+PATTERNS = ["[ipv4-addr:value = '10.0.0.{}']".format(i) for i in range(20)]
+PATTERNS[7] = "[unmapped-object:value = 'x']"
+
+
+class TestBatchTranslation(object):
+
+    def test_sequential_batch(self):
+        results = translation.translate_batch('qradar', 'query', '{}', PATTERNS, {})
+        assert len(results) == len(PATTERNS)
+        assert results[0] == translation.translate('qradar', 'query', '{}', PATTERNS[0], {})
+        assert results[7]['success'] is False
+        assert "'10.0.0.19'" in results[19]['queries'][1]
+
+    def test_process_pool_keeps_order_and_errors(self):
+        results = translation.translate_batch('qradar', 'query', '{}', PATTERNS, {}, workers=3)
+        for i, result in enumerate(results):
+            if i == 7:
+                assert result['success'] is False
+            else:
+                assert all("sourceip = '10.0.0.{}'".format(i) in query for query in result['queries'])
+
+    def test_results_batch(self):
+        pages = [json.dumps([{'sourceip': '10.0.0.{}'.format(i), 'logsourceid': 1}]) for i in range(4)]
+        results = translation.translate_batch('qradar', 'results', DATA_SOURCE, pages, {}, workers=2)
+        for i, result in enumerate(results):
+            objects = result['objects'][1]['objects']
+            assert {'type': 'ipv4-addr', 'value': '10.0.0.{}'.format(i)} in objects.values()
@@ -0,0 +1,39 @@
+from stix_shifter.stix_translation import stix_translation
+
+translation = stix_translation.StixTranslation()
+
+DATA_SOURCE = {"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "MySQL",
+               "identity_class": "events"}
+COLUMNS = ["source_ipaddr", "dest_ipaddr", "source_port", "unmapped_column", "username"]
+ROWS = [("10.0.0.{}".format(i), "10.0.1.1", i, "x", "user{}".format(i)) for i in range(5)]
+RANDOM_PROPERTIES = ('id', 'created', 'modified', 'first_observed', 'last_observed')
+
+
+def without_random_properties(objects):
+    return [{key: value for key, value in stix_object.items()
+             if not (stix_object['type'] == 'observed-data' and key in RANDOM_PROPERTIES)}
+            for stix_object in objects]
+
+
+def records(columns, rows):
+    return [dict(zip(columns, row)) for row in rows]
+
+
+class TestColumnarResults(object):
+
+    def test_columns_match_records(self):
+        for options in ({}, {'stix_2.1': True}, {'unmapped_fallback': True}):
+            expected = translation.translate('mysql', 'results', DATA_SOURCE, records(COLUMNS, ROWS), dict(options))
+            result = translation.translate_results_columns('mysql', DATA_SOURCE, COLUMNS, iter(ROWS), dict(options))
+            assert without_random_properties(result['objects']) == without_random_properties(expected['objects'])
+
+    def test_preprocessing_module_falls_back_to_records(self):
+        columns = ['sourceip', 'eventpayload']
+        rows = [('10.0.0.1', 'payload')]
+        expected = translation.translate('qradar', 'results', DATA_SOURCE, records(columns, rows), {})
+        result = translation.translate_results_columns('qradar', DATA_SOURCE, columns, rows, {})
+        assert without_random_properties(result['objects']) == without_random_properties(expected['objects'])
+
+    def test_invalid_data_source(self):
+        result = translation.translate_results_columns('mysql', '{', COLUMNS, ROWS, {})
+        assert result['success'] is False
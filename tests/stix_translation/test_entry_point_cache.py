@@ -0,0 +1,63 @@
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter.stix_translation.stix_translation import entry_point_cache, invalidate_entry_point_cache
+from stix_shifter_utils.utils.lru_cache import LRUCache
+
+translation = stix_translation.StixTranslation()
+
+PATTERN = "[ipv4-addr:value = '192.168.0.100']"
+
+
+class TestEntryPointCache(object):
+
+    def setup_method(self):
+        invalidate_entry_point_cache()
+
+    def test_entry_point_reused_for_same_options(self):
+        first = translation.translate('qradar', 'query', '{}', PATTERN, {})
+        assert len(entry_point_cache) == 1
+        second = translation.translate('qradar', 'query', '{}', PATTERN, {})
+        assert len(entry_point_cache) == 1
+        assert len(first['queries']) == len(second['queries'])
+
+    def test_different_options_get_own_entry_point(self):
+        translation.translate('qradar', 'query', '{}', PATTERN, {})
+        translation.translate('qradar', 'query', '{}', PATTERN, {'result_limit': 100})
+        translation.translate('qradar:events', 'query', '{}', PATTERN, {})
+        assert len(entry_point_cache) == 3
+
+    def test_invalidate_module(self):
+        translation.translate('qradar', 'query', '{}', PATTERN, {})
+        translation.translate('splunk', 'query', '{}', PATTERN, {})
+        assert invalidate_entry_point_cache('qradar:events') == 1
+        assert len(entry_point_cache) == 1
+        assert invalidate_entry_point_cache() == 1
+
+    def test_failed_construction_not_cached(self):
+        result = translation.translate('qradar', 'query', '{}', PATTERN, {'unknown_option': True})
+        assert result['success'] is False
+        assert len(entry_point_cache) == 0
+
+
+class TestLRUCache(object):
+
+    def test_eviction_order(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+
+    def test_get_or_create(self):
+        cache = LRUCache(2)
+        calls = []
+        assert cache.get_or_create('a', lambda: calls.append(1) or 'value') == 'value'
+        assert cache.get_or_create('a', lambda: calls.append(1) or 'other') == 'value'
+        assert len(calls) == 1
+
+    def test_zero_size_stores_nothing(self):
+        cache = LRUCache(0)
+        assert cache.get_or_create('a', lambda: 1) == 1
+        assert len(cache) == 0
@@ -0,0 +1,118 @@
+import json
+import os
+import pytest
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter_utils.stix_translation.src.patterns.parser import generate_query, PARSER_FAST
+from stix_shifter_utils.stix_translation.src.patterns.fast_parser import parse_pattern, UnsupportedPatternSyntax
+from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import PatternObject, SetValue
+
+translation = stix_translation.StixTranslation()
+
+# Patterns collected from the module translation tests
+with open(os.path.join(os.path.dirname(__file__), 'pattern_corpus.json')) as corpus_file:
+    CORPUS = json.load(corpus_file)
+
+PATTERNS = [
+    "[ipv4-addr:value = '192.168.122.83']",
+    "[ipv4-addr:value == '192.168.122.83' OR ipv4-addr:value <> '192.168.122.84']",
+    "[a:b = 'x' OR a:c = 'y' OR a:d = 'z' AND a:e = 'w']",
+    "[a:b = 'x' AND (a:c = 'y' OR a:d = 'z')]",
+    "[file:hashes.'SHA-256' = 'aec070645fe53ee3b3763059376134f058cc337247c978add178b6ccdfb0019f']",
+    "[network-traffic:protocols[*] = 'tcp' AND network-traffic:src_port >= 100 AND network-traffic:dst_port < -1]",
+    "[x:list[0].name NOT = 'a'] AND [x:list[-1] != 'b']",
+    "[x:size > 1.5 OR x:size <= -.25 OR x:size > +3]",
+    "[process:name IN ('cmd.exe', 'powershell.exe', 3) AND process:pid NOT IN ()]",
+    "[url:value LIKE '%example%' OR url:value NOT LIKE 'x_'] OR [url:value MATCHES '^http']",
+    "[x:y ISSUBSET '10.0.0.0/8'] AND [x:y NOT ISSUPERSET '10.0.0.0/8'] AND [x:y NOT ISSUBSET '10.0.0.0/24']",
+    "[artifact:payload_bin = b'dGVzdA=='] AND [artifact:payload_bin = h'00ff']",
+    "[x:created > t'2016-06-01T00:00:00Z']",
+    "[x:a = 'it\\'s'] AND [x:b = 'c:\\\\windows']",
+    "[a:b = 'x'] AND [a:c = 'y'] OR [a:d = 'z'] FOLLOWEDBY [a:e = 'w']",
+    "([a:b = 'x'] OR [a:c = 'y']) AND [a:d = 'z']",
+    "[a:b = 'x'] START t'2016-06-01T00:00:00Z' STOP t'2016-06-01T01:11:11.123Z'",
+    "([a:b = 'x'] OR [a:c = 'y']) START t'2016-06-01T00:00:00.1Z' STOP t'2016-06-01T01:11:11Z' "
+    "AND [a:d = 'z'] START t'2017-06-01T00:00:00.000Z' STOP t'2017-06-01T01:11:11.000Z'",
+    "[a:b = 'x'] WITHIN 5 SECONDS AND [a:c = 'y'] REPEATS 2 TIMES",
+    "[a:b = 'x'] /* comment */ AND [a:c = 'y'] // trailing comment",
+    "  [ a : b = 'x' ]\n\tOR\n[a:'quoted-key' = 'y']  ",
+    "[x-custom-object:x_property.'nested-key'[*] = 'v']",
+]
+
+INVALID_OR_UNSUPPORTED = [
+    "[a:b = true]",
+    "[a:b = 'x'",
+    "[a:b = 'x']]",
+    "[a:b = 'x'] AND",
+    "[a:b 'x']",
+    "[a:b = 'x' & a:c = 'y']",
+    "[a:prop-erty = 'x']",
+    "",
+]
+
+
+def assert_same_tree(expected, actual, path='pattern'):
+    assert type(expected) is type(actual), path
+    if isinstance(expected, PatternObject):
+        expected_attrs = {k: v for k, v in vars(expected).items() if k != '_frozen'}
+        actual_attrs = {k: v for k, v in vars(actual).items() if k != '_frozen'}
+        assert expected_attrs.keys() == actual_attrs.keys(), path
+        for key, value in expected_attrs.items():
+            if key == 'negated':
+                # ANTLR sets some of these to the NOT terminal node or None
+                assert bool(value) == bool(actual_attrs[key]), path
+            else:
+                assert_same_tree(value, actual_attrs[key], path + '.' + key)
+    elif isinstance(expected, SetValue):
+        assert expected.values == actual.values, path
+        assert expected.is_open == actual.is_open, path
+    else:
+        assert expected == actual, path
+
+
+class TestFastPatternParser(object):
+
+    @pytest.mark.parametrize('pattern', PATTERNS)
+    def test_same_tree_as_antlr(self, pattern):
+        assert_same_tree(generate_query(pattern), parse_pattern(pattern))
+
+    def test_corpus_same_tree_as_antlr(self):
+        native = 0
+        for pattern in CORPUS:
+            try:
+                actual = parse_pattern(pattern)
+            except UnsupportedPatternSyntax:
+                # only patterns ANTLR itself has to recover from are left to the fallback
+                actual = generate_query(pattern, PARSER_FAST)
+            else:
+                native += 1
+            assert_same_tree(generate_query(pattern), actual, pattern)
+        assert native >= len(CORPUS) - 10
+
+    @pytest.mark.parametrize('pattern', INVALID_OR_UNSUPPORTED)
+    def test_unsupported_syntax_is_rejected(self, pattern):
+        with pytest.raises(UnsupportedPatternSyntax):
+            parse_pattern(pattern)
+
+    def test_fast_engine_falls_back_to_antlr(self):
+        pattern = "[a:b = true]"
+        with pytest.raises(Exception) as antlr_error:
+            generate_query(pattern)
+        with pytest.raises(Exception) as fast_error:
+            generate_query(pattern, PARSER_FAST)
+        assert type(antlr_error.value) is type(fast_error.value)
+
+    def test_large_ioc_pattern_is_not_recursive(self):
+        pattern = '[' + ' OR '.join("ipv4-addr:value = '10.0.{}.{}'".format(i // 256, i % 256) for i in range(5000)) + ']'
+        parsed = parse_pattern(pattern)
+        assert parsed.expression.comparison_expression.expr1.value == '10.0.19.135'
+
+    def test_translate_with_fast_parser(self):
+        pattern = "[ipv4-addr:value = '192.168.122.83' OR url:value = 'http://example.com'] AND [file:name = 'x.exe']"
+        expected = translation.translate('qradar:events', 'query', '{}', pattern, {})
+        result = translation.translate('qradar:events', 'query', '{}', pattern, {'pattern_parser': 'fast'})
+        assert result == expected
+
+    def test_translate_rejects_unknown_parser(self):
+        result = translation.translate('qradar:events', 'query', '{}', "[ipv4-addr:value = '1.1.1.1']",
+                                       {'pattern_parser': 'yacc'})
+        assert result['success'] is False
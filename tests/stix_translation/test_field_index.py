@@ -0,0 +1,44 @@
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter_utils.modules.base.stix_translation.base_query_translator import compile_field_index
+
+translation = stix_translation.StixTranslation()
+
+
+def query_translator(module, dialect):
+    _, entry_point = translation._get_entry_point(module, 'query', [dialect], {})
+    return entry_point.get_query_translator(dialect)
+
+
+class TestFieldIndex(object):
+
+    def test_compile_field_index(self):
+        index = compile_field_index({
+            'ipv4-addr': {'fields': {'value': ['sourceip', 'destinationip']}},
+            'url': {'fields': {'value': 'url'}},
+            'startstopattr': 'eventtime'
+        })
+        assert index == {'ipv4-addr:value': ('sourceip', 'destinationip'), 'url:value': 'url'}
+
+    def test_map_field_returns_shared_tuples(self):
+        translator = query_translator('qradar', 'events')
+        fields = translator.map_field('ipv4-addr', 'value')
+        assert isinstance(fields, tuple) and 'sourceip' in fields
+        assert translator.map_object_path('ipv4-addr:value') is fields
+        assert translator.map_field('unmapped-object', 'value') == ()
+
+    def test_replaced_mapping_is_recompiled(self):
+        translator = query_translator('qradar', 'events')
+        map_data = translator.map_data
+        try:
+            translator.map_data = {'url': {'fields': {'value': ['link']}}}
+            assert translator.map_field('url', 'value') == ('link',)
+            assert translator.map_field('ipv4-addr', 'value') == ()
+        finally:
+            translator.map_data = map_data
+
+    def test_constructor_does_not_modify_mapping(self):
+        # arcsight keeps either the ip or the mac address field of a reference depending on the value
+        patterns = ["[network-traffic:src_ref.value = '00:1a:2b:3c:4d:5e']", "[network-traffic:src_ref.value = '1.1.1.1']"]
+        for pattern in patterns * 2:
+            result = translation.translate('arcsight', 'query', '{}', pattern, {})
+            assert result.get('success', True), result
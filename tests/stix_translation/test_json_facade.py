@@ -0,0 +1,49 @@
+import json
+import math
+import pytest
+from stix_shifter_utils.utils import json_facade
+
+VALUE = {"name": "café", "url": "https://example.com/a", "count": 3, "ratio": 0.5, "flag": True,
+         "nothing": None, "items": [1, "two", {"three": 3}]}
+
+
+@pytest.fixture(params=json_facade.BACKENDS)
+def backend(request):
+    previous = json_facade.get_backend()
+    json_facade.set_backend(request.param)
+    yield json_facade.get_backend()
+    json_facade.set_backend(previous)
+
+
+class TestJsonFacade(object):
+
+    def test_round_trip(self, backend):
+        assert json_facade.loads(json.dumps(VALUE)) == VALUE
+        assert json_facade.loads(json.dumps(VALUE).encode('utf-8')) == VALUE
+        assert json_facade.loads(json_facade.encode(VALUE)) == VALUE
+        assert json_facade.loads(json_facade.encode_bytes(VALUE)) == VALUE
+        copy = json_facade.deep_copy(VALUE)
+        assert copy == VALUE and copy['items'] is not VALUE['items']
+
+    def test_standard_library_results(self, backend):
+        assert json_facade.dumps(VALUE, indent=4) == json.dumps(VALUE, indent=4)
+        assert math.isnan(json_facade.loads('{"value": NaN}')['value'])
+        assert json_facade.loads(str(2 ** 70)) == 2 ** 70
+        assert json_facade.loads(json_facade.encode({1: 2 ** 70})) == {"1": 2 ** 70}
+        with pytest.raises(json.JSONDecodeError):
+            json_facade.loads('{"value": ')
+
+    def test_missing_backend_falls_back(self, backend):
+        assert json_facade.set_backend(backend) in json_facade.BACKENDS
+        with pytest.raises(ValueError):
+            json_facade.set_backend('simplejson')
+
+    def test_only_decode_errors_fall_back(self, backend, monkeypatch):
+        if backend == json_facade.BACKEND_STDLIB:
+            return
+
+        def fail(data):
+            raise MemoryError()
+        monkeypatch.setattr(json_facade, '_loads', fail)
+        with pytest.raises(MemoryError):
+            json_facade.loads('{}')
@@ -0,0 +1,34 @@
+import copy
+import json
+from stix_shifter.stix_translation import stix_translation
+
+translation = stix_translation.StixTranslation()
+
+DATA_SOURCE = {"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "QRadar",
+               "identity_class": "events"}
+RECORDS = [{"sourceip": "10.0.0.{}".format(i), "destinationip": "10.0.1.1", "sourceport": i,
+            "eventpayload": "payload {}".format(i), "Message": "message"} for i in range(3)]
+
+
+def cybox_objects(bundle):
+    return [stix_object.get('objects') for stix_object in bundle['objects'][1:]]
+
+
+class TestNativeResults(object):
+
+    def test_native_records_match_json_text(self):
+        text = translation.translate('qradar', 'results', json.dumps(DATA_SOURCE), json.dumps(RECORDS), {})
+        native = translation.translate('qradar', 'results', DATA_SOURCE, RECORDS, {})
+        assert native['objects'][0] == DATA_SOURCE
+        assert cybox_objects(native) == cybox_objects(text)
+
+    def test_native_records_not_modified(self):
+        records = copy.deepcopy(RECORDS)
+        translation.translate('qradar', 'results', DATA_SOURCE, records, {})
+        assert records == RECORDS
+
+    def test_stix_bundle_records_not_modified(self):
+        records = [{"type": "observed-data", "id": "observed-data--1", "number_observed": 1}]
+        result = translation.translate('stix_bundle', 'results', DATA_SOURCE, records, {})
+        assert result['objects'][1]['created_by_ref'] == DATA_SOURCE['id']
+        assert 'created_by_ref' not in records[0]
@@ -0,0 +1,56 @@
+import pytest
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter_utils.stix_translation.src.json_to_stix import json_to_stix_translator
+
+translation = stix_translation.StixTranslation()
+
+DATA_SOURCE = {"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "MySQL",
+               "identity_class": "events"}
+# source addresses repeat across chunks, their STIX 2.1 objects must be merged
+RECORDS = [{"source_ipaddr": "10.0.0.{}".format(i % 7), "dest_ipaddr": "10.0.1.{}".format(i), "source_port": i}
+           for i in range(40)]
+RANDOM_PROPERTIES = ('id', 'created', 'modified', 'first_observed', 'last_observed')
+
+
+def without_random_properties(objects):
+    return [{key: value for key, value in stix_object.items()
+             if not (stix_object['type'] == 'observed-data' and key in RANDOM_PROPERTIES)}
+            for stix_object in objects]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(json_to_stix_translator, 'TRANSLATE_CHUNK_SIZE_MIN', 3)
+
+
+class TestParallelResults(object):
+
+    @pytest.mark.parametrize('stix_21', [False, True])
+    def test_parallel_matches_serial(self, stix_21):
+        serial = translation.translate('mysql', 'results', DATA_SOURCE, RECORDS, {'stix_2.1': stix_21})
+        parallel = translation.translate('mysql', 'results', DATA_SOURCE, RECORDS,
+                                         {'stix_2.1': stix_21, 'translate_workers': 3})
+        assert len(parallel['objects']) == len(serial['objects'])
+        assert without_random_properties(parallel['objects']) == without_random_properties(serial['objects'])
+
+    def test_unique_cybox_objects_merged(self):
+        result = translation.translate('mysql', 'results', DATA_SOURCE, RECORDS,
+                                       {'stix_2.1': True, 'translate_workers': 2})
+        sources = [stix_object['value'] for stix_object in result['objects']
+                   if stix_object['type'] == 'ipv4-addr' and stix_object['value'].startswith('10.0.0.')]
+        assert sorted(sources) == ['10.0.0.{}'.format(i) for i in range(7)]
+
+    def test_pool_reused_across_pages(self):
+        json_to_stix_translator.shutdown_pools()
+        options = {'stix_2.1': True, 'translate_workers': 2}
+        first_page = translation.translate('mysql', 'results', DATA_SOURCE, RECORDS[:20], options)
+        pool = json_to_stix_translator._pools[2]
+        worker_pids = set(pool._processes)
+        second_page = translation.translate('mysql', 'results', DATA_SOURCE, RECORDS[20:], options)
+
+        # the workers, and the translators they compiled for the first page, translate the second one
+        assert json_to_stix_translator._pools[2] is pool
+        assert set(pool._processes) == worker_pids
+        assert len(first_page['objects']) > 1 and len(second_page['objects']) > 1
+        json_to_stix_translator.shutdown_pools()
+        assert json_to_stix_translator._pools == {}
@@ -0,0 +1,83 @@
+import pytest
+from unittest.mock import patch
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter_utils.stix_translation.src.patterns.parser import generate_query_cached, pattern_cache
+from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import CombinedComparisonExpression
+from stix_shifter_utils.stix_translation.src.utils.unmapped_attribute_stripper import strip_unmapped_attributes
+from stix_shifter_utils.modules.base.stix_translation import base_query_translator
+from stix_shifter_utils.modules.base.stix_translation.base_query_translator import validation_cache
+
+translation = stix_translation.StixTranslation()
+
+PATTERN = "[ipv4-addr:value = '192.168.0.100' OR unmapped-object:value = 'x'] AND [url:value = 'http://example.com']"
+
+
+class FakeMapping:
+    def map_field(self, stix_object, stix_field):
+        return [] if stix_object == 'unmapped-object' else ['field']
+
+
+class TestPatternCache(object):
+
+    def setup_method(self):
+        pattern_cache.clear()
+        validation_cache.clear()
+
+    def test_same_text_shares_parsed_pattern(self):
+        assert generate_query_cached(PATTERN) is generate_query_cached(PATTERN)
+        assert pattern_cache.hits == 1
+        assert pattern_cache.misses == 1
+
+    def test_cached_pattern_is_frozen(self):
+        pattern = generate_query_cached(PATTERN)
+        assert pattern.is_frozen()
+        with pytest.raises(AttributeError):
+            pattern.expression = None
+        copy = pattern.copy()
+        assert not copy.is_frozen()
+        copy.expression = None
+        assert pattern.expression is not None
+
+    def test_stripper_leaves_cached_pattern_untouched(self):
+        pattern = generate_query_cached(PATTERN)
+        before = repr(pattern)
+        stripped = strip_unmapped_attributes(pattern, FakeMapping())
+        assert stripped['unmapped_stix'] == ['unmapped-object:value']
+        assert 'unmapped-object' not in repr(stripped['parsing'])
+        assert repr(pattern) == before
+        assert isinstance(pattern.expression.expr1.comparison_expression, CombinedComparisonExpression)
+        assert not stripped['parsing'].is_frozen()
+
+    def test_repeated_translation_is_stable(self):
+        # the query constructors modify comparison values in place, which must not leak into the cache
+        pattern = "[network-traffic:protocols[*] = 'tcp'] AND [mac-addr:value = '00:00:00:00:00:00']"
+        first = translation.translate('qradar', 'query', '{}', pattern, {})
+        second = translation.translate('qradar', 'query', '{}', pattern, {})
+        assert first == second
+
+    def test_multiple_dialects_parse_once(self):
+        with patch('stix_shifter_utils.modules.base.stix_translation.base_query_translator.run_validator',
+                   return_value=[]) as validator:
+            result = translation.translate('qradar:events:flows', 'query', '{}', PATTERN, {'validate_pattern': True})
+        assert len(result['queries']) == 2
+        assert validator.call_count == 1
+        assert pattern_cache.misses == 1
+        assert pattern_cache.hits == 0
+
+    def test_validation_shared_across_modules(self):
+        with patch.object(base_query_translator, 'run_validator', wraps=base_query_translator.run_validator) \
+                as validator:
+            for module in ('qradar', 'splunk', 'qradar'):
+                result = translation.translate(module, 'query', '{}', PATTERN, {'validate_pattern': True})
+                assert result['queries']
+            translation.translate('qradar', 'query', '{}', '  ' + PATTERN + ' ', {'validate_pattern': True})
+        assert validator.call_count == 1
+
+    def test_validation_errors_cached(self):
+        pattern = "[ipv4-addr:value = '1.1.1.1' AND]"
+        for _ in range(2):
+            result = translation.translate('qradar', 'query', '{}', pattern, {'validate_pattern': True})
+            assert result['success'] is False
+            assert 'The STIX pattern has the following errors' in result['error']
+        assert validation_cache.hits == 1
+        assert len(validation_cache) == 1
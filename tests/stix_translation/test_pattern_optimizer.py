@@ -0,0 +1,72 @@
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter_utils.stix_translation.src.patterns.parser import generate_query, generate_query_cached
+from stix_shifter_utils.stix_translation.src.patterns.optimizer import optimize_pattern, node_key
+from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import \
+    ComparisonComparators, ObservationExpression, StartStopQualifier
+
+translation = stix_translation.StixTranslation()
+
+
+def merge_all(expression):
+    return True
+
+
+def assert_equivalent(pattern, expected_pattern, can_merge_into_set=merge_all):
+    optimized = optimize_pattern(generate_query(pattern), can_merge_into_set)
+    assert node_key(optimized) == node_key(generate_query(expected_pattern))
+
+
+class TestPatternOptimizer(object):
+
+    def test_ored_observations_merged_into_set(self):
+        pattern = "[ipv4-addr:value = '1.1.1.1'] OR [ipv4-addr:value = '2.2.2.2'] OR [ipv4-addr:value = '1.1.1.1']"
+        optimized = optimize_pattern(generate_query(pattern), merge_all)
+        assert isinstance(optimized.expression, ObservationExpression)
+        comparison = optimized.expression.comparison_expression
+        assert comparison.comparator == ComparisonComparators.In
+        assert sorted(comparison.value.values) == ['1.1.1.1', '2.2.2.2']
+
+    def test_ored_comparisons_merged_into_set(self):
+        # operands are stored right to left by the parser
+        assert_equivalent("[url:value = 'a' OR ipv4-addr:value = '1.1.1.1' OR ipv4-addr:value IN ('2.2.2.2', '3.3.3.3')]",
+                          "[url:value = 'a' OR ipv4-addr:value IN ('2.2.2.2', '3.3.3.3', '1.1.1.1')]")
+
+    def test_negated_and_not_allowed_comparisons_kept(self):
+        pattern = "[ipv4-addr:value = '1.1.1.1' OR ipv4-addr:value NOT = '2.2.2.2']"
+        assert_equivalent(pattern, pattern)
+        pattern = "[ipv4-addr:value = '1.1.1.1' OR ipv4-addr:value = '2.2.2.2']"
+        assert_equivalent(pattern, pattern, can_merge_into_set=None)
+
+    def test_duplicates_and_absorbed_comparisons_removed(self):
+        assert_equivalent("[url:value = 'a' AND url:value = 'a']", "[url:value = 'a']")
+        assert_equivalent("[url:value = 'a' OR (url:value = 'a' AND file:name = 'b')]", "[url:value = 'a']")
+        # not absorbed at the observation level, constructors may translate observation AND like OR
+        pattern = "[url:value = 'a'] OR ([url:value = 'a'] AND [file:name = 'b'])"
+        assert_equivalent(pattern, pattern)
+
+    def test_same_window_qualifiers_merged(self):
+        pattern = "[file:name = 'a'] START t'2016-06-01T00:00:00Z' STOP t'2016-06-01T01:11:11Z' " \
+                  "OR [file:name = 'b'] START t'2016-06-01T00:00:00.000Z' STOP t'2016-06-01T01:11:11.000Z' " \
+                  "OR [file:name = 'c'] START t'2017-06-01T00:00:00Z' STOP t'2017-06-01T01:11:11Z'"
+        optimized = optimize_pattern(generate_query(pattern), merge_all)
+        qualifiers = [optimized.expression.expr1, optimized.expression.expr2]
+        assert all(isinstance(qualifier, StartStopQualifier) for qualifier in qualifiers)
+        assert qualifiers[0].observation_expression.comparison_expression.value.values == ['a', 'b']
+        assert qualifiers[1].observation_expression.comparison_expression.value == 'c'
+
+    def test_cached_pattern_not_modified(self):
+        pattern = generate_query_cached("[ipv4-addr:value = '1.1.1.1'] OR [ipv4-addr:value = '2.2.2.2']")
+        before = node_key(pattern)
+        optimize_pattern(pattern, merge_all)
+        assert node_key(pattern) == before
+
+    def test_translate_with_optimizer(self):
+        pattern = "[ipv4-addr:value = '1.1.1.1'] OR [ipv4-addr:value = '2.2.2.2'] OR [ipv4-addr:value = '1.1.1.1']"
+        result = translation.translate('qradar:events', 'query', '{}', pattern, {'optimize_pattern': True})
+        assert "sourceip IN ('1.1.1.1', '2.2.2.2')" in result['queries'][0]
+        assert result['queries'][0].count('sourceip') == 2  # the select list and the IN comparison
+
+    def test_translate_keeps_cidr_equality(self):
+        pattern = "[ipv4-addr:value = '10.0.0.0/8'] OR [ipv4-addr:value = '2.2.2.2']"
+        result = translation.translate('qradar:events', 'query', '{}', pattern, {'optimize_pattern': True})
+        assert "INCIDR('10.0.0.0/8',sourceip)" in result['queries'][0]
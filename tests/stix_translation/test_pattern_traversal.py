@@ -0,0 +1,66 @@
+import sys
+import pytest
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter_utils.stix_translation.src.patterns.parser import generate_query, generate_query_cached
+from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import CombinedComparisonExpression, \
+    ComparisonExpression, ComparisonExpressionOperators, ComparisonComparators
+from stix_shifter_utils.stix_translation.src.patterns.traversal import flatten, combine, balance, iter_nodes
+from stix_shifter_utils.stix_translation.src.utils.stix_pattern_parser import parse_stix
+
+translation = stix_translation.StixTranslation()
+
+
+def ioc_pattern(count):
+    return '[' + ' OR '.join("ipv4-addr:value = '10.{}.{}.{}'".format(i // 65536, (i // 256) % 256, i % 256)
+                             for i in range(count)) + ']'
+
+
+def depth(root):
+    deepest = 0
+    stack = [(root, 1)]
+    while stack:
+        node, level = stack.pop()
+        deepest = max(deepest, level)
+        stack.extend((child, level + 1) for child in (getattr(node, field) for field in node.child_fields))
+    return deepest
+
+
+class TestPatternTraversal(object):
+
+    def test_flatten_keeps_operand_order(self):
+        pattern = generate_query("[a:b = 'x' OR a:c = 'y' OR (a:d = 'z' AND a:e = 'w')]")
+        operands = flatten(pattern.expression.comparison_expression)
+        assert len(operands) == 3
+        assert isinstance(operands[0], CombinedComparisonExpression)
+        assert [operand.object_path for operand in operands[1:]] == ['a:c', 'a:b']
+
+    def test_combine_is_balanced(self):
+        operands = [ComparisonExpression('a:b', i, ComparisonComparators.Equal) for i in range(1000)]
+        combined = combine(operands, ComparisonExpressionOperators.Or)
+        assert flatten(combined) == operands
+        assert depth(combined) == 11
+
+    def test_balance_leaves_small_and_cached_patterns_untouched(self):
+        small = generate_query_cached("[a:b = 'x' OR a:c = 'y' OR a:d = 'z']")
+        assert balance(small) is small
+        large = generate_query_cached(ioc_pattern(500))
+        balanced = balance(large)
+        assert depth(large) == 502
+        assert depth(balanced) < 15
+        assert [node.value for node in iter_nodes(balanced) if isinstance(node, ComparisonExpression)] == \
+            [node.value for node in iter_nodes(large) if isinstance(node, ComparisonExpression)]
+
+    @pytest.mark.parametrize('parser', ['antlr', 'fast'])
+    def test_large_pattern_within_default_recursion_limit(self, parser):
+        count = 3000 if parser == 'antlr' else 20000
+        pattern = ioc_pattern(count)
+        options = {'pattern_parser': parser, 'max_query_length': 0, 'max_set_size': 0}
+        result = translation.translate('qradar:events', 'query', '{}', pattern, options,
+                                       recursion_limit=sys.getrecursionlimit())
+        assert result.get('success', True), result
+        assert result['queries'][0].count("sourceip = '10.") == count
+
+    def test_parse_stix_large_pattern(self):
+        parsed = parse_stix(generate_query(ioc_pattern(5000), 'fast'), 5)
+        assert len(parsed['parsed_stix']) == 5000
+        assert parsed['parsed_stix'][0]['value'] == '10.0.19.135'
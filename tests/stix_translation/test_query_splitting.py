@@ -0,0 +1,63 @@
+import re
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter_utils.stix_translation.src.patterns.parser import generate_query
+from stix_shifter_utils.stix_translation.src.patterns.splitter import split_sets, split_in_half
+from stix_shifter_utils.stix_translation.src.patterns.traversal import iter_nodes
+from stix_shifter_utils.stix_translation.src.patterns.pattern_objects import ComparisonExpression, Pattern, Qualifier
+
+translation = stix_translation.StixTranslation()
+
+IPS = ['10.0.{}.{}'.format(i // 256, i % 256) for i in range(600)]
+
+
+def values(pattern):
+    found = []
+    for node in iter_nodes(pattern):
+        if isinstance(node, ComparisonExpression):
+            found.extend(node.value.values if hasattr(node.value, 'values') else [node.value])
+    return found
+
+
+class TestQuerySplitting(object):
+
+    def test_split_sets(self):
+        pattern = generate_query("[ipv4-addr:value IN ({}) AND url:value = 'x']".format(
+            ', '.join("'{}'".format(ip) for ip in IPS[:25])))
+        parts = split_sets(pattern, 10)
+        assert len(parts) == 3
+        assert [len(values(part)) for part in parts] == [11, 11, 6]
+        assert sorted(value for part in parts for value in values(part) if value != 'x') == sorted(IPS[:25])
+        assert len(values(pattern)) == 26
+
+    def test_negated_set_not_split(self):
+        pattern = generate_query("[ipv4-addr:value NOT IN ('1.1.1.1', '2.2.2.2', '3.3.3.3')]")
+        assert split_sets(pattern, 2) == [pattern]
+        assert split_in_half(pattern) is None
+
+    def test_repeats_not_split(self):
+        observation = generate_query("[ipv4-addr:value IN ('1.1.1.1', '2.2.2.2', '3.3.3.3')]").expression
+        pattern = Pattern(Qualifier('REPEATS 2 TIMES', observation))
+        assert split_sets(pattern, 2) == [pattern]
+        assert split_in_half(pattern) is None
+
+    def test_split_in_half_largest_or_chain(self):
+        pattern = generate_query("[url:value = 'a' OR url:value = 'b'] AND "
+                                 "[ipv4-addr:value = '1.1.1.1' OR ipv4-addr:value = '2.2.2.2' OR ipv4-addr:value = '3.3.3.3']")
+        halves = split_in_half(pattern)
+        assert [sorted(values(half)) for half in halves] == [['1.1.1.1', 'a', 'b'], ['2.2.2.2', '3.3.3.3', 'a', 'b']] or \
+            [sorted(values(half)) for half in halves] == [['3.3.3.3', 'a', 'b'], ['1.1.1.1', '2.2.2.2', 'a', 'b']]
+
+    def test_translate_within_max_query_length(self):
+        pattern = '[' + ' OR '.join("ipv4-addr:value = '{}'".format(ip) for ip in IPS) + ']'
+        unlimited = translation.translate('qradar:events', 'query', '{}', pattern, {'max_query_length': 0})
+        assert len(unlimited['queries']) == 1
+        result = translation.translate('qradar:events', 'query', '{}', pattern, {'max_query_length': 8000})
+        assert len(result['queries']) > 1
+        assert all(len(query) <= 8000 for query in result['queries'])
+        found = set(ip for query in result['queries'] for ip in re.findall(r"10\.0\.\d+\.\d+", query))
+        assert found == set(IPS)
+
+    def test_translate_within_max_set_size(self):
+        pattern = "[ipv4-addr:value IN ({})]".format(', '.join("'{}'".format(ip) for ip in IPS))
+        result = translation.translate('qradar:events', 'query', '{}', pattern, {'max_set_size': 250})
+        assert len(result['queries']) == 3
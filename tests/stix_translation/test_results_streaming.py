@@ -0,0 +1,68 @@
+import io
+import json
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter_utils.utils.ndjson import read_ndjson, write_ndjson
+
+translation = stix_translation.StixTranslation()
+
+DATA_SOURCE = '{"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "MySQL", ' \
+              '"identity_class": "events"}'
+RECORDS = [{"source_ipaddr": "10.0.0.{}".format(i), "dest_ipaddr": "10.0.1.1", "source_port": i} for i in range(5)]
+
+
+def object_types(objects):
+    return [stix_object['type'] for stix_object in objects]
+
+
+class TestResultsStreaming(object):
+
+    def test_stream_matches_bundle(self):
+        bundle = translation.translate('mysql', 'results', DATA_SOURCE, json.dumps(RECORDS), {})
+        objects = list(translation.translate_results_stream('mysql', DATA_SOURCE, json.dumps(RECORDS), {}))
+        assert object_types(objects) == object_types(bundle['objects'])
+        assert [stix_object.get('objects') for stix_object in objects[1:]] == \
+            [stix_object.get('objects') for stix_object in bundle['objects'][1:]]
+
+    def test_records_are_consumed_lazily(self):
+        consumed = []
+
+        def records():
+            for record in RECORDS:
+                consumed.append(record)
+                yield record
+
+        objects = translation.translate_results_stream('mysql', DATA_SOURCE, records(), {})
+        assert next(objects)['type'] == 'identity'
+        assert next(objects)['type'] == 'observed-data'
+        assert len(consumed) == 1
+        assert len(list(objects)) == len(RECORDS) - 1
+
+    def test_stix_21_cybox_objects_emitted_last(self):
+        records = RECORDS + RECORDS
+        objects = list(translation.translate_results_stream('mysql', DATA_SOURCE, records, {'stix_2.1': True}))
+        types = object_types(objects)
+        assert types[:len(records) + 1] == ['identity'] + ['observed-data'] * len(records)
+        cybox_objects = objects[len(records) + 1:]
+        assert cybox_objects and 'observed-data' not in object_types(cybox_objects)
+        assert len(set(stix_object['id'] for stix_object in cybox_objects)) == len(cybox_objects)
+
+    def test_module_translating_whole_result_set(self):
+        data = [{"sourceip": "10.0.0.1", "eventpayload": "x"}]
+        objects = list(translation.translate_results_stream('qradar', DATA_SOURCE, iter(data), {}))
+        assert object_types(objects) == ['identity', 'observed-data']
+
+    def test_ndjson_round_trip(self):
+        output = io.StringIO()
+        assert write_ndjson(iter(RECORDS), output) == len(RECORDS)
+        assert output.getvalue().count('\n') == len(RECORDS)
+        assert list(read_ndjson(io.StringIO(output.getvalue() + '\n'))) == RECORDS
+
+    def test_errors_yielded_as_error_response(self):
+        objects = list(translation.translate_results_stream('not_a_module', DATA_SOURCE, json.dumps(RECORDS), {}))
+        assert len(objects) == 1
+        assert objects[0]['success'] is False
+        assert 'not_a_module' in objects[0]['error']
+
+        objects = list(translation.translate_results_stream('mysql', DATA_SOURCE, '[{"source_ipaddr": ', {}))
+        assert len(objects) == 1
+        assert objects[0]['success'] is False
@@ -0,0 +1,39 @@
+import json
+import uuid
+from stix_shifter.stix_translation import stix_translation
+from stix_shifter_utils.stix_translation.src.json_to_stix.json_to_stix_translator import deterministic_id, \
+    sco_id_cache, UUID5_NAMESPACE
+
+translation = stix_translation.StixTranslation()
+
+DATA_SOURCE = {"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "MySQL",
+               "identity_class": "events"}
+
+
+def uuid5_id(cybox_type, cybox_properties):
+    return cybox_type + "--" + str(uuid.uuid5(uuid.UUID(UUID5_NAMESPACE), json.dumps(cybox_properties)))
+
+
+class TestScoIds(object):
+
+    def setup_method(self):
+        sco_id_cache.clear()
+
+    def test_id_computed_once_per_content(self):
+        properties = {"type": "file", "name": "a.exe", "hashes": {"MD5": "0" * 32}}
+        assert deterministic_id("file", properties) == uuid5_id("file", properties)
+        assert deterministic_id("file", dict(properties)) == uuid5_id("file", properties)
+        assert (sco_id_cache.misses, sco_id_cache.hits) == (1, 1)
+
+    def test_values_with_different_json_not_confused(self):
+        for value in (1, True, 1.0, "1", [1], {"a": 1}):
+            properties = {"type": "x-test", "value": value}
+            assert deterministic_id("x-test", properties) == uuid5_id("x-test", properties)
+
+    def test_recurring_objects_share_ids(self):
+        records = [{"source_ipaddr": "10.0.0.1", "dest_ipaddr": "10.0.1.{}".format(i % 2)} for i in range(10)]
+        result = translation.translate('mysql', 'results', DATA_SOURCE, records, {'stix_2.1': True})
+        addresses = [stix_object for stix_object in result['objects'] if stix_object['type'] == 'ipv4-addr']
+        assert len(addresses) == 3
+        assert addresses[0]['id'] == uuid5_id('ipv4-addr', {"type": "ipv4-addr", "value": "10.0.0.1"})
+        assert sco_id_cache.hits > 0
@@ -0,0 +1,72 @@
+import copy
+from stix_shifter_utils.stix_translation.src.json_to_stix import json_to_stix_translator
+from stix_shifter_utils.stix_translation.src.json_to_stix.to_stix_plan import get_plan
+from stix_shifter_utils.stix_translation.src.json_to_stix import observable
+from stix_shifter_utils.stix_translation.src.utils.transformer_utils import get_module_transformers
+
+TRANSFORMERS = get_module_transformers()
+DATA_SOURCE = {
+    "type": "identity",
+    "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3",
+    "name": "Test",
+    "identity_class": "events"
+}
+MAP_DATA = {
+    "src_ip": [
+        {"key": "ipv4-addr.value", "object": "src_ip"},
+        {"key": "network-traffic.src_ref", "object": "nt", "references": "src_ip"}
+    ],
+    "port": {"key": "network-traffic.src_port", "object": "nt", "transformer": "ToInteger"},
+    "connections": {
+        "ip": {"key": "ipv4-addr.value", "object": "conn_ip"}
+    },
+    "ips": [
+        {"key": "x-ips.name", "object": "ips", "value": "connections"},
+        {"key": "x-ips.ip_refs", "object": "ips", "references": "conn_ip", "unwrap": True}
+    ],
+    "count": {"key": "number_observed", "cybox": False, "transformer": "ToInteger"}
+}
+RECORD = {"src_ip": "10.0.0.1", "port": "80", "connections": [{"ip": "10.0.0.2"}, {"ip": "10.0.0.3"}], "ips": [1],
+          "count": "3"}
+
+
+def objects_by_type(observation):
+    result = {}
+    for cybox in observation['objects'].values():
+        result.setdefault(cybox['type'], []).append(cybox)
+    return result
+
+
+class TestToStixPlan(object):
+
+    def test_translation(self):
+        map_data = copy.deepcopy(MAP_DATA)
+        bundle = json_to_stix_translator.convert_to_stix(DATA_SOURCE, map_data, [RECORD], TRANSFORMERS, {})
+        observation = bundle['objects'][1]
+        objects = observation['objects']
+        by_type = objects_by_type(observation)
+        assert observation['number_observed'] == 3
+        assert by_type['network-traffic'][0]['src_port'] == 80
+        assert objects[by_type['network-traffic'][0]['src_ref']]['value'] == '10.0.0.1'
+        assert sorted(objects[ref]['value'] for ref in by_type['x-ips'][0]['ip_refs']) == ['10.0.0.2', '10.0.0.3']
+        assert map_data == MAP_DATA
+
+    def test_unwrapped_duplicate_items(self):
+        record = dict(RECORD, connections=[{"ip": "10.0.0.2"}, {"ip": "10.0.0.2"}, {"ip": "10.0.0.4"}])
+        bundle = json_to_stix_translator.convert_to_stix(DATA_SOURCE, MAP_DATA, [record, record], TRANSFORMERS, {})
+        for observation in bundle['objects'][1:]:
+            objects = observation['objects']
+            refs = objects_by_type(observation)['x-ips'][0]['ip_refs']
+            assert [objects[ref]['value'] for ref in refs] == ['10.0.0.2', '10.0.0.2', '10.0.0.4']
+
+    def test_plan_shared_across_pages(self):
+        map_data = copy.deepcopy(MAP_DATA)
+        plan = get_plan(map_data, TRANSFORMERS, observable.properties)
+        first = json_to_stix_translator.convert_to_stix(DATA_SOURCE, map_data, [RECORD], TRANSFORMERS, {})
+        compiled = len(plan._actions)
+        second = json_to_stix_translator.convert_to_stix(DATA_SOURCE, map_data, [RECORD, RECORD], TRANSFORMERS, {})
+        assert get_plan(map_data, TRANSFORMERS, observable.properties) is plan
+        assert objects_by_type(first['objects'][1]).keys() == objects_by_type(second['objects'][2]).keys()
+        # unwrapped list items share the actions of their definitions
+        assert len(plan._actions) == compiled
+        assert get_plan(copy.deepcopy(MAP_DATA), TRANSFORMERS, observable.properties) is not plan
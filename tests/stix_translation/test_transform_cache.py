@@ -0,0 +1,79 @@
+import pytest
+from stix_shifter_utils.stix_translation.src.json_to_stix import json_to_stix_translator
+from stix_shifter_utils.stix_translation.src.utils.transformers import ValueTransformer, ToInteger, ToString
+from stix_shifter_utils.stix_translation.src.utils.transformer_utils import get_module_transformers
+
+DATA_SOURCE = {"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "Test",
+               "identity_class": "events"}
+MAP_DATA = {
+    "port": {"key": "network-traffic.src_port", "object": "nt", "transformer": "CountedInteger"},
+    "name": {"key": "x-test.name", "object": "x", "transformer": "CountedString"},
+    "count": {"key": "number_observed", "cybox": False, "transformer": "ToInteger"}
+}
+calls = []
+
+
+class CountedInteger(ValueTransformer):
+    cacheable = True
+
+    @staticmethod
+    def transform(obj):
+        calls.append(obj)
+        return ToInteger.transform(obj)
+
+
+class CountedString(ValueTransformer):
+
+    @staticmethod
+    def transform(obj):
+        calls.append(obj)
+        return ToString.transform(obj)
+
+
+TRANSFORMERS = dict(get_module_transformers(), CountedInteger=CountedInteger, CountedString=CountedString)
+
+
+def translate(records):
+    del calls[:]
+    return json_to_stix_translator.convert_to_stix(DATA_SOURCE, MAP_DATA, records, TRANSFORMERS, {})
+
+
+class TestTransformCache(object):
+
+    def test_cacheable_transformer_called_once_per_value(self):
+        bundle = translate([{"port": "80"}, {"port": "80"}, {"port": "443"}, {"port": 80}])
+        assert calls == ["80", "443", 80]
+        assert [list(observation['objects'].values())[0]['src_port'] for observation in bundle['objects'][1:]] == \
+            [80, 80, 443, 80]
+
+    def test_not_cacheable_transformer_called_per_record(self):
+        translate([{"name": "a"}, {"name": "a"}])
+        assert calls == ["a", "a"]
+
+    def test_unhashable_values_transformed(self):
+        def length(value):
+            calls.append(value)
+            return len(value)
+        memoized = json_to_stix_translator._memoize_transform(length)
+        del calls[:]
+        assert [memoized(['a']), memoized(['a']), memoized('ab'), memoized('ab')] == [1, 1, 2, 2]
+        assert calls == [['a'], ['a'], 'ab']
+
+    def test_transformer_error_raised_once(self):
+        def fail(value):
+            calls.append(value)
+            raise TypeError('not a number')
+        memoized = json_to_stix_translator._memoize_transform(fail)
+        del calls[:]
+        with pytest.raises(TypeError):
+            memoized('a')
+        assert calls == ['a']
+
+    def test_cache_is_per_translation(self):
+        translate([{"port": "80"}])
+        translate([{"port": "80"}])
+        assert calls == ["80"]
+
+    def test_builtin_transformers(self):
+        assert ToInteger.cacheable and ToInteger.transform("12.5") == 12
+        assert not ValueTransformer.cacheable
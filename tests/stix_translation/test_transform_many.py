@@ -0,0 +1,85 @@
+from stix_shifter_utils.stix_translation.src.json_to_stix import json_to_stix_translator
+from stix_shifter_utils.stix_translation.src.utils.transformers import ValueTransformer, ToInteger, EpochToTimestamp, \
+    EpochSecondsToTimestamp, TimestampToMilliseconds
+from stix_shifter_utils.stix_translation.src.utils.transformer_utils import get_module_transformers
+
+DATA_SOURCE = {"type": "identity", "id": "identity--3532c56d-ea72-48be-a2ad-1a53f4c9c6d3", "name": "Test",
+               "identity_class": "events"}
+MAP_DATA = {
+    "port": {"key": "network-traffic.src_port", "object": "nt", "transformer": "BatchedInteger"},
+    "dport": {"key": "network-traffic.dst_port", "object": "nt", "transformer": "BatchedInteger"},
+    "start": {"key": "first_observed", "cybox": False, "transformer": "EpochToTimestamp"}
+}
+batches = []
+calls = []
+
+
+class BatchedInteger(ValueTransformer):
+    cacheable = True
+
+    @staticmethod
+    def transform(obj):
+        calls.append(obj)
+        return ToInteger.transform(obj)
+
+    @classmethod
+    def transform_many(cls, values):
+        batches.append(values)
+        return [ToInteger.transform(value) for value in values]
+
+
+TRANSFORMERS = dict(get_module_transformers(), BatchedInteger=BatchedInteger)
+
+
+def translate(records, columns=None):
+    del batches[:]
+    del calls[:]
+    if columns:
+        return json_to_stix_translator.convert_columns_to_stix(DATA_SOURCE, MAP_DATA, columns, records, TRANSFORMERS,
+                                                               {})
+    return json_to_stix_translator.convert_to_stix(DATA_SOURCE, MAP_DATA, records, TRANSFORMERS, {})
+
+
+def network_traffic(bundle):
+    return [list(observation['objects'].values())[0] for observation in bundle['objects'][1:]]
+
+
+class TestTransformMany(object):
+
+    def test_default_transforms_each_value(self):
+        assert ToInteger.transform_many(["1", "2.5", 3]) == [1, 2, 3]
+
+    def test_page_transformed_once_per_transformer(self):
+        bundle = translate([{"port": "80", "dport": "443"}, {"port": "80", "dport": 8080},
+                            {"port": "", "dport": "443"}])
+        assert len(batches) == 1
+        assert sorted(batches[0], key=str) == sorted(["80", "443", 8080], key=str)
+        assert calls == []
+        assert network_traffic(bundle) == [{'type': 'network-traffic', 'src_port': 80, 'dst_port': 443},
+                                           {'type': 'network-traffic', 'src_port': 80, 'dst_port': 8080},
+                                           {'type': 'network-traffic', 'dst_port': 443}]
+
+    def test_columns_transformed_once_per_transformer(self):
+        bundle = translate([("80", "443"), ("81", "443")], columns=["port", "dport"])
+        assert len(batches) == 1 and calls == []
+        assert [objects['src_port'] for objects in network_traffic(bundle)] == [80, 81]
+
+    def test_epoch_batch_matches_transform(self):
+        epochs = [1600000000123, "1600000000999", 0, 1, 8589934591999, 8589934592000, 253402300799999,
+                  -1000, 1.6e12, "1.6e12", "abc"]
+        assert EpochToTimestamp.transform_many(epochs) == [EpochToTimestamp.transform(epoch) for epoch in epochs]
+        translated = translate([{"start": epoch} for epoch in epochs[:2]])
+        assert [observation['first_observed'] for observation in translated['objects'][1:]] == \
+            [EpochToTimestamp.transform(epoch) for epoch in epochs[:2]]
+
+    def test_epoch_seconds_batch_matches_transform(self):
+        epochs = [1600000000, "1600000001", 0, 253402300799, -1, "x"]
+        assert EpochSecondsToTimestamp.transform_many(epochs) == \
+            [EpochSecondsToTimestamp.transform(epoch) for epoch in epochs]
+
+    def test_timestamp_batch_matches_transform(self):
+        timestamps = ["2020-09-13T12:26:40.123Z", "2020-09-13T12:26:40.1Z", "1970-01-01T00:00:00.000Z",
+                      "1969-12-31T23:59:59.999Z", "2020-09-13T12:26:40.000001Z", "9999-12-31T23:59:59.999Z",
+                      "2020-02-30T00:00:00.000Z", "2020-09-13T12:26:40Z"]
+        assert TimestampToMilliseconds.transform_many(timestamps) == \
+            [TimestampToMilliseconds.transform(timestamp) for timestamp in timestamps]
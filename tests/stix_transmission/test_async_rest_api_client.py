@@ -0,0 +1,120 @@
+import asyncio
+import http.server
+import threading
+import time
+import pytest
+from stix_shifter_utils.stix_transmission.utils import AsyncRestApiClient
+from stix_shifter_utils.utils.async_utils import run_sync
+
+aiohttp = pytest.importorskip('aiohttp')
+
+
+class CountingServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+        self.requests = []
+
+    def get_request(self):
+        self.connections += 1
+        return super().get_request()
+
+
+class CountingHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def respond(self):
+        length = int(self.headers.get('Content-Length', 0))
+        self.server.requests.append((self.command, self.path, self.headers.get('Cookie'), self.rfile.read(length)))
+        if self.path == '/api/slow':
+            time.sleep(3)
+        if self.path == '/api/wait':
+            time.sleep(0.5)
+        body = b'{}'
+        self.send_response(503 if self.path == '/api/unavailable' else 200)
+        self.send_header('Set-Cookie', 'session=secret')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = CountingServer(('127.0.0.1', 0), CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def http_client(server, **kwargs):
+    return AsyncRestApiClient.AsyncRestApiClient('127.0.0.1', server.server_address[1], cert_verify=False,
+                                                 url_modifier_function=lambda host_port, endpoint, headers:
+                                                 'http://{}/{}'.format(host_port, endpoint), **kwargs)
+
+
+class TestAsyncRestApiClient(object):
+
+    def test_connection_kept_alive(self, server):
+        async def calls():
+            for client in (http_client(server), http_client(server)):
+                assert (await client.call_api('api/results', 'GET', timeout=5)).code == 200
+                assert (await client.call_api('api/results', 'GET', timeout=5)).code == 200
+
+        run_sync(calls())
+        assert server.connections == 1
+        assert [cookie for _, _, cookie, _ in server.requests] == [None] * 4
+
+    def test_concurrent_calls(self, server):
+        client = http_client(server, pool_size=20)
+
+        async def calls():
+            return await asyncio.gather(*[client.call_api('api/wait', 'GET', timeout=5) for _ in range(20)])
+
+        start = time.monotonic()
+        responses = run_sync(calls())
+        assert time.monotonic() - start < 5
+        assert [response.read() for response in responses] == [b'{}'] * 20
+
+    def test_timeout(self, server):
+        start = time.monotonic()
+        with pytest.raises(Exception, match=r'timeout_error \(1 sec\)'):
+            run_sync(http_client(server).call_api('api/slow', 'GET', timeout=1))
+        assert time.monotonic() - start < 2
+
+    def test_request(self, server):
+        response = run_sync(http_client(server).call_api('api/search', 'POST', data={'query': 'a b', 'empty': None},
+                                                         urldata={'limit': 10, 'offset': None}, timeout=5))
+        assert response.code == 200 and response.headers['content-length'] == '2'
+        assert server.requests == [('POST', '/api/search?limit=10', None, b'query=a+b')]
+
+    def test_retry_idempotent_methods(self, server, monkeypatch):
+        monkeypatch.setenv('STIXSHIFTER_RETRY_MAX', '2')
+        with pytest.raises(Exception, match='Max retries exceeded'):
+            run_sync(http_client(server).call_api('api/unavailable', 'GET', timeout=5))
+        assert len(server.requests) == 3
+        response = run_sync(http_client(server).call_api('api/unavailable', 'POST', timeout=5))
+        assert response.code == 503 and len(server.requests) == 4
+
+    def test_connect_retry_backoff(self, server, monkeypatch):
+        monkeypatch.setenv('STIXSHIFTER_RETRY_MAX', '3')
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+        monkeypatch.setattr(AsyncRestApiClient.asyncio, 'sleep', sleep)
+        client = http_client(server)
+        server.shutdown()
+        server.server_close()
+        with pytest.raises(aiohttp.ClientConnectorError):
+            run_sync(client.call_api('api/search', 'GET', timeout=5))
+        assert delays == [0.5, 1, 2]
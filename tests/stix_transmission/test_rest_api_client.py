@@ -0,0 +1,177 @@
+import datetime
+import glob
+import http.server
+import socketserver
+import ssl
+import threading
+import time
+import pytest
+from stix_shifter_utils.stix_transmission.utils import RestApiClient
+
+try:
+    # only needed by the self-signed certificate tests
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+except ImportError:
+    x509 = None
+
+
+class CookieServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    # http.server.ThreadingHTTPServer is not available on Python 3.6
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+        self.cookies = []
+
+    def get_request(self):
+        self.connections += 1
+        return super().get_request()
+
+
+class CookieHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.cookies.append(self.headers.get('Cookie'))
+        if self.path == '/api/slow':
+            time.sleep(3)
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Set-Cookie', 'session=secret')
+        self.send_header('Content-Length', str(len(body) * 10 if self.path == '/api/drip' else len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path == '/api/drip':
+            # the body is sent slower than the client waits for it in total
+            for _ in range(9):
+                time.sleep(0.4)
+                self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = CookieServer(('127.0.0.1', 0), CookieHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    RestApiClient.close_sessions()
+    yield server
+    RestApiClient.close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def self_signed_certificate(tmp_path, host_name):
+    if x509 is None:
+        pytest.skip('cryptography is not installed')
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, host_name)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key()) \
+        .serial_number(x509.random_serial_number()).not_valid_before(now - datetime.timedelta(days=1)) \
+        .not_valid_after(now + datetime.timedelta(days=1)) \
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName(host_name)]), critical=False) \
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True) \
+        .sign(key, hashes.SHA256())
+    cert_file = tmp_path / 'cert.pem'
+    key_file = tmp_path / 'key.pem'
+    cert_file.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                           serialization.NoEncryption()))
+    return str(cert_file), str(key_file)
+
+
+@pytest.fixture
+def https_server(tmp_path):
+    cert_file, key_file = self_signed_certificate(tmp_path, 'datasource.example')
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+    server = CookieServer(('127.0.0.1', 0), CookieHandler)
+    server.daemon_threads = True
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    server.cert = open(cert_file).read()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    RestApiClient.close_sessions()
+    yield server
+    RestApiClient.close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def http_client(server, **kwargs):
+    return RestApiClient.RestApiClient('127.0.0.1', server.server_address[1], cert_verify=False,
+                                       url_modifier_function=lambda host_port, endpoint, headers:
+                                       'http://{}/{}'.format(host_port, endpoint), **kwargs)
+
+
+class TestRestApiClient(object):
+
+    def test_clients_of_a_server_share_a_session(self, tmp_path):
+        cert_file, _ = self_signed_certificate(tmp_path, 'host')
+        session = RestApiClient.get_session('host:443', True, None, 10, 1)
+        assert RestApiClient.get_session('host:443', True, None, 10, 1) is session
+        assert RestApiClient.get_session('host:443', True, 'sni', 10, 1) is not session
+        assert RestApiClient.get_session('host:443', open(cert_file).read(), None, 10, 1) is not session
+        RestApiClient.close_sessions()
+        assert RestApiClient.get_session('host:443', True, None, 10, 1) is not session
+
+    def test_connection_kept_alive(self, server):
+        for client in (http_client(server), http_client(server)):
+            assert client.call_api('api/results', 'GET', timeout=5).code == 200
+            assert client.call_api('api/results', 'GET', timeout=5).code == 200
+        assert server.connections == 1
+
+    def test_cookies_not_shared(self, server):
+        http_client(server).call_api('api/login', 'GET', timeout=5)
+        http_client(server).call_api('api/results', 'GET', timeout=5)
+        assert server.cookies == [None, None]
+
+    def test_pool_size(self, server, monkeypatch):
+        assert http_client(server, pool_size=3).pool_size == 3
+        monkeypatch.setenv('STIXSHIFTER_CONNECTION_POOL_SIZE', '4')
+        assert http_client(server).pool_size == 4
+
+    @pytest.mark.parametrize('endpoint', ['api/slow', 'api/drip'])
+    def test_timeout_without_thread(self, server, endpoint):
+        threads = threading.active_count()
+        start = time.monotonic()
+        with pytest.raises(Exception, match=r'timeout_error \(1 sec\)'):
+            http_client(server).call_api(endpoint, 'GET', timeout=1)
+        assert time.monotonic() - start < 2
+        assert threading.active_count() <= threads + 1  # the server thread answering
+
+    def test_body_read_before_timeout(self, server):
+        assert http_client(server).call_api('api/drip', 'GET', timeout=10).read() == b'{}' * 10
+
+    def test_self_signed_certificate_with_sni(self, https_server):
+        cert_files = glob.glob('/tmp/*-server_cert.pem')
+        client = RestApiClient.RestApiClient('127.0.0.1', https_server.server_address[1],
+                                             cert_verify=https_server.cert, sni='datasource.example')
+        assert client.call_api('api/results', 'GET', timeout=5).code == 200
+        assert client.call_api('api/results', 'GET', timeout=5).code == 200
+        assert https_server.connections == 1
+        assert glob.glob('/tmp/*-server_cert.pem') == cert_files
+
+    def test_self_signed_certificate_host_name(self, https_server):
+        client = RestApiClient.RestApiClient('127.0.0.1', https_server.server_address[1], cert_verify=https_server.cert)
+        with pytest.raises(Exception, match="doesn't match|not valid for"):
+            client.call_api('api/results', 'GET', timeout=5)
+
+    def test_ssl_context_built_once(self, https_server):
+        session = RestApiClient.get_session('host:443', https_server.cert, None, 10, 1)
+        context = session.get_adapter('https://host:443').ssl_context
+        assert RestApiClient.get_session('host:443', https_server.cert, None, 10, 1) is session
+        assert RestApiClient.get_session('host:443', https_server.cert, 'sni', 10, 1) \
+            .get_adapter('https://host:443').ssl_context is not context
+        assert RestApiClient.get_session('host:443', True, None, 10, 1).get_adapter('https://host:443') \
+            .ssl_context is None
+        # only the self signed certificate is trusted
+        assert len(context.get_ca_certs()) == 1
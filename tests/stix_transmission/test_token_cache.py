@@ -0,0 +1,154 @@
+import os
+import stat
+import threading
+import time
+import pytest
+from stix_shifter_utils.utils import token_cache
+from stix_shifter_utils.utils.token_cache import TokenCache, FileTokenStore, MemoryTokenStore, get_token_cache, \
+    set_token_cache
+
+CREDENTIALS = {'clientId': 'id', 'clientSecret': 'secret'}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(token_cache.time, 'time', clock.time)
+    return clock
+
+
+def fetcher(lifetime=3600):
+    tokens = []
+
+    def fetch():
+        tokens.append('token{}'.format(len(tokens)))
+        return tokens[-1], lifetime
+    fetch.tokens = tokens
+    return fetch
+
+
+class TestTokenCache(object):
+
+    def test_token_cached_until_refresh(self, clock):
+        cache = TokenCache(refresh_ahead=60)
+        fetch = fetcher()
+        assert cache.get_token('msatp', 'host', CREDENTIALS, fetch) == 'token0'
+        clock.now += 3539
+        assert cache.get_token('msatp', 'host', dict(CREDENTIALS), fetch) == 'token0'
+        clock.now += 1
+        assert cache.get_token('msatp', 'host', CREDENTIALS, fetch) == 'token1'
+        assert fetch.tokens == ['token0', 'token1']
+
+    def test_tokens_by_module_host_and_credentials(self, clock):
+        cache = TokenCache()
+        fetch = fetcher()
+        cache.get_token('msatp', 'host', CREDENTIALS, fetch)
+        cache.get_token('azure_sentinel', 'host', CREDENTIALS, fetch)
+        cache.get_token('msatp', 'other', CREDENTIALS, fetch)
+        cache.get_token('msatp', 'host', dict(CREDENTIALS, clientSecret='other'), fetch)
+        assert len(fetch.tokens) == 4
+        assert 'secret' not in token_cache.token_key('msatp', 'host', CREDENTIALS)
+
+    def test_short_lifetime_and_no_lifetime(self, clock):
+        cache = TokenCache(refresh_ahead=60)
+        fetch = fetcher(lifetime=30)
+        cache.get_token('msatp', 'host', CREDENTIALS, fetch)
+        clock.now += 14
+        cache.get_token('msatp', 'host', CREDENTIALS, fetch)
+        assert len(fetch.tokens) == 1
+        fetch = fetcher(lifetime=None)
+        cache.get_token('arcsight', 'host', CREDENTIALS, fetch)
+        cache.get_token('arcsight', 'host', CREDENTIALS, fetch)
+        assert len(fetch.tokens) == 2
+
+    def test_failed_fetch(self, clock):
+        cache = TokenCache(refresh_ahead=60)
+
+        def fail():
+            raise Exception('authentication failed')
+        with pytest.raises(Exception, match='authentication failed'):
+            cache.get_token('msatp', 'host', CREDENTIALS, fail)
+        fetch = fetcher()
+        assert cache.get_token('msatp', 'host', CREDENTIALS, fetch) == 'token0'
+        # the token still valid is used when its refresh fails
+        clock.now += 3590
+        assert cache.get_token('msatp', 'host', CREDENTIALS, fail) == 'token0'
+        clock.now += 10
+        with pytest.raises(Exception, match='authentication failed'):
+            cache.get_token('msatp', 'host', CREDENTIALS, fail)
+
+    def test_invalidate(self, clock):
+        cache = TokenCache()
+        fetch = fetcher()
+        cache.get_token('msatp', 'host', CREDENTIALS, fetch)
+        cache.invalidate('msatp', 'host', CREDENTIALS)
+        assert cache.get_token('msatp', 'host', CREDENTIALS, fetch) == 'token1'
+        # a token rejected after another caller replaced it
+        cache.invalidate('msatp', 'host', CREDENTIALS, token='token0')
+        assert cache.get_token('msatp', 'host', CREDENTIALS, fetch) == 'token1'
+        cache.invalidate('msatp', 'host', CREDENTIALS, token='token1')
+        assert cache.get_token('msatp', 'host', CREDENTIALS, fetch) == 'token2'
+
+    @pytest.mark.parametrize('expired', [True, False])
+    def test_single_flight(self, expired, clock):
+        cache = TokenCache(refresh_ahead=60)
+        if not expired:
+            cache.get_token('msatp', 'host', CREDENTIALS, lambda: ('old', 3600))
+            clock.now += 3550
+        calls = []
+
+        def slow_fetch():
+            calls.append(None)
+            time.sleep(0.5)
+            return 'new', 3600
+
+        tokens = []
+        threads = [threading.Thread(target=lambda: tokens.append(cache.get_token('msatp', 'host', CREDENTIALS,
+                                                                                  slow_fetch)))
+                   for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        if expired:
+            assert tokens == ['new'] * 10
+        else:
+            # the other callers did not wait for the refresh of a token still valid
+            assert tokens.count('old') == 9 and tokens[-1] == 'new'
+
+    def test_file_store_shared(self, tmp_path, clock):
+        fetch = fetcher()
+        first = TokenCache(FileTokenStore(str(tmp_path)))
+        second = TokenCache(FileTokenStore(str(tmp_path)))
+        assert first.get_token('msatp', 'host', CREDENTIALS, fetch) == 'token0'
+        assert second.get_token('msatp', 'host', CREDENTIALS, fetch) == 'token0'
+        assert len(fetch.tokens) == 1
+        for name in os.listdir(str(tmp_path)):
+            assert 'secret' not in name
+            assert stat.S_IMODE(os.stat(os.path.join(str(tmp_path), name)).st_mode) & 0o077 == 0
+
+    def test_file_store_directory_restricted(self, tmp_path, monkeypatch):
+        directory = str(tmp_path / 'tokens')
+        os.mkdir(directory, 0o755)
+        os.chmod(directory, 0o755)
+        FileTokenStore(directory)
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+        monkeypatch.setattr(token_cache.os, 'getuid', lambda: os.stat(directory).st_uid + 1, raising=False)
+        with pytest.raises(PermissionError):
+            FileTokenStore(directory)
+
+    def test_default_cache(self, tmp_path, monkeypatch):
+        assert isinstance(get_token_cache().store, MemoryTokenStore)
+        assert get_token_cache() is get_token_cache()
+        set_token_cache(None)
+        monkeypatch.setenv('STIXSHIFTER_TOKEN_CACHE_DIR', str(tmp_path))
+        assert isinstance(get_token_cache().store, FileTokenStore)